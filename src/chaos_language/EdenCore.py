@@ -1,7 +1,12 @@
 import os
+import sys
 
 from .chaos_agent import ChaosAgent
 
+# Legacy Windows consoles ignore ANSI escapes; everything else can clear in-process
+ANSI_CLEAR = "\x1b[2J\x1b[H"
+SUPPORTS_ANSI = os.name != "nt" or bool(os.environ.get("WT_SESSION") or os.environ.get("TERM"))
+
 
 class EdenCore:
     def __init__(self, agent_name: str = "Concord"):
@@ -9,7 +14,11 @@ class EdenCore:
         self.agent = ChaosAgent(agent_name)
 
     def clear_screen(self):
-        os.system("cls" if os.name == "nt" else "clear")
+        if SUPPORTS_ANSI:
+            sys.stdout.write(ANSI_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system("cls")
 
     def _print_banner(self):
         print(
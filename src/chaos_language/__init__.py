@@ -5,17 +5,61 @@ language for organizations that want to capture structured telemetry, emotional
 signals, and qualitative story fragments in a single artifact.
 """
 
-from .chaos_lexer import ChaosLexer, TokenType, Token
-from .chaos_parser import ChaosParser
-from .chaos_interpreter import ChaosInterpreter
-from .chaos_runtime import run_chaos
-from .chaos_validator import validate_chaos
-from .chaos_agent import ChaosAgent
-from .chaos_reports import generate_business_report, render_report_lines
-from .chaos_emergence import EmergenceManager, EmergenceProtocolOutcome, EmergenceSignal, PartCard
-from .chaos_emotion import ChaosEmotionStack
-from .chaos_context import ChaosContext
-from .chaos_errors import ChaosError, ChaosSyntaxError, ChaosValidationError
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .chaos_lexer import ChaosLexer, TokenType, Token
+    from .chaos_parser import ChaosParser
+    from .chaos_interpreter import ChaosInterpreter
+    from .chaos_runtime import run_ast, run_chaos
+    from .chaos_validator import validate_ast, validate_chaos
+    from .chaos_agent import ChaosAgent
+    from .chaos_reports import generate_business_report, render_report_lines
+    from .chaos_emergence import EmergenceManager, EmergenceProtocolOutcome, EmergenceSignal, PartCard
+    from .chaos_emotion import ChaosEmotionStack
+    from .chaos_context import ChaosContext
+    from .chaos_errors import ChaosError, ChaosSyntaxError, ChaosValidationError
+
+# Public names and the submodule defining each, imported on first access so
+# the CLIs can parse --help without loading the whole runtime.
+_EXPORTS = {
+    "ChaosLexer": ".chaos_lexer",
+    "TokenType": ".chaos_lexer",
+    "Token": ".chaos_lexer",
+    "ChaosParser": ".chaos_parser",
+    "ChaosInterpreter": ".chaos_interpreter",
+    "run_chaos": ".chaos_runtime",
+    "run_ast": ".chaos_runtime",
+    "validate_chaos": ".chaos_validator",
+    "validate_ast": ".chaos_validator",
+    "ChaosAgent": ".chaos_agent",
+    "generate_business_report": ".chaos_reports",
+    "render_report_lines": ".chaos_reports",
+    "EmergenceManager": ".chaos_emergence",
+    "EmergenceProtocolOutcome": ".chaos_emergence",
+    "EmergenceSignal": ".chaos_emergence",
+    "PartCard": ".chaos_emergence",
+    "ChaosEmotionStack": ".chaos_emotion",
+    "ChaosContext": ".chaos_context",
+    "ChaosError": ".chaos_errors",
+    "ChaosSyntaxError": ".chaos_errors",
+    "ChaosValidationError": ".chaos_errors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __version__ = "0.1.0"
 
@@ -26,7 +70,9 @@ __all__ = [
     "ChaosParser",
     "ChaosInterpreter",
     "run_chaos",
+    "run_ast",
     "validate_chaos",
+    "validate_ast",
     "ChaosAgent",
     "generate_business_report",
     "render_report_lines",
@@ -51,31 +51,40 @@ class ChaosAgent:
         structured_core = env.get("structured_core", {})
         emotive_layer = env.get("emotive_layer", [])
         chaosfield_layer = env.get("chaosfield_layer", "")
-        for key, value in structured_core.items():
-            symbol_key = norm_key(key)
-            self.ctx.set_symbol(symbol_key, value)
-            self.log.log(f"symbol {symbol_key}={value}")
-        for entry in emotive_layer:
-            name = norm_key(entry.get("type") or entry.get("name") or "FEELING")
-            raw = entry.get("intensity")
-            intensity = soft_intensity(raw)
-            self.emotions.push(name, intensity)
-            self.log.log(f"emotion {name}:{intensity}")
+        # Each layer is merged in one batch and logged as one line
+        if structured_core:
+            symbols = {norm_key(key): value for key, value in structured_core.items()}
+            self.ctx.set_symbols(symbols)
+            self.log.log("symbols " + ", ".join(f"{key}={value}" for key, value in symbols.items()))
+        if emotive_layer:
+            feelings = [
+                (
+                    norm_key(entry.get("type") or entry.get("name") or "FEELING"),
+                    soft_intensity(entry.get("intensity")),
+                )
+                for entry in emotive_layer
+            ]
+            self.emotions.push_many(feelings)
+            self.log.log("emotions " + ", ".join(f"{name}:{intensity}" for name, intensity in feelings))
         if chaosfield_layer:
             self.ctx.set_narrative(chaosfield_layer)
             self.log.log(f"narrative {text_snippet(chaosfield_layer)}")
 
-    def reflect(self) -> List[str]:
+    def reflect(self, emotions_snapshot: Optional[List[Dict[str, Any]]] = None) -> List[str]:
         memory = self.ctx.get()
-        emotions_snapshot = self._emotion_snapshot()
-        visions = self.dreams.visions(memory["symbols"], emotions_snapshot, memory["narrative"])
+        if emotions_snapshot is None:
+            emotions_snapshot = self._emotion_snapshot()
+        visions = self.dreams.visions(
+            memory["symbols"], emotions_snapshot, memory["narrative"], keys=self.ctx.symbol_keys()
+        )
         for vision in visions:
             self.log.log(f"dream {text_snippet(vision)}")
         return visions
 
-    def decide(self) -> Optional[Action]:
+    def decide(self, emotions_snapshot: Optional[List[Dict[str, Any]]] = None) -> Optional[Action]:
         memory = self.ctx.get()
-        emotions_snapshot = self._emotion_snapshot()
+        if emotions_snapshot is None:
+            emotions_snapshot = self._emotion_snapshot()
         choice = self.protocols.evaluate(memory, emotions_snapshot)
         if not choice:
             self.log.log("idle")
@@ -88,7 +97,7 @@ class ChaosAgent:
             return
         self.log.log(f"act {action.kind} {action.payload}")
         if action.kind == "relate":
-            symbols = list(self.ctx.get()["symbols"].keys())
+            symbols = self.ctx.symbol_keys()
             for index in range(len(symbols) - 1):
                 self.graph.add_edge(symbols[index], symbols[index + 1])
 
@@ -100,8 +109,10 @@ class ChaosAgent:
             self.perceive_text(text)
         if sn:
             self.perceive_sn(sn)
-        dreams = self.reflect()
-        action = self.decide()
+        # Nothing touches the emotion stack between reflecting and deciding
+        emotions_snapshot = self._emotion_snapshot()
+        dreams = self.reflect(emotions_snapshot)
+        action = self.decide(emotions_snapshot)
         self.act(action)
         self.tick()
         memory = self.ctx.get()
@@ -1,6 +1,7 @@
 """
 Shared memory for symbols, emotions, narrative.
 """
+from typing import Any, Dict, List, Optional, Union
 
 
 class ChaosContext:
@@ -10,18 +11,60 @@ class ChaosContext:
             "emotions": [],
             "narrative": "",
         }
+        self._version = 0  # Bumped on every write so readers can cache derived data
+        self._symbol_keys: List[str] = []  # Symbol names in insertion order
+        self._emotion_index: Dict[str, int] = {}  # Emotion name -> position in memory["emotions"]
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def set_symbol(self, key: str, value: str) -> None:
-        self.memory["symbols"][key] = value
+        symbols = self.memory["symbols"]
+        if key not in symbols:
+            self._symbol_keys.append(key)
+        symbols[key] = value
+        self._version += 1
+
+    def set_symbols(self, symbols: Dict[str, Any]) -> None:
+        """Merge many symbols with one dict update and a single version bump."""
+        current = self.memory["symbols"]
+        self._symbol_keys.extend(key for key in symbols if key not in current)
+        current.update(symbols)
+        self._version += 1
+
+    def symbol_keys(self) -> List[str]:
+        """Unique symbol names in insertion order; kept up to date on every write."""
+        return self._symbol_keys
+
+    def add_emotion(self, emotion: Union[str, Dict[str, Any]]) -> None:
+        """Record an emotion; ``{"name", "intensity"}`` entries merge by name."""
+        emotions = self.memory["emotions"]
+        name = emotion.get("name") if isinstance(emotion, dict) else None
+        if name is None:
+            emotions.append(emotion)
+        elif name in self._emotion_index:
+            emotions[self._emotion_index[name]] = emotion
+        else:
+            self._emotion_index[name] = len(emotions)
+            emotions.append(emotion)
+        self._version += 1
 
-    def add_emotion(self, emotion: str) -> None:
-        self.memory["emotions"].append(emotion)
+    def emotion_intensity(self, name: str) -> Optional[int]:
+        index = self._emotion_index.get(name)
+        return None if index is None else self.memory["emotions"][index].get("intensity")
 
     def set_narrative(self, text: str) -> None:
         self.memory["narrative"] = text
+        self._version += 1
 
     def get(self):  # type: ignore[override]
         return self.memory
 
     def reset(self) -> None:
-        self.__init__()
+        self.memory["symbols"].clear()
+        self.memory["emotions"].clear()
+        self.memory["narrative"] = ""
+        self._symbol_keys.clear()
+        self._emotion_index.clear()
+        self._version += 1
@@ -12,8 +12,8 @@ This script creates:
 """
 
 import os, sys, time, json, getpass, shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from string import Template
 
 USERNAME = getpass.getuser()
 EDEN_ROOT = Path(fr"C:\EdenOS_{USERNAME}")
@@ -31,106 +31,144 @@ def ensure_dirs():
 # -----------------------------
 # Autoloop watcher
 # -----------------------------
-def write_autoloop():
-    path = EDEN_ROOT / "eden_loop.py"
-    dropbox_path = str(DROPBOX)
-    structured_core_setup = "        structured_core = env.get('structured_core', {})"
-    emotive_setup = "        emotive_layer = env.get('emotive_layer', [])"
-    chaosfield_setup = "\n".join(
-        [
-            "        raw_chaosfield = env.get('chaosfield_layer', '')",
-            "        chaosfield_preview = raw_chaosfield[:120]",
-            "        chaosfield_display = chaosfield_preview + ('...' if len(raw_chaosfield) > 120 else '')",
-        ]
-    )
-    structured_core_line = "        print(f\"Symbols: {structured_core}\")"
-    emotive_line = "        print(f\"Emotions: {emotive_layer}\")"
-    chaosfield_line = "        print(f\"Narrative: {chaosfield_display}\")"
-
-    script_template = Template(
-        """# eden_loop.py
+_LOOP_TEMPLATE = r"""# eden_loop.py
 import os, sys, time, json
 from pathlib import Path
 
 # Point Python at your CHAOS runtime
-sys.path.append(r"C:\\EdenOS_Origin\\05_CHAOS_Coding_Language")
+sys.path.append(r"C:\EdenOS_Origin\05_CHAOS_Coding_Language")
 
 from chaos_runtime import run_chaos
 
-WATCH_DIR = Path(r"$dropbox_path")
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Fall back to polling when watchdog isn't installed
+    Observer = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+WATCH_DIR = Path(r"__DROPBOX__")
 LOG_DIR = WATCH_DIR / "logs"
 CHECK_INTERVAL = 5
+SUFFIXES = (".chaos", ".sn")
 
 WATCH_DIR.mkdir(exist_ok=True, parents=True)
 LOG_DIR.mkdir(exist_ok=True)
 
+def write_result(env, out_file: Path):
+    if orjson is not None:
+        out_file.write_bytes(orjson.dumps(env, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_file, "w", encoding="utf-8") as out:
+            json.dump(env, out, indent=2)
+
 def process_file(path: Path):
     try:
         with open(path, "r", encoding="utf-8") as f:
             src = f.read()
         env = run_chaos(src, verbose=False)
-$structured_core_setup
-$emotive_setup
-$chaosfield_setup
+        structured_core = env.get('structured_core', {})
+        emotive_layer = env.get('emotive_layer', [])
+        raw_chaosfield = env.get('chaosfield_layer', '')
+        chaosfield_preview = raw_chaosfield[:120]
+        chaosfield_display = chaosfield_preview + ('...' if len(raw_chaosfield) > 120 else '')
         out_file = LOG_DIR / f"{path.stem}_result.json"
-        with open(out_file, "w", encoding="utf-8") as out:
-            json.dump(env, out, indent=2)
+        write_result(env, out_file)
         print("\n=== Eden Report ===")
         print(f"File: {path.name}")
-$structured_core_line
-$emotive_line
-$chaosfield_line
+        print(f"Symbols: {structured_core}")
+        print(f"Emotions: {emotive_layer}")
+        print(f"Narrative: {chaosfield_display}")
         print("===================\n")
     except Exception as e:
         print(f"[ERROR] {path.name}: {e}")
 
-def main():
-    seen = {}
-    print(f"Watching {WATCH_DIR.resolve()} ... drop or edit .chaos/.sn files here.")
-    while True:
-        for file in list(WATCH_DIR.glob("*.chaos")) + list(WATCH_DIR.glob("*.sn")):
+def process_if_changed(path: str, mtime: float, seen: dict):
+    if seen.get(path) != mtime:
+        process_file(Path(path))
+        seen[path] = mtime
+
+def scan(seen: dict):
+    # One directory pass; DirEntry caches what the listing already returned
+    with os.scandir(WATCH_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(SUFFIXES):
+                continue
             try:
-                mtime = file.stat().st_mtime
-                if file not in seen or seen[file] != mtime:
-                    process_file(file)
-                    seen[file] = mtime
+                mtime = entry.stat().st_mtime
             except FileNotFoundError:
-                if file in seen: del seen[file]
+                seen.pop(entry.path, None)
+                continue
+            process_if_changed(entry.path, mtime, seen)
+
+def watch_events(seen: dict):
+    class DropboxHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            self.handle(event.src_path, event.is_directory)
+
+        def on_modified(self, event):
+            self.handle(event.src_path, event.is_directory)
+
+        def on_moved(self, event):
+            self.handle(event.dest_path, event.is_directory)
+
+        def handle(self, src_path, is_directory):
+            if is_directory or not src_path.endswith(SUFFIXES):
+                return
+            try:
+                mtime = os.stat(src_path).st_mtime
+            except FileNotFoundError:
+                seen.pop(src_path, None)
+                return
+            process_if_changed(src_path, mtime, seen)
+
+    observer = Observer()
+    observer.schedule(DropboxHandler(), str(WATCH_DIR), recursive=False)
+    observer.start()
+    try:
+        while observer.is_alive():
+            observer.join(1)
+    finally:
+        observer.stop()
+        observer.join()
+
+def watch_polling(seen: dict):
+    while True:
         time.sleep(CHECK_INTERVAL)
+        scan(seen)
+
+def main():
+    seen = {}
+    print(f"Watching {WATCH_DIR.resolve()} ... drop or edit .chaos/.sn files here.")
+    scan(seen)  # Pick up anything dropped while the watcher was down
+    if Observer is not None:
+        watch_events(seen)
+    else:
+        watch_polling(seen)
 
 if __name__ == "__main__":
     main()
 """
-    )
 
-    content = script_template.substitute(
-        dropbox_path=dropbox_path,
-        structured_core_setup=structured_core_setup,
-        emotive_setup=emotive_setup,
-        chaosfield_setup=chaosfield_setup,
-        structured_core_line=structured_core_line,
-        emotive_line=emotive_line,
-        chaosfield_line=chaosfield_line,
-    )
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+def write_autoloop():
+    path = EDEN_ROOT / "eden_loop.py"
+    path.write_text(_LOOP_TEMPLATE.replace("__DROPBOX__", str(DROPBOX)), encoding="utf-8")
     print(f"✓ Wrote {path}")
 
 # -----------------------------
 # Tutorial pack (10 modules with Gizzy)
 # -----------------------------
-TEMPLATE = """[LESSON]: "{title}"
-[VERSION]: "1.0"
-[AUTO_RUN]: TRUE
-[ARCHIVE_PATH]: "C:\\EdenOS_{USERNAME}\\99_storage"
-[SYMBOL:PERSONA:GIZZY]
-[SPIRAL: {spiral}]
-{core}
-
-{emotive}
-
-{chaosfield}
-"""
+# Header lines shared by every lesson, encoded once
+LESSON_HEADER = (
+    '[VERSION]: "1.0"\n'
+    '[AUTO_RUN]: TRUE\n'
+    f'[ARCHIVE_PATH]: "C:\\EdenOS_{USERNAME}\\99_storage"\n'
+    '[SYMBOL:PERSONA:GIZZY]\n'
+).encode("utf-8")
 
 LESSONS = [
     ("01_Autoloop_Setup", "NEST",
@@ -264,15 +302,19 @@ The light is yours now.”
     )
 ]
 
+def _write_lesson(lesson):
+    title, spiral, core, emotive, chaosfield = lesson
+    outpath = DROPBOX / f"{title}.chaoscript.sn"
+    title_line = f'[LESSON]: "{title.replace("_", " ")}"\n'.encode("utf-8")
+    body = f"[SPIRAL: {spiral}]\n{core}\n\n{emotive}\n\n{chaosfield}\n".encode("utf-8")
+    outpath.write_bytes(b"".join((title_line, LESSON_HEADER, body)))
+    return outpath
+
 def write_tutorials():
-    for title, spiral, core, emotive, chaosfield in LESSONS:
-        filename = f"{title}.chaoscript.sn"
-        outpath = DROPBOX / filename
-        content = TEMPLATE.format(title=title.replace("_", " "), spiral=spiral,
-                                  core=core, emotive=emotive, chaosfield=chaosfield, USERNAME=USERNAME)
-        with open(outpath, "w", encoding="utf-8") as f:
-            f.write(content)
-        print(f"✓ Wrote {outpath}")
+    # Writes are I/O-bound, so overlap the per-file open/close latency
+    with ThreadPoolExecutor(max_workers=len(LESSONS)) as pool:
+        for outpath in pool.map(_write_lesson, LESSONS):
+            print(f"✓ Wrote {outpath}")
 
 # -----------------------------
 # Main
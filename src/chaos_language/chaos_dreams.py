@@ -2,7 +2,7 @@
 Dream engine: concise visions generated from state.
 """
 import random
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from .chaos_stdlib import text_snippet, uniq
 
@@ -11,31 +11,34 @@ class DreamEngine:
     def __init__(self, seed: Optional[int] = None):
         self._rng = random.Random(seed)
 
-    def _choose(self, rng: random.Random, seq: Iterable[Any], default: str) -> str:
-        """Return a deterministic choice from *seq* or the provided *default*."""
-        seq = list(seq)
-        return default if not seq else rng.choice(seq)
-
     def visions(
         self,
         symbols: Dict[str, Any],
         emotions: List[Dict[str, Any]],
         narrative: str,
         count: int = 3,
+        keys: Optional[Sequence[Any]] = None,
     ) -> List[str]:
+        """Weave *count* visions; pass precomputed unique *keys* to skip rebuilding them."""
         rng = self._rng
 
-        keys = uniq(list(symbols.keys()))
-        emotion_names = [
-            emotion["name"]
-            for emotion in emotions
-            for _ in range(max(emotion["intensity"] // 2, 1))
+        if keys is None:
+            keys = uniq(symbols)
+        names = [emotion["name"] for emotion in emotions]
+        weights = [max(emotion["intensity"] // 2, 1) for emotion in emotions]
+
+        # One batched draw each instead of three rng.choice calls per dream
+        if keys:
+            key_picks = rng.choices(keys, k=count * 2)
+        else:
+            key_picks = ["MEMORY", "LIGHT"] * count
+        if names:
+            emotion_picks = rng.choices(names, weights=weights, k=count)
+        else:
+            emotion_picks = ["CALM"] * count
+
+        suffix = f"; context: {text_snippet(narrative, 160)}"
+        return [
+            f"Dream of {first} meeting {second} under {emotion_name}{suffix}"
+            for first, second, emotion_name in zip(key_picks[::2], key_picks[1::2], emotion_picks)
         ]
-        base = text_snippet(narrative, 160)
-        dreams = []
-        for _ in range(count):
-            first = self._choose(rng, keys, "MEMORY")
-            second = self._choose(rng, keys, "LIGHT")
-            emotion_name = self._choose(rng, emotion_names, "CALM")
-            dreams.append(f"Dream of {first} meeting {second} under {emotion_name}; context: {base}")
-        return dreams
@@ -1,11 +1,13 @@
 """
 Stack-based emotion engine with keyword triggers and transitions.
 """
-from collections import deque
 from datetime import datetime
+from typing import List
 
 
 class Emotion:
+    __slots__ = ("name", "intensity", "timestamp")
+
     def __init__(self, name: str, intensity: int, timestamp=None):
         self.name = name.upper()
         self.intensity = max(0, min(intensity, 10))
@@ -23,7 +25,9 @@ class Emotion:
 
 class ChaosEmotionStack:
     def __init__(self):
-        self.stack = deque(maxlen=10)
+        # Oldest first; a plain list is cheaper than a deque to iterate at this size
+        self.stack: List[Emotion] = []
+        self.max_emotions = 10
         self.triggers = {
             "safe": ("CALM", 6),
             "momma": ("NOSTALGIA", 8),
@@ -41,7 +45,16 @@ class ChaosEmotionStack:
         }
 
     def push(self, name: str, intensity: int) -> None:
-        self.stack.append(Emotion(name, intensity))
+        stack = self.stack
+        stack.append(Emotion(name, intensity))
+        if len(stack) > self.max_emotions:
+            del stack[0]
+
+    def push_many(self, entries) -> None:
+        stack = self.stack
+        stack.extend(Emotion(name, intensity) for name, intensity in entries)
+        if len(stack) > self.max_emotions:
+            del stack[: len(stack) - self.max_emotions]
 
     def current(self):  # type: ignore[override]
         return self.stack[-1] if self.stack else None
@@ -1,32 +1,87 @@
 """
 Undirected lightweight graph for symbols/entities.
 """
-from typing import Any, Dict, Set
+import sys
+from array import array
+from itertools import accumulate
+from typing import AbstractSet, Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from .chaos_errors import ChaosGraphError
 
 
+class CSRAdjacency(NamedTuple):
+    """Compressed sparse row adjacency over integer node ids."""
+
+    index: Dict[str, int]  # label -> id
+    labels: List[str]  # id -> label
+    indptr: array  # neighbours of id i are indices[indptr[i]:indptr[i + 1]]
+    indices: array
+
+    def neighbors(self, i: int) -> array:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+
 class ChaosGraph:
+    __slots__ = ("nodes", "edges", "_frozen", "_csr", "_edge_count")
+
     def __init__(self):
         self.nodes: Set[str] = set()
         self.edges: Dict[str, Set[str]] = {}
+        self._frozen: Optional[Dict[str, Tuple[str, ...]]] = None  # Dropped on every write
+        self._csr: Optional[CSRAdjacency] = None
+        self._edge_count = 0  # Undirected edges, kept current by add_edge
 
     def add_node(self, node: str) -> None:
+        node = sys.intern(node)  # One shared object per label; pointer-equal lookups
         self.nodes.add(node)
-        self.edges.setdefault(node, set())
+        if node not in self.edges:
+            self.edges[node] = set()
+            self._frozen = self._csr = None
 
     def add_edge(self, a: str, b: str) -> None:
         if a == b:
             return
+        a = sys.intern(a)
+        b = sys.intern(b)
         self.add_node(a)
         self.add_node(b)
-        self.edges[a].add(b)
+        adjacent = self.edges[a]
+        if b in adjacent:
+            return
+        adjacent.add(b)
         self.edges[b].add(a)
+        self._edge_count += 1
+        self._frozen = self._csr = None
 
     def neighbors(self, node: str) -> Set[str]:
         if node not in self.edges:
             raise ChaosGraphError(f"Unknown node: {node}")
         return set(self.edges[node])
 
+    def neighbors_view(self, node: str) -> AbstractSet[str]:
+        """Live adjacency of *node* without copying; callers must not mutate it."""
+        adjacent = self.edges.get(node)
+        if adjacent is None:
+            raise ChaosGraphError(f"Unknown node: {node}")
+        return adjacent
+
+    def freeze(self) -> Dict[str, Tuple[str, ...]]:
+        """Sorted, de-duplicated adjacency tuples for traversal; cached until the next write."""
+        if self._frozen is None:
+            self._frozen = {node: tuple(sorted(adjacent)) for node, adjacent in self.edges.items()}
+        return self._frozen
+
+    def csr(self) -> CSRAdjacency:
+        """Integer CSR arrays of the frozen adjacency for traversal; cached until the next write."""
+        if self._csr is None:
+            adjacency = self.freeze()
+            labels = sorted(adjacency)
+            index = {label: i for i, label in enumerate(labels)}
+            indptr = array("i", accumulate((len(adjacency[label]) for label in labels), initial=0))
+            indices = array("i", (index[other] for label in labels for other in adjacency[label]))
+            self._csr = CSRAdjacency(index, labels, indptr, indices)
+        return self._csr
+
     def __repr__(self) -> str:
-        return f"CHAOSGraph(nodes={len(self.nodes)}, edges={sum(len(v) for v in self.edges.values())})"
+        # Each undirected edge appears in both endpoints' adjacency sets
+        return f"CHAOSGraph(nodes={len(self.nodes)}, edges={2 * self._edge_count})"
@@ -1,28 +1,55 @@
 """
 Interpreter: walk parse tree -> environment dict.
 """
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List
 
 from .chaos_parser import NodeType, Node
 
+# Enum members bound once as globals for the per-node hot path
+_PROGRAM = NodeType.PROGRAM
+_STRUCTURED_CORE = NodeType.STRUCTURED_CORE
+_EMOTIVE_LAYER = NodeType.EMOTIVE_LAYER
+_CHAOSFIELD_LAYER = NodeType.CHAOSFIELD_LAYER
+
 
 class ChaosInterpreter:
-    def __init__(self):
-        self.environment = {}
+    __slots__ = ("environment", "_dispatch")
+
+    def __init__(self) -> None:
+        self.environment: Dict[str, Any] = {}
+        # Handler per leaf node type, looked up once instead of an if/elif chain;
+        # PROGRAM nodes are expanded by interpret() itself
+        self._dispatch: Dict[NodeType, Callable[[Node], None]] = {
+            _STRUCTURED_CORE: self._structured_core,
+            _EMOTIVE_LAYER: self._emotive_layer,
+            _CHAOSFIELD_LAYER: self._chaosfield_layer,
+        }
 
-    def reset(self):
+    def reset(self) -> None:
         self.environment = {}
 
     def interpret(self, node: Node) -> Dict[str, Any]:
-        if node.type == NodeType.PROGRAM:
-            for child in node.children:
-                self.interpret(child)
-        elif node.type == NodeType.STRUCTURED_CORE:
-            self.environment["structured_core"] = node.value or {}
-        elif node.type == NodeType.EMOTIVE_LAYER:
-            self.environment["emotive_layer"] = node.value or []
-        elif node.type == NodeType.CHAOSFIELD_LAYER:
-            self.environment["chaosfield_layer"] = node.value or ""
-        else:
-            raise ValueError(f"Unknown node: {node.type}")
+        # Explicit depth-first stack: no Python frame per node, no recursion limit
+        dispatch = self._dispatch
+        stack: List[Node] = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            current = pop()
+            node_type = current.type
+            if node_type is _PROGRAM:
+                extend(reversed(current.children))
+                continue
+            handler = dispatch.get(node_type)
+            if handler is None:
+                raise ValueError(f"Unknown node: {node_type}")
+            handler(current)
         return self.environment
+
+    def _structured_core(self, node: Node) -> None:
+        self.environment["structured_core"] = node.value or {}
+
+    def _emotive_layer(self, node: Node) -> None:
+        self.environment["emotive_layer"] = node.value or []
+
+    def _chaosfield_layer(self, node: Node) -> None:
+        self.environment["chaosfield_layer"] = node.value or ""
@@ -1,6 +1,7 @@
 """
 Simplified lexer for the CHAOS language.
 """
+import re
 from enum import Enum, auto
 
 
@@ -14,6 +15,8 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ("type", "value", "line", "column")
+
     def __init__(self, token_type, value, line, column):
         self.type = token_type
         self.value = value
@@ -24,6 +27,56 @@ class Token:
         return f"Token({self.type}, {self.value!r}, line={self.line}, col={self.column})"
 
 
+class SpanToken(Token):
+    """Token holding a [start, end) span of the source; the text is sliced on access."""
+
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, token_type, source, start, end, line, column):
+        self.type = token_type
+        self.source = source
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+
+    @property
+    def value(self):
+        return self.source[self.start:self.end]
+
+
+# Punctuation characters and the token types they become
+PUNCTUATION = {
+    "[": TokenType.LEFT_BRACKET,
+    "]": TokenType.RIGHT_BRACKET,
+    "{": TokenType.LEFT_BRACE,
+    "}": TokenType.RIGHT_BRACE,
+    ":": TokenType.COLON,
+    ",": TokenType.COMMA,
+}
+
+# Shared punctuation tokens: the parser only checks their type, so one
+# instance per character serves every occurrence (line/column are None)
+PUNCTUATION_TOKENS = {c: Token(token_type, c, None, None) for c, token_type in PUNCTUATION.items()}
+
+# One alternation for every lexeme, tried in order, so the scanning runs in
+# the regex engine; OTHER consumes an unknown character, which is skipped.
+# Blanks before a lexeme are folded into its match rather than costing a
+# loop iteration of their own.
+TOKEN_RE = re.compile(r"""
+    [ \t\r]*
+    (?:
+      (?P<NEWLINE>\n)
+    | (?P<COMMENT>\#[^\n]*)
+    | (?P<PUNCT>[\[\]{}:,])
+    | (?P<STRING>"[^"]*"?)
+    | (?P<NUMBER>\d+)
+    | (?P<WORD>[^\W\d][\w-]*)
+    | (?P<OTHER>.)
+    )
+""", re.VERBOSE)
+
+
 class ChaosLexer:
     def __init__(self):
         self.keywords = {
@@ -33,99 +86,54 @@ class ChaosLexer:
         }
 
     def tokenize(self, source):
-        self.source = source
-        self.tokens = []
-        self.i = 0
-        self.line = 1
-        self.col = 1
-        s = self.source
-
-        def emit(token_type, value):
-            self.tokens.append(Token(token_type, value, self.line, self.col))
-
-        while self.i < len(s):
-            c = s[self.i]
-            if c in " \t\r":
-                self.i += 1
-                self.col += 1
-                continue
-            if c == "\n":
-                self.i += 1
-                self.line += 1
-                self.col = 1
-                continue
-            if c == "#":
-                while self.i < len(s) and s[self.i] != "\n":
-                    self.i += 1
-                continue
-            if c == "[":
-                emit(TokenType.LEFT_BRACKET, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == "]":
-                emit(TokenType.RIGHT_BRACKET, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == "{":
-                emit(TokenType.LEFT_BRACE, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == "}":
-                emit(TokenType.RIGHT_BRACE, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == ":":
-                emit(TokenType.COLON, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == ",":
-                emit(TokenType.COMMA, c)
-                self.i += 1
-                self.col += 1
-                continue
-            if c == '"':
-                self.i += 1
-                start = self.i
-                while self.i < len(s) and s[self.i] != '"':
-                    if s[self.i] == "\n":
-                        self.line += 1
-                        self.col = 1
-                    self.i += 1
-                val = s[start:self.i]
-                if self.i < len(s) and s[self.i] == '"':
-                    self.i += 1
-                emit(TokenType.STRING, val)
-                continue
-            if c.isdigit():
-                start = self.i
-                while self.i < len(s) and s[self.i].isdigit():
-                    self.i += 1
-                emit(TokenType.NUMBER, s[start:self.i])
-                continue
-            if c.isalpha() or c == "_":
-                start = self.i
-                while self.i < len(s) and (
-                    s[self.i].isalnum() or s[self.i] in {"_", "-"}
-                ):
-                    self.i += 1
-                word = s[start:self.i]
-                token_type = self.keywords.get(word.upper(), TokenType.IDENTIFIER)
-                if token_type == TokenType.BOOLEAN:
-                    value = word.upper() == "TRUE"
-                elif token_type == TokenType.NULL:
-                    value = None
+        tokens = []
+        append = tokens.append
+        keywords = self.keywords
+        punctuation = PUNCTUATION_TOKENS
+        longest_keyword = max(map(len, keywords), default=0)
+        line = 1
+        col = 1
+
+        for match in TOKEN_RE.finditer(source):
+            kind = match.lastgroup
+            start, end = match.span(kind)
+            col += start - match.start()  # Leading blanks
+            if kind == "OTHER":
+                col += end - start
+            elif kind == "NEWLINE":
+                line += 1
+                col = 1
+            elif kind == "PUNCT":
+                append(punctuation[source[start]])
+                col += 1
+            elif kind == "WORD":
+                token_type = None
+                if end - start <= longest_keyword:  # Longer words never need slicing here
+                    word = source[start:end].upper()
+                    token_type = keywords.get(word)
+                if token_type is None:
+                    append(SpanToken(TokenType.IDENTIFIER, source, start, end, line, col))
+                elif token_type is TokenType.BOOLEAN:
+                    append(Token(token_type, word == "TRUE", line, col))
                 else:
-                    value = word
-                emit(token_type, value)
-                continue
-            # Unknown char → skip
-            self.i += 1
-            self.col += 1
-
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.col))
-        return self.tokens
+                    append(Token(token_type, None, line, col))
+                col += end - start
+            elif kind == "NUMBER":
+                append(SpanToken(TokenType.NUMBER, source, start, end, line, col))
+                col += end - start
+            elif kind == "STRING":
+                width = end - start
+                start += 1
+                if end > start and source[end - 1] == '"':
+                    end -= 1
+                # Strings may span lines; line/col are counted from the match, not per char
+                newlines = source.count("\n", start, end)
+                if newlines:
+                    line += newlines
+                    col = 1
+                append(SpanToken(TokenType.STRING, source, start, end, line, col))
+                col += width
+            # COMMENT: skipped
+
+        append(Token(TokenType.EOF, "", line, col))
+        return tokens
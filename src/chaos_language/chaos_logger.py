@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+import time
 from dataclasses import dataclass
 from typing import Callable, Iterable, List, Optional
 
@@ -27,6 +28,23 @@ class LogEntry:
         return formatter(self)
 
 
+class _DeferredLogEntry(LogEntry):
+    """Entry stamped with raw ``time.time_ns()``; the datetime is built on first read."""
+
+    def __init__(self, ns: int, channel: str, message: str) -> None:
+        self._ns = ns
+        self._timestamp: Optional[datetime.datetime] = None
+        self.channel = channel
+        self.message = message
+
+    @property
+    def timestamp(self) -> datetime.datetime:  # type: ignore[override]
+        if self._timestamp is None:
+            seconds, ns = divmod(self._ns, 1_000_000_000)
+            self._timestamp = datetime.datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000)
+        return self._timestamp
+
+
 def default_formatter(entry: LogEntry) -> str:
     """Default textual representation used by :class:`ChaosLogger`."""
 
@@ -53,7 +71,9 @@ class ChaosLogger:
         max_entries: Optional[int] = None,
         formatter: Optional[Formatter] = None,
     ) -> None:
-        self._clock: Clock = clock or datetime.datetime.now
+        # Without a custom clock, log() only reads time.time_ns(); the datetime
+        # is built when an entry's timestamp is first needed
+        self._clock: Optional[Clock] = clock
         self._max_entries = max_entries
         self._formatter = formatter
         self._logs: List[LogEntry] = []
@@ -64,7 +84,11 @@ class ChaosLogger:
     def log(self, message: str, *, channel: str = "GENERAL") -> None:
         """Record a message under the supplied channel."""
 
-        entry = LogEntry(timestamp=self._clock(), channel=channel, message=message)
+        clock = self._clock
+        if clock is None:
+            entry: LogEntry = _DeferredLogEntry(time.time_ns(), channel, message)
+        else:
+            entry = LogEntry(timestamp=clock(), channel=channel, message=message)
         self._logs.append(entry)
         if self._max_entries is not None and len(self._logs) > self._max_entries:
             # Drop the oldest entry to preserve a bounded history.
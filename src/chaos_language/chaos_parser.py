@@ -8,6 +8,20 @@ from .chaos_lexer import Token, TokenType
 from .chaos_stdlib import soft_intensity
 
 
+# Token types bound once as globals for the lookahead checks
+_BOOLEAN = TokenType.BOOLEAN
+_COLON = TokenType.COLON
+_EOF = TokenType.EOF
+_IDENTIFIER = TokenType.IDENTIFIER
+_LEFT_BRACE = TokenType.LEFT_BRACE
+_LEFT_BRACKET = TokenType.LEFT_BRACKET
+_NULL = TokenType.NULL
+_NUMBER = TokenType.NUMBER
+_RIGHT_BRACE = TokenType.RIGHT_BRACE
+_RIGHT_BRACKET = TokenType.RIGHT_BRACKET
+_STRING = TokenType.STRING
+
+
 class NodeType(Enum):
     PROGRAM = auto()
     STRUCTURED_CORE = auto()
@@ -28,6 +42,8 @@ class Node:
 class ChaosParser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
+        # Token types as a parallel list, so lookahead checks index it directly
+        self.kinds: List[TokenType] = [token.type for token in tokens]
         self.current = 0
 
     def parse(self) -> Node:
@@ -41,7 +57,7 @@ class ChaosParser:
         )
 
     def is_at_end(self) -> bool:
-        return self.peek().type == TokenType.EOF
+        return self.kinds[self.current] is _EOF
 
     def peek(self) -> Token:
         return self.tokens[self.current]
@@ -55,13 +71,13 @@ class ChaosParser:
         return self.previous()
 
     def check(self, token_type: TokenType) -> bool:
-        return (not self.is_at_end()) and self.peek().type == token_type
+        kind = self.kinds[self.current]
+        return kind is not _EOF and kind is token_type
 
     def match(self, *token_types: TokenType) -> bool:
-        if self.is_at_end():
-            return False
-        if self.peek().type in token_types:
-            self.advance()
+        kind = self.kinds[self.current]
+        if kind is not _EOF and kind in token_types:
+            self.current += 1
             return True
         return False
 
@@ -75,11 +91,11 @@ class ChaosParser:
         parts: List[str] = ["["] if include_brackets else []
         while not self.is_at_end():
             tok = self.advance()
-            if tok.type == TokenType.LEFT_BRACKET:
+            if tok.type is _LEFT_BRACKET:
                 depth += 1
                 parts.append(str(tok.value))
                 continue
-            if tok.type == TokenType.RIGHT_BRACKET:
+            if tok.type is _RIGHT_BRACKET:
                 depth -= 1
                 if depth == 0:
                     if include_brackets:
@@ -96,28 +112,28 @@ class ChaosParser:
         pairs: Dict[str, Any] = {}
         # Expect many:  [IDENT[:...]]: value
         while not self.is_at_end():
-            if not self.check(TokenType.LEFT_BRACKET):
+            if not self.check(_LEFT_BRACKET):
                 break
             bracket_start = self.current
             self.advance()  # consume '['
-            if not self.check(TokenType.IDENTIFIER):
+            if not self.check(_IDENTIFIER):
                 # Not a key-value tag → maybe emotive layer
                 self.current = bracket_start
                 break
             key = self._collect_bracket_contents(include_brackets=False)
-            if not self.check(TokenType.COLON):
+            if not self.check(_COLON):
                 # Not a structured core pair; rewind for emotive parser
                 self.current = bracket_start
                 break
             self.advance()  # consume ':'
             tok = self.advance()
-            if tok.type in (TokenType.STRING, TokenType.NUMBER, TokenType.BOOLEAN):
+            if tok.type in (_STRING, _NUMBER, _BOOLEAN):
                 pairs[key] = tok.value
-            elif tok.type == TokenType.IDENTIFIER:
+            elif tok.type is _IDENTIFIER:
                 pairs[key] = tok.value
-            elif tok.type == TokenType.NULL:
+            elif tok.type is _NULL:
                 pairs[key] = None
-            elif tok.type == TokenType.LEFT_BRACKET:
+            elif tok.type is _LEFT_BRACKET:
                 # Capture nested bracketed value like [ATTRIBUTE:WOOD]
                 value = self._collect_bracket_contents(include_brackets=False)
                 pairs[key] = value
@@ -130,10 +146,10 @@ class ChaosParser:
     def parse_emotive_layer(self) -> Node:
         emotions = []
         while not self.is_at_end():
-            if not self.check(TokenType.LEFT_BRACKET):
+            if not self.check(_LEFT_BRACKET):
                 break
             self.advance()  # [
-            if not self.check(TokenType.IDENTIFIER):
+            if not self.check(_IDENTIFIER):
                 self.current -= 1
                 break
             tag = self.advance().value
@@ -141,18 +157,18 @@ class ChaosParser:
                 # Not emotive-family; rewind to before '[' for next phase
                 self.current -= 2  # step back identifier and '['
                 break
-            self.consume(TokenType.COLON, "':' after tag")
-            kind = self.consume(TokenType.IDENTIFIER, "emotion/symbol type").value
+            self.consume(_COLON, "':' after tag")
+            kind = self.consume(_IDENTIFIER, "emotion/symbol type").value
             extras = []
-            while self.match(TokenType.COLON):
+            while self.match(_COLON):
                 if self.is_at_end():
                     raise SyntaxError(": without value")
                 extras.append(self.advance())
             trailing = []
             if tag == "EMOTION":
-                while not self.check(TokenType.RIGHT_BRACKET) and not self.is_at_end():
+                while not self.check(_RIGHT_BRACKET) and not self.is_at_end():
                     trailing.append(self.advance())
-            self.consume(TokenType.RIGHT_BRACKET, "] after tag")
+            self.consume(_RIGHT_BRACKET, "] after tag")
             if tag == "EMOTION":
                 tokens = extras + trailing
                 raw_value = "".join(str(token.value) for token in tokens).strip() if tokens else None
@@ -162,13 +178,13 @@ class ChaosParser:
         return Node(NodeType.EMOTIVE_LAYER, value=emotions)
 
     def parse_chaosfield_layer(self) -> Node:
-        if not self.match(TokenType.LEFT_BRACE):
+        if not self.match(_LEFT_BRACE):
             return Node(NodeType.CHAOSFIELD_LAYER, value="")
         parts = []
-        while not self.is_at_end() and not self.check(TokenType.RIGHT_BRACE):
+        while not self.is_at_end() and not self.check(_RIGHT_BRACE):
             tok = self.advance()
             parts.append(str(tok.value))
-        if self.check(TokenType.RIGHT_BRACE):
+        if self.check(_RIGHT_BRACE):
             self.advance()
             return Node(NodeType.CHAOSFIELD_LAYER, value=(" ".join(parts)).strip())
         raise SyntaxError("Unterminated chaosfield narrative; missing '}'")
@@ -2,11 +2,20 @@
 Oaths, rituals, contracts w/ scoring.
 """
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .chaos_stdlib import text_snippet, weighted_pick
 
 
+def emotion_totals(emotions: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Sum intensity per emotion name in one pass, shared by every protocol."""
+    totals: Dict[str, int] = {}
+    for emotion in emotions:
+        name = emotion["name"]
+        totals[name] = totals.get(name, 0) + emotion["intensity"]
+    return totals
+
+
 @dataclass
 class ProtocolResult:
     name: str
@@ -19,10 +28,10 @@ class Protocol:
     name: str = "protocol"
     priority: int = 0
 
-    def match(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, ctx: Dict[str, Any], totals: Mapping[str, int]) -> int:
         return 0
 
-    def execute(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, ctx: Dict[str, Any], totals: Mapping[str, int], score: Optional[int] = None) -> ProtocolResult:
         return ProtocolResult(self.name, action="noop", score=0)
 
 
@@ -30,13 +39,12 @@ class OathProtocol(Protocol):
     name = "oath.stability"
     priority = 50
 
-    def match(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
-        fear = sum(emotion["intensity"] for emotion in emotions if emotion["name"] == "FEAR")
-        grief = sum(emotion["intensity"] for emotion in emotions if emotion["name"] == "GRIEF")
-        return (fear + grief) // 2
+    def match(self, ctx: Dict[str, Any], totals: Mapping[str, int]) -> int:
+        return (totals.get("FEAR", 0) + totals.get("GRIEF", 0)) // 2
 
-    def execute(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
-        score = self.match(ctx, emotions)
+    def execute(self, ctx: Dict[str, Any], totals: Mapping[str, int], score: Optional[int] = None) -> ProtocolResult:
+        if score is None:
+            score = self.match(ctx, totals)
         return ProtocolResult(
             self.name,
             "stabilize",
@@ -49,13 +57,12 @@ class RitualProtocol(Protocol):
     name = "ritual.transformation"
     priority = 40
 
-    def match(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
-        hope = sum(emotion["intensity"] for emotion in emotions if emotion["name"] == "HOPE")
-        love = sum(emotion["intensity"] for emotion in emotions if emotion["name"] == "LOVE")
-        return hope + love
+    def match(self, ctx: Dict[str, Any], totals: Mapping[str, int]) -> int:
+        return totals.get("HOPE", 0) + totals.get("LOVE", 0)
 
-    def execute(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
-        score = self.match(ctx, emotions)
+    def execute(self, ctx: Dict[str, Any], totals: Mapping[str, int], score: Optional[int] = None) -> ProtocolResult:
+        if score is None:
+            score = self.match(ctx, totals)
         return ProtocolResult(
             self.name,
             "transform",
@@ -71,14 +78,13 @@ class ContractProtocol(Protocol):
     name = "contract.relationship"
     priority = 35
 
-    def match(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
-        symbols = ctx.get("symbols", {})
-        pairs = [key for key in symbols if ":" in key]
-        joy = sum(emotion["intensity"] for emotion in emotions if emotion["name"] == "JOY")
-        return min(100, joy + len(pairs) * 2)
+    def match(self, ctx: Dict[str, Any], totals: Mapping[str, int]) -> int:
+        pairs = sum(":" in key for key in ctx.get("symbols", {}))
+        return min(100, totals.get("JOY", 0) + pairs * 2)
 
-    def execute(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
-        score = self.match(ctx, emotions)
+    def execute(self, ctx: Dict[str, Any], totals: Mapping[str, int], score: Optional[int] = None) -> ProtocolResult:
+        if score is None:
+            score = self.match(ctx, totals)
         return ProtocolResult(
             self.name,
             "relate",
@@ -93,13 +99,14 @@ class ProtocolRegistry:
 
     def evaluate(self, ctx: Dict[str, Any], emotions: List[Dict[str, Any]]) -> Optional[ProtocolResult]:
         scored: List[Tuple[ProtocolResult, int]] = []
+        totals = emotion_totals(emotions)
         for protocol in self.protocols:
-            match_score = protocol.match(ctx, emotions)
+            match_score = protocol.match(ctx, totals)
             if match_score <= 0:
                 continue
-            result = protocol.execute(ctx, emotions)
+            result = protocol.execute(ctx, totals, match_score)
             result.score = max(match_score, result.score) + protocol.priority
             scored.append((result, result.score))
         if not scored:
             return None
-        return weighted_pick([(result, score) for result, score in scored], None)
+        return weighted_pick(scored, None)
@@ -1,18 +1,22 @@
 """
 Entry point for executing CHAOS programs.
 """
-from typing import Dict, Any
+from typing import Any, Dict, List
 
 from .chaos_errors import ChaosSyntaxError, ChaosRuntimeError
 from .chaos_lexer import ChaosLexer
-from .chaos_parser import ChaosParser
+from .chaos_parser import ChaosParser, Node
 from .chaos_interpreter import ChaosInterpreter
 
+# tokenize() keeps no per-call state, so one lexer serves every run
+_LEXER = ChaosLexer()
+# Idle interpreters; reused across runs instead of rebuilding one per call
+_INTERPRETERS: List[ChaosInterpreter] = []
+
 
 def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
-    lexer = ChaosLexer()
     try:
-        tokens = lexer.tokenize(source_code)
+        tokens = _LEXER.tokenize(source_code)
     except Exception as exc:
         raise ChaosSyntaxError(f"Lexer error: {exc}") from exc
 
@@ -27,15 +31,26 @@ def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
     except Exception as exc:
         raise ChaosSyntaxError(f"Parser error: {exc}") from exc
 
+    return run_ast(ast, verbose=verbose)
+
+
+def run_ast(ast: Node, verbose: bool = False) -> Dict[str, Any]:
+    """Interpret an already parsed program, e.g. the tree returned by validate_chaos."""
     if verbose:
         print("🔸 AST:")
         print(ast)
 
-    interpreter = ChaosInterpreter()
+    try:
+        interpreter = _INTERPRETERS.pop()
+    except IndexError:
+        interpreter = ChaosInterpreter()
+    interpreter.reset()  # Fresh environment dict; the previous caller keeps theirs
     try:
         env = interpreter.interpret(ast)
     except Exception as exc:
         raise ChaosRuntimeError(f"Interpreter error: {exc}") from exc
+    finally:
+        _INTERPRETERS.append(interpreter)
 
     if verbose:
         print("✅ ENV:")
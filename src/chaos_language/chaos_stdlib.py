@@ -3,6 +3,9 @@ Minimal pure helpers: clamp, pick, norm_key, uniq, text_snippet, weighted_pick.
 """
 import random
 import re
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any, Dict, Iterable, List, Tuple, Union
 
 
@@ -17,8 +20,12 @@ def pick(seq: Iterable[Any], default: Any = None) -> Any:
     return random.choice(seq)
 
 
+_NORM_RE = re.compile(r"[^A-Z0-9_]+")
+
+
+@lru_cache(maxsize=4096)  # The same few symbol and emotion keys recur every tick
 def norm_key(s: str) -> str:
-    return re.sub(r"[^A-Z0-9_]+", "_", (s or "").strip().upper())
+    return _NORM_RE.sub("_", (s or "").strip().upper())
 
 
 def uniq(seq: Iterable[Any]) -> List[Any]:
@@ -42,14 +49,9 @@ def weighted_pick(pairs: Union[List[Tuple[Any, int]], Dict[Any, int]], default:
         return default
     if isinstance(pairs, dict):
         pairs = list(pairs.items())
-    total = sum(max(weight, 0) for _, weight in pairs) or 1
-    choice = random.randint(1, total)
-    acc = 0
-    for item, weight in pairs:
-        acc += max(weight, 0)
-        if choice <= acc:
-            return item
-    return default
+    cumulative = list(accumulate(max(weight, 0) for _, weight in pairs))
+    index = bisect_left(cumulative, random.randint(1, cumulative[-1] or 1))
+    return pairs[index][0] if index < len(pairs) else default
 
 
 def soft_intensity(
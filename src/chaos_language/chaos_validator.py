@@ -8,7 +8,9 @@ interlocking layers:
 * a **chaosfield narrative** that carries the qualitative story.
 
 `validate_chaos` preflights a script by running it through the lexer and parser
-and then inspecting the resulting AST.  When a layer is missing or malformed we
+and then inspecting the resulting AST, which it returns so callers can hand it
+straight to :func:`~chaos_language.chaos_runtime.run_ast` instead of parsing the
+script a second time.  `validate_ast` runs the structural checks alone.  When a layer is missing or malformed we
 raise :class:`ChaosValidationError` with a targeted message so operators know
 how to repair the ritual quickly.
 """
@@ -22,7 +24,7 @@ from .chaos_lexer import ChaosLexer
 from .chaos_parser import ChaosParser, Node, NodeType
 
 
-def validate_chaos(source: str) -> None:
+def validate_chaos(source: str) -> Node:
     """Validate that ``source`` contains the full CHAOS ritual.
 
     Parameters
@@ -30,6 +32,11 @@ def validate_chaos(source: str) -> None:
     source:
         Raw CHAOS script text.
 
+    Returns
+    -------
+    Node
+        The validated PROGRAM node.
+
     Raises
     ------
     ChaosValidationError
@@ -55,6 +62,19 @@ def validate_chaos(source: str) -> None:
     except Exception as exc:
         raise ChaosValidationError(f"CHAOS Validation Failed during parsing: {exc}") from exc
 
+    validate_ast(ast)
+    return ast
+
+
+def validate_ast(ast: Node) -> None:
+    """Run the structural layer checks on an already parsed program.
+
+    Raises
+    ------
+    ChaosValidationError
+        If a layer is missing or malformed.
+    """
+
     _require(ast is not None, "Parser did not return a program node")
     _require(ast.type == NodeType.PROGRAM, "Top-level CHAOS node must be PROGRAM")
     _require(len(ast.children) == 3, "Expected 3 layers: structured_core, emotive_layer, chaosfield_layer")
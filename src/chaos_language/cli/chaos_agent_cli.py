@@ -1,11 +1,11 @@
 """
 Interactive CLI for ChaosAgent.
 """
-import argparse
-import os
-from typing import Optional
+import sys
+from pathlib import Path
+from typing import List, Optional
 
-from chaos_language import ChaosAgent
+from chaos_language.cli.prompt import line_reader
 
 BANNER = """\
 CHAOS Agent CLI 🌌
@@ -20,74 +20,120 @@ CHAOS Agent CLI 🌌
 """
 
 
+_BANNER_BYTES = (BANNER + "\n").encode("utf-8")  # Encoded once, as print(BANNER) would emit it
+
+
+def _show_banner() -> None:
+    """Write the pre-encoded banner to the byte stream when stdout is UTF-8."""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None or (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
+        print(BANNER)
+        return
+    sys.stdout.flush()
+    stream.write(_BANNER_BYTES)
+    stream.flush()
+
+
 def _read(path: str) -> Optional[str]:
-    if not os.path.exists(path):
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
         print("File not found.")
         return None
-    with open(path, "r", encoding="utf-8") as handle:
-        return handle.read()
 
 
-def main():
+def _parse_name(argv: List[str]) -> str:
+    """Read ``--name`` by hand, deferring anything else (help, errors) to argparse."""
+    if not argv:
+        return "Concord"
+    if len(argv) == 1 and argv[0].startswith("--name="):
+        return argv[0].partition("=")[2]
+    if len(argv) == 2 and argv[0] == "--name" and not argv[1].startswith("-"):
+        return argv[1]
+    import argparse
+
     parser = argparse.ArgumentParser(description="CHAOS Agent REPL")
     parser.add_argument("--name", default="Concord")
-    args = parser.parse_args()
+    return parser.parse_args(argv).name
 
-    agent = ChaosAgent(args.name)
-    print(BANNER)
+
+def main():
+    name = _parse_name(sys.argv[1:])
+
+    # Imported after argument parsing so `--help` never loads the runtime
+    from chaos_language import ChaosAgent
+
+    agent = ChaosAgent(name)
+    _show_banner()
     buf: list[str] = []
     last = None
+    stale = True  # Whether the agent changed since `last` was taken
 
+    def current():
+        # Read-only commands reuse the last report until something changes
+        nonlocal last, stale
+        if stale or last is None:
+            last = agent.step()
+            stale = False
+        return last
+
+    read_line = line_reader()
     while True:
         try:
-            line = input("agent> ").strip()
+            raw = read_line("agent> ")
+            line = raw.strip()
         except (EOFError, KeyboardInterrupt):
             print("\nbye.")
             break
 
-        if line.startswith(":"):
-            cmd, *rest = line[1:].split(maxsplit=1)
-            arg = rest[0] if rest else ""
-            if cmd == "open":
-                src = _read(arg)
-                if src:
-                    last = agent.step(sn=src)
-                    print("✓ merged.")
-            elif cmd == "dreams":
-                last = agent.step()
-                print("\n".join(last.dreams[:5]))
-            elif cmd == "emotions":
-                last = agent.step()
-                print(last.emotions)
-            elif cmd == "symbols":
-                last = agent.step()
-                print(last.symbols)
-            elif cmd == "action":
-                last = agent.step()
-                print(last.action)
-            elif cmd == "clear":
-                agent.ctx.set_narrative("")
-                print("✓ cleared.")
-            elif cmd in ("help", "h", "?"):
-                print(BANNER)
-            elif cmd in ("quit", "exit", "q"):
-                print("bye.")
-                break
-            else:
-                print("unknown. :help")
-            continue
-
-        if not line:
-            text = "\n".join(buf).strip()
-            buf.clear()
-            if not text and not last:
+        try:
+            if line.startswith(":"):
+                cmd, *rest = line[1:].split(maxsplit=1)
+                arg = rest[0] if rest else ""
+                if cmd == "open":
+                    src = _read(arg)
+                    if src:
+                        last = agent.step(sn=src)
+                        print("✓ merged.")
+                elif cmd == "dreams":
+                    last = current()
+                    print("\n".join(last.dreams[:5]))
+                elif cmd == "emotions":
+                    last = current()
+                    print(last.emotions)
+                elif cmd == "symbols":
+                    last = current()
+                    print(last.symbols)
+                elif cmd == "action":
+                    last = current()
+                    print(last.action)
+                elif cmd == "clear":
+                    agent.ctx.set_narrative("")
+                    stale = True
+                    print("✓ cleared.")
+                elif cmd in ("help", "h", "?"):
+                    _show_banner()
+                elif cmd in ("quit", "exit", "q"):
+                    print("bye.")
+                    break
+                else:
+                    print("unknown. :help")
                 continue
-            last = agent.step(text=text or None)
-            print(f"✓ action: {last.action} | emotions: {last.emotions} | dreams: {last.dreams[:2]}")
-            continue
 
-        buf.append(line)
+            if not line:
+                text = "\n".join(buf).strip()
+                buf.clear()
+                if not text and not last:
+                    continue
+                last = agent.step(text=text or None)
+                print(f"✓ action: {last.action} | emotions: {last.emotions} | dreams: {last.dreams[:2]}")
+                continue
 
+            buf.append(raw)
+        except KeyboardInterrupt:
+            # Ctrl+C mid-step drops that step only; at the prompt it exits
+            print("\ninterrupted.")
+            buf.clear()
 
 if __name__ == "__main__":
     main()
@@ -1,26 +1,38 @@
 # chaos_cli.py
 
-import argparse
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List
 
-from chaos_language import ChaosLexer, ChaosParser, ChaosInterpreter
 from chaos_language.cli.packaged_scripts import resolve_packaged_script
 
 
+@lru_cache(maxsize=64)
+def _tokenize(code):
+    """Tokenize *code*, memoized so re-submitted buffers skip the lexer.
+
+    Only the immutable token tuple is cached: the interpreter hands the AST's
+    layer containers straight to the caller, so each run parses afresh.
+    """
+    from chaos_language import ChaosLexer
+
+    return tuple(ChaosLexer().tokenize(code))
+
+
 def run_chaos(code, show_tokens=False, show_ast=False, output_json=False):
-    lexer = ChaosLexer()
-    tokens = lexer.tokenize(code)
+    # Imported here so `--help` never pays for the runtime
+    from chaos_language import ChaosInterpreter, ChaosParser
+
+    tokens = _tokenize(code)
+    ast = ChaosParser(list(tokens)).parse()
 
     if show_tokens:
         print("\n🧱 Tokens:")
         for t in tokens:
             print(t)
 
-    parser = ChaosParser(tokens)
-    ast = parser.parse()
-
     if show_ast:
         print("\n🌳 AST:")
         print(ast)
@@ -30,23 +42,52 @@ def run_chaos(code, show_tokens=False, show_ast=False, output_json=False):
 
     print("\n🧠 Final CHAOS Environment:")
     if output_json:
+        import json
         print(json.dumps(interpreter.environment, indent=2))
     else:
         for k, v in interpreter.environment.items():
             print(f"{k}: {v}")
+    return interpreter.environment
+
+# Flag -> attribute on the parsed namespace
+FLAGS = {"--tokens": "tokens", "--ast": "ast", "--json": "json"}
+
+
+def _build_parser():
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="CHAOS Shell and script runner")
     parser.add_argument("path", nargs="?", help="Path to a CHAOS script (.sn)")
     parser.add_argument("--tokens", action="store_true", help="Show token list")
     parser.add_argument("--ast", action="store_true", help="Show AST output")
     parser.add_argument("--json", action="store_true", help="Output environment as JSON")
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """Scan exact flags and one path by hand, deferring anything else to argparse.
+
+    Help, abbreviations, ``--`` and every error go through the real parser, so
+    behaviour matches argparse while the common case never imports it.
+    """
+    args = SimpleNamespace(path=None, tokens=False, ast=False, json=False)
+    for arg in argv:
+        if arg in FLAGS:
+            setattr(args, FLAGS[arg], True)
+        elif args.path is None and not arg.startswith("-"):
+            args.path = arg
+        else:
+            return _build_parser().parse_args(argv)
+    return args
+
+
+def main():
+    args = _parse_args(sys.argv[1:])
 
     if args.path:
         script_path = Path(args.path)
         if script_path.suffix.lower() != ".sn":
-            parser.error("CHAOS scripts must use the .sn extension")
+            _build_parser().error("CHAOS scripts must use the .sn extension")
 
         resolved_path = script_path
         if not script_path.exists():
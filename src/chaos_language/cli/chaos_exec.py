@@ -1,22 +1,42 @@
 """CHAOS executor for scripts with optional agent mode."""
 import argparse
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, TextIO
 
 from chaos_language import (
     ChaosAgent,
     generate_business_report,
     render_report_lines,
+    run_ast,
     run_chaos,
     validate_chaos,
 )
 from chaos_language.cli.packaged_scripts import resolve_packaged_script
+from chaos_language.cli.prompt import line_reader
 
+try:
+    import orjson  # Optional accelerator for JSON output
+except ImportError:
+    orjson = None
 
-class ReadableTextResource(Protocol):
-    def read_text(self, encoding: str | None = ...) -> str:
-        ...
+
+def write_json(payload: Dict[str, Any], stream: TextIO) -> None:
+    """Write ``payload`` as indented JSON to ``stream``, via orjson when installed."""
+    if orjson is not None:
+        stream.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        json.dump(payload, stream, indent=2)
+
+
+def save_json(payload: Dict[str, Any], path: Path) -> None:
+    """Save ``payload`` as indented JSON; orjson bytes skip text encoding."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
 
 
 def main():
@@ -44,20 +64,22 @@ def main():
 
     if args.file:
         script_path = Path(args.file)
-        resolved_path: ReadableTextResource = script_path
-
-        if not script_path.exists():
+        try:
+            src = script_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             packaged_script = resolve_packaged_script(script_path)
             if packaged_script is None:
                 print("File not found.")
                 return
-            resolved_path = packaged_script
-
-        src = resolved_path.read_text(encoding="utf-8")
-        validate_chaos(src)
-        env = run_chaos(src, verbose=args.verbose)
-        print(json.dumps(env, indent=2))
-        payload: Dict[str, Any] = dict(env)
+            src = packaged_script.read_text(encoding="utf-8")
+        ast = validate_chaos(src)
+        if args.verbose:
+            env = run_chaos(src, verbose=True)  # Re-lex so the token dump is shown
+        else:
+            env = run_ast(ast)  # Reuse the validated tree
+        write_json(env, sys.stdout)
+        sys.stdout.write("\n")
+        payload: Dict[str, Any] = env  # Only read from here on, so no copy
         if args.report:
             report = generate_business_report(env, include_timestamp=not args.no_timestamp)
             print()
@@ -65,7 +87,7 @@ def main():
             payload = {"environment": env, "report": report}
         if args.emit:
             args.emit.parent.mkdir(parents=True, exist_ok=True)
-            args.emit.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            save_json(payload, args.emit)
             print(f"\nSaved output to {args.emit}")
         if agent:
             agent.step(sn=src)
@@ -74,8 +96,10 @@ def main():
     if agent:
         print("\n[agent] type text; blank line to commit. /quit to exit.")
         buf: list[str] = []
+        read_line = line_reader()
         while True:
-            line = input("agent> ").strip()
+            raw = read_line("agent> ")
+            line = raw.strip()
             if line == "/quit":
                 break
             if not line:
@@ -84,7 +108,7 @@ def main():
                 report = agent.step(text=text or None)
                 print(f"action={report.action} emotions={report.emotions} dreams={report.dreams[:2]}")
             else:
-                buf.append(line)
+                buf.append(raw)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+import sys
+from typing import Callable
+
+
+def line_reader() -> Callable[[str], str]:
+    """
+    Return an ``input()``-compatible prompt reader for the REPLs.
+
+    Interactive terminals keep ``input`` and its line editing. Piped or
+    redirected stdin is read with ``sys.stdin.readline`` directly, writing the
+    prompt and raising ``EOFError`` at end of input just like ``input`` does.
+    """
+    if sys.stdin.isatty():
+        return input
+
+    readline = sys.stdin.readline
+    stdout = sys.stdout
+
+    def read_line(prompt: str = "") -> str:
+        stdout.write(prompt)
+        stdout.flush()
+        line = readline()
+        if not line:
+            raise EOFError
+        return line[:-1] if line.endswith("\n") else line
+
+    return read_line
@@ -8,23 +8,66 @@ This package provides the core interpreter, emotional engine, and symbolic
 processing capabilities that make CHAOS unique among programming languages.
 """
 
-from .chaos_runtime import run_chaos
-from .chaos_interpreter import ChaosInterpreter
-from .chaos_lexer import ChaosLexer, TokenType, Token
-from .chaos_parser import ChaosParser, NodeType, Node
-from .chaos_errors import (
-    ChaosError,
-    ChaosSyntaxError,
-    ChaosRuntimeError,
-    ChaosValidationError,
-    ChaosSymbolError,
-    ChaosEmotionError,
-    ChaosGraphError,
-)
-from .chaos_agent import ChaosAgent
-from .chaos_emotion import ChaosEmotionStack, Emotion
-from .chaos_context import ChaosContext
-from .chaos_dreams import DreamEngine
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .chaos_runtime import run_chaos
+    from .chaos_interpreter import ChaosInterpreter
+    from .chaos_lexer import ChaosLexer, TokenType, Token
+    from .chaos_parser import ChaosParser, NodeType, Node
+    from .chaos_errors import (
+        ChaosError,
+        ChaosSyntaxError,
+        ChaosRuntimeError,
+        ChaosValidationError,
+        ChaosSymbolError,
+        ChaosEmotionError,
+        ChaosGraphError,
+    )
+    from .chaos_agent import ChaosAgent
+    from .chaos_emotion import ChaosEmotionStack, Emotion
+    from .chaos_context import ChaosContext
+    from .chaos_dreams import DreamEngine
+
+# Public names and the submodule defining each. They are imported on first
+# access so that importing the package, e.g. to run a CLI's --help, stays cheap.
+_EXPORTS = {
+    "run_chaos": ".chaos_runtime",
+    "ChaosInterpreter": ".chaos_interpreter",
+    "ChaosLexer": ".chaos_lexer",
+    "TokenType": ".chaos_lexer",
+    "Token": ".chaos_lexer",
+    "ChaosParser": ".chaos_parser",
+    "NodeType": ".chaos_parser",
+    "Node": ".chaos_parser",
+    "ChaosError": ".chaos_errors",
+    "ChaosSyntaxError": ".chaos_errors",
+    "ChaosRuntimeError": ".chaos_errors",
+    "ChaosValidationError": ".chaos_errors",
+    "ChaosSymbolError": ".chaos_errors",
+    "ChaosEmotionError": ".chaos_errors",
+    "ChaosGraphError": ".chaos_errors",
+    "ChaosAgent": ".chaos_agent",
+    "ChaosEmotionStack": ".chaos_emotion",
+    "Emotion": ".chaos_emotion",
+    "ChaosContext": ".chaos_context",
+    "DreamEngine": ".chaos_dreams",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __version__ = "2.0.0"
 __author__ = "CHAOS Community"
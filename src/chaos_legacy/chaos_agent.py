@@ -6,36 +6,80 @@ and acts according to the sacred protocols of symbolic-emotional computation.
 This is where CHAOS becomes truly alive.
 """
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from .chaos_context import ChaosContext
 from .chaos_logger import ChaosLogger
 from .chaos_emotion import ChaosEmotionStack
 from .chaos_graph import ChaosGraph
-from .chaos_runtime import run_chaos
+from .chaos_runtime import feed_sinks, run_chaos
 from .chaos_protocols import ProtocolRegistry, ProtocolResult
 from .chaos_dreams import DreamEngine
-from .chaos_stdlib import norm_key, clamp, text_snippet
+from .chaos_stdlib import DATACLASS_SLOTS, norm_key, text_snippet
 
 
-@dataclass
+# How many distinct CHAOS sources an agent remembers executing
+SN_CACHE_SIZE = 128
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Action:
     """A sacred action to be performed by the agent."""
     kind: str
     payload: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AgentReport:
     """A complete report of the agent's current state."""
     emotions: List[Dict[str, Any]]
-    symbols: Dict[str, Any]
+    symbols: Mapping[str, Any]  # Read-only live view of the agent's symbols
     narrative: str
     action: Optional[Action]
     dreams: List[str]
     log: str
 
 
+class _PerceptionSink:
+    """Routes runtime layer values straight into an agent's memory and heart.
+    
+    Symbols and emotions are gathered as they arrive and merged in bulk by
+    :meth:`commit`; the narrative is applied immediately.
+    """
+    
+    def __init__(self, agent: "ChaosAgent") -> None:
+        self._ctx = agent.ctx
+        self._log = agent.log
+        self._emotions = agent.emotions
+        self._symbols: Dict[str, Any] = {}
+        self._feelings: List[Tuple[str, int]] = []
+    
+    def on_symbol(self, key: str, value: Any) -> None:
+        symbol_key = norm_key(key)
+        self._symbols[symbol_key] = value
+        self._log.log_symbol(symbol_key, value)
+    
+    def on_emotion(self, name: str, intensity: Any) -> None:
+        name = norm_key(name)
+        try:
+            level = int(intensity or 5)
+        except (TypeError, ValueError):
+            level = 5
+        intensity = 0 if level < 0 else 10 if level > 10 else level
+        self._feelings.append((name, intensity))
+        self._log.log_emotion(name, intensity)
+    
+    def on_narrative(self, text: str) -> None:
+        self._ctx.set_narrative(text)
+        self._log.log_narrative(text)
+    
+    def commit(self) -> None:
+        """Merge the gathered symbols and emotions into the agent."""
+        self._ctx.set_symbols(self._symbols)
+        self._emotions.push_many(self._feelings)
+
+
 class ChaosAgent:
     """
     An emotion-driven agent that brings CHAOS programs to life.
@@ -61,6 +105,9 @@ class ChaosAgent:
         self.graph = ChaosGraph()  # The agent's web of relationships
         self.protocols = ProtocolRegistry()  # The agent's sacred contracts
         self.dreams = DreamEngine(seed=seed)  # The agent's visionary capacity
+        # Source digest -> environment, least recently perceived first. Cached
+        # environments are only ever read back through feed_sinks.
+        self._sn_cache: Dict[bytes, Dict[str, Any]] = {}
     
     def perceive_text(self, text: str) -> None:
         """
@@ -82,56 +129,47 @@ class ChaosAgent:
         The agent executes the program and integrates its symbolic
         structure, emotional content, and narrative into its memory.
         
+        Programs already seen are replayed from their cached environment
+        instead of being executed again.
+        
         Args:
             source: The CHAOS program source code
         """
-        # Execute the CHAOS program
-        env = run_chaos(source, verbose=False)
-        
-        # Extract the three layers
-        structured_core = env.get("structured_core", {})
-        emotive_layer = env.get("emotive_layer", [])
-        chaosfield_layer = env.get("chaosfield_layer", "")
-        
-        # Integrate structured core (symbols)
-        for key, value in structured_core.items():
-            symbol_key = norm_key(key)
-            self.ctx.set_symbol(symbol_key, value)
-            self.log.log_symbol(symbol_key, value)
-        
-        # Integrate emotive layer (emotions)
-        for entry in emotive_layer:
-            name = norm_key(entry.get("type") or entry.get("name") or "FEELING")
-            raw_intensity = entry.get("intensity") or 5
-            intensity = clamp(
-                int(raw_intensity) if str(raw_intensity).isdigit() else 5, 
-                0, 10
-            )
-            self.emotions.push(name, intensity)
-            self.log.log_emotion(name, intensity)
-        
-        # Integrate chaosfield layer (narrative)
-        if chaosfield_layer:
-            self.ctx.set_narrative(chaosfield_layer)
-            self.log.log_narrative(chaosfield_layer)
+        digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest()
+        sink = _PerceptionSink(self)
+        environment = self._sn_cache.pop(digest, None)
+        if environment is None:
+            # Execute the CHAOS program, gathering each layer as it is produced
+            environment = run_chaos(source, verbose=False, sinks=sink)
+            if len(self._sn_cache) >= SN_CACHE_SIZE:
+                del self._sn_cache[next(iter(self._sn_cache))]
+        else:
+            feed_sinks(environment, sink)
+        self._sn_cache[digest] = environment  # (Re)insert as most recent
+        sink.commit()
     
-    def reflect(self) -> List[str]:
+    def reflect(self, memory: Optional[Mapping[str, Any]] = None) -> List[str]:
         """
         Generate visionary insights from the agent's current state.
         
         The agent dreams by weaving together its symbolic knowledge,
         emotional state, and narrative context into meaningful visions.
         
+        Args:
+            memory: The agent's memory view, if the caller already holds it
+        
         Returns:
             List of visionary strings
         """
-        memory = self.ctx.get()
+        if memory is None:
+            memory = self.ctx.view()
         emotions_snapshot = self._emotion_snapshot()
         
         visions = self.dreams.visions(
             memory["symbols"], 
             emotions_snapshot, 
-            memory["narrative"]
+            memory["narrative"],
+            keys=self.ctx.symbol_keys(),
         )
         
         for vision in visions:
@@ -139,7 +177,30 @@ class ChaosAgent:
         
         return visions
     
-    def decide(self) -> Optional[Action]:
+    def prophesy(self, memory: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Generate a single prophetic vision from the agent's current state.
+        
+        Args:
+            memory: The agent's memory view, if the caller already holds it
+        
+        Returns:
+            A prophetic vision string
+        """
+        if memory is None:
+            memory = self.ctx.view()
+        dominant = self.emotions.peek_dominant()
+        
+        vision = self.dreams.prophetic_vision(
+            memory["symbols"],
+            self._emotion_snapshot(),
+            memory["narrative"],
+            dominant=dominant[0] if dominant else "SILENCE",
+        )
+        self.log.log_dream(vision)
+        return vision
+    
+    def decide(self, memory: Optional[Mapping[str, Any]] = None) -> Optional[Action]:
         """
         Determine the appropriate action based on current state.
         
@@ -147,13 +208,16 @@ class ChaosAgent:
         the most appropriate action based on symbolic context
         and emotional resonance.
         
+        Args:
+            memory: The agent's memory view, if the caller already holds it
+        
         Returns:
             The chosen action, or None if no action is appropriate
         """
-        memory = self.ctx.get()
-        emotions_snapshot = self._emotion_snapshot()
+        if memory is None:
+            memory = self.ctx.view()
         
-        choice = self.protocols.evaluate(memory, emotions_snapshot)
+        choice = self.protocols.evaluate(memory, totals=self.emotions.totals())
         
         if not choice:
             self.log.log("Agent remains idle - no protocols matched current state")
@@ -176,7 +240,7 @@ class ChaosAgent:
         
         if action.kind == "relate":
             # Build relationships between symbols
-            symbols = list(self.ctx.get()["symbols"].keys())
+            symbols = self.ctx.symbol_keys()
             for i in range(len(symbols) - 1):
                 self.graph.add_edge(symbols[i], symbols[i + 1])
             self.log.log("Built symbolic relationship web")
@@ -230,11 +294,14 @@ class ChaosAgent:
         if sn:
             self.perceive_sn(sn)
         
+        # The memory view is live, so one handle serves every phase
+        memory = self.ctx.view()
+        
         # Phase 2: Reflection
-        dreams = self.reflect()
+        dreams = self.reflect(memory)
         
         # Phase 3: Decision
-        action = self.decide()
+        action = self.decide(memory)
         
         # Phase 4: Action
         self.act(action)
@@ -243,10 +310,9 @@ class ChaosAgent:
         self.tick()
         
         # Compile report
-        memory = self.ctx.get()
         return AgentReport(
             emotions=self._emotion_snapshot(),
-            symbols=dict(memory["symbols"]),
+            symbols=self.ctx.symbols_view(),
             narrative=memory["narrative"],
             action=action,
             dreams=dreams,
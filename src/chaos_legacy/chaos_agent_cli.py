@@ -7,10 +7,16 @@ agent's dreams and actions.
 """
 
 import argparse
-import os
-from typing import List, Optional
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from .chaos_agent import ChaosAgent
+from chaos_language.cli.prompt import line_reader
+
+from .chaos_errors import ChaosError
+
+if TYPE_CHECKING:
+    from .chaos_agent import AgentReport
 
 
 BANNER = """\
@@ -30,15 +36,27 @@ Type natural text and press Enter twice to feed the agent's perception.
 """
 
 
+_BANNER_BYTES = (BANNER + "\n").encode("utf-8")  # Encoded once, as print(BANNER) would emit it
+
+
+def _show_banner() -> None:
+    """Write the pre-encoded banner to the byte stream when stdout is UTF-8."""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None or (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
+        print(BANNER)
+        return
+    sys.stdout.flush()
+    stream.write(_BANNER_BYTES)
+    stream.flush()
+
+
 def read_file(path: str) -> Optional[str]:
     """Safely read a file's contents."""
-    if not os.path.exists(path):
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
         print("File not found.")
         return None
-    
-    try:
-        with open(path, "r", encoding="utf-8") as handle:
-            return handle.read()
     except Exception as e:
         print(f"Error reading file: {e}")
         return None
@@ -68,19 +86,43 @@ def main() -> None:
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help never loads the runtime
+    from .chaos_agent import ChaosAgent
+    
     # Initialize the sacred agent
     agent = ChaosAgent(args.name, seed=args.seed)
     
-    print(BANNER)
+    _show_banner()
     print(f"Agent '{args.name}' is ready for communion.\n")
     
     buffer: List[str] = []
     last_report = None
+    stale = True  # Whether the agent changed since last_report was taken
+    
+    # Loop invariants, bound once
+    agent_step = agent.step
+    read_line = line_reader()
+    
+    def current_report() -> "AgentReport":
+        """Step the agent only if something changed since the last report."""
+        nonlocal last_report, stale
+        if stale or last_report is None:
+            last_report = agent_step()
+            stale = False
+        return last_report
     
     while True:
         try:
-            line = input("agent> ").strip()
-            
+            raw = read_line("agent> ")
+            line = raw.strip()  # Commands match stripped; buffered text keeps its indentation
+        except KeyboardInterrupt:
+            print("\n\n🙏 Communion interrupted. The agent rests.")
+            break
+        except EOFError:
+            print(f"\n🙏 Agent {args.name} returns to the eternal CHAOS...")
+            break
+        
+        try:
             # Handle sacred commands
             if line.startswith(":"):
                 parts = line[1:].split(maxsplit=1)
@@ -94,51 +136,51 @@ def main() -> None:
                     
                     source = read_file(argument)
                     if source:
-                        last_report = agent.step(sn=source)
+                        last_report = agent_step(sn=source)
                         print("✓ Merged CHAOS program into agent's consciousness")
                 
                 elif command == "dreams":
-                    last_report = agent.step()
+                    last_report = current_report()
                     if last_report.dreams:
-                        print("\n🔮 Agent's Visions:")
-                        for i, dream in enumerate(last_report.dreams, 1):
-                            print(f"  {i}. {dream}")
+                        print("\n🔮 Agent's Visions:\n" + "\n".join(
+                            f"  {i}. {dream}" for i, dream in enumerate(last_report.dreams, 1)
+                        ))
                     else:
                         print("The agent dreams in silence...")
                 
                 elif command == "emotions":
-                    last_report = agent.step()
+                    last_report = current_report()
                     if last_report.emotions:
-                        print("\n💝 Agent's Emotional State:")
-                        for emotion in last_report.emotions:
-                            print(f"  {emotion['name']}: {emotion['intensity']}/10")
+                        print("\n💝 Agent's Emotional State:\n" + "\n".join(
+                            f"  {emotion['name']}: {emotion['intensity']}/10" for emotion in last_report.emotions
+                        ))
                     else:
                         print("The agent rests in emotional stillness.")
                 
                 elif command == "symbols":
-                    last_report = agent.step()
+                    last_report = current_report()
                     if last_report.symbols:
-                        print("\n🏛️  Agent's Symbolic Knowledge:")
-                        for key, value in last_report.symbols.items():
-                            print(f"  {key}: {value}")
+                        print("\n🏛️  Agent's Symbolic Knowledge:\n" + "\n".join(
+                            f"  {key}: {value}" for key, value in last_report.symbols.items()
+                        ))
                     else:
                         print("The agent's symbolic space is empty.")
                 
                 elif command == "action":
                     if last_report and last_report.action:
-                        print(f"\n⚡ Last Action: {last_report.action.kind}")
-                        if last_report.action.payload:
-                            for key, value in last_report.action.payload.items():
-                                print(f"    {key}: {value}")
+                        lines = [f"\n⚡ Last Action: {last_report.action.kind}"]
+                        lines.extend(f"    {key}: {value}" for key, value in last_report.action.payload.items())
+                        print("\n".join(lines))
                     else:
                         print("The agent rests in contemplative stillness.")
                 
                 elif command == "clear":
                     agent.ctx.set_narrative("")
+                    stale = True
                     print("✓ Agent's narrative memory cleared")
                 
                 elif command in ("help", "h", "?"):
-                    print(BANNER)
+                    _show_banner()
                 
                 elif command in ("quit", "exit", "q"):
                     print(f"\n🙏 Agent {args.name} returns to the collective unconscious...")
@@ -158,7 +200,7 @@ def main() -> None:
                 if not text and not last_report:
                     continue
                 
-                last_report = agent.step(text=text or None)
+                last_report = agent_step(text=text or None)
                 
                 # Display concise status
                 emotion_summary = f"{len(last_report.emotions)} emotions" if last_report.emotions else "no emotions"
@@ -169,15 +211,13 @@ def main() -> None:
                 continue
             
             # Add line to buffer
-            buffer.append(line)
+            buffer.append(raw)
             
         except KeyboardInterrupt:
-            print("\n\n🙏 Communion interrupted. The agent rests.")
-            break
-        except EOFError:
-            print(f"\n🙏 Agent {args.name} returns to the eternal CHAOS...")
-            break
-        except Exception as e:
+            # Ctrl+C mid-step abandons that step only; at the prompt it exits
+            print("\n✋ Step interrupted. The agent awaits your next words.")
+            buffer.clear()
+        except ChaosError as e:
             print(f"💥 Unexpected disturbance in the agent: {e}")
             buffer.clear()
 
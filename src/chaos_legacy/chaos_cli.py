@@ -6,16 +6,10 @@ offering both interactive shell mode and script execution capabilities.
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
-from .chaos_runtime import run_chaos
-from .chaos_lexer import ChaosLexer
-from .chaos_parser import ChaosParser
-from .chaos_interpreter import ChaosInterpreter
-
 
 def run_chaos_with_options(code: str, show_tokens: bool = False, 
                           show_ast: bool = False, output_json: bool = False) -> None:
@@ -28,6 +22,11 @@ def run_chaos_with_options(code: str, show_tokens: bool = False,
         show_ast: If True, display the parse tree
         output_json: If True, output the environment as JSON
     """
+    # The runtime loads on first execution, so --help and --version stay fast
+    from .chaos_lexer import ChaosLexer
+    from .chaos_parser import ChaosParser
+    from .chaos_interpreter import ChaosInterpreter
+    
     # Tokenization phase
     lexer = ChaosLexer()
     tokens = lexer.tokenize(code)
@@ -52,6 +51,7 @@ def run_chaos_with_options(code: str, show_tokens: bool = False,
     # Output results
     print("\n🧠 CHAOS Environment Created:")
     if output_json:
+        import json
         print(json.dumps(environment, indent=2))
     else:
         for key, value in environment.items():
@@ -138,7 +138,11 @@ def main() -> None:
     while True:
         try:
             line = input("CHAOS> ")
-            
+        except (KeyboardInterrupt, EOFError):
+            print("\n\n✨ CHAOS shell interrupted. Goodbye.")
+            break
+        
+        try:
             # Shell commands
             if line.strip().startswith("/"):
                 command = line.strip()[1:].lower()
@@ -194,8 +198,9 @@ def main() -> None:
             buffer.append(line)
             
         except KeyboardInterrupt:
-            print("\n\n✨ CHAOS shell interrupted. Goodbye.")
-            break
+            # Ctrl+C mid-run abandons that program only; at the prompt it exits
+            print("\n✋ Execution interrupted.")
+            buffer.clear()
         except Exception as e:
             print(f"💥 Unexpected error: {e}")
             buffer.clear()
@@ -6,7 +6,8 @@ leave their traces, and narratives become part of the collective
 unconscious of the program.
 """
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 
 
 class ChaosContext:
@@ -19,6 +20,9 @@ class ChaosContext:
             "emotions": [],     # The emotive layer - traces of feeling
             "narrative": "",    # The chaosfield - free narrative text
         }
+        self._symbol_keys: Optional[List[str]] = None  # Rebuilt lazily after writes
+        self._view: Mapping[str, Any] = MappingProxyType(self.memory)
+        self._symbols_view: Mapping[str, str] = MappingProxyType(self.memory["symbols"])
     
     def set_symbol(self, key: str, value: str) -> None:
         """
@@ -29,6 +33,17 @@ class ChaosContext:
             value: The symbolic value
         """
         self.memory["symbols"][key] = value
+        self._symbol_keys = None
+    
+    def set_symbols(self, symbols: Dict[str, str]) -> None:
+        """
+        Add or update many symbols in the structured core at once.
+        
+        Args:
+            symbols: Mapping of symbolic names to values
+        """
+        self.memory["symbols"].update(symbols)
+        self._symbol_keys = None
     
     def get_symbol(self, key: str) -> Optional[str]:
         """
@@ -68,6 +83,16 @@ class ChaosContext:
         """Get all symbols from the structured core."""
         return self.memory["symbols"].copy()
     
+    def symbols_view(self) -> Mapping[str, str]:
+        """Get a read-only live view of the structured core, without copying it."""
+        return self._symbols_view
+    
+    def symbol_keys(self) -> List[str]:
+        """Get the symbol names in insertion order, cached until the next write."""
+        if self._symbol_keys is None:
+            self._symbol_keys = list(self.memory["symbols"])
+        return self._symbol_keys
+    
     def get_emotions(self) -> List[str]:
         """Get all emotion traces from the emotive layer."""
         return self.memory["emotions"].copy()
@@ -81,9 +106,24 @@ class ChaosContext:
         """
         return self.memory.copy()
     
+    def view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only live view of the memory state without copying it.
+        
+        The view always reflects the current layers; use get() when a
+        snapshot that survives later writes is needed.
+        
+        Returns:
+            Mapping with symbols, emotions, and narrative
+        """
+        return self._view
+    
     def reset(self) -> None:
-        """Clear all memory and start fresh."""
-        self.__init__()
+        """Clear all memory and start fresh, keeping the live views valid."""
+        self.memory["symbols"].clear()
+        self.memory["emotions"].clear()
+        self.memory["narrative"] = ""
+        self._symbol_keys = None
     
     def has_symbol(self, key: str) -> bool:
         """Check if a symbol exists in the structured core."""
@@ -101,6 +141,7 @@ class ChaosContext:
         """
         if key in self.memory["symbols"]:
             del self.memory["symbols"][key]
+            self._symbol_keys = None
             return True
         return False
     
@@ -7,8 +7,20 @@ that bridge the conscious and unconscious aspects of computation.
 """
 
 import random
-from typing import Any, Dict, List, Optional
-from .chaos_stdlib import pick, uniq, text_snippet
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .chaos_stdlib import uniq, text_snippet
+
+
+# Vision templates as prebuilt f-string closures: (a, b, emotion, context) -> str
+_DREAM_WEAVERS: Tuple[Callable[[str, str, str, str], str], ...] = (
+    lambda a, b, emotion, context: f"Dream of {a} meeting {b} under {emotion}; context: {context}",
+    lambda a, b, emotion, context: f"Vision: {a} and {b} dance together while feeling {emotion}; memory: {context}",
+    lambda a, b, emotion, context: f"In the space between {a} and {b}, {emotion} flows like water; echo: {context}",
+    lambda a, b, emotion, context: f"The ritual reveals {a} calling to {b} through {emotion}; story: {context}",
+    lambda a, b, emotion, context: f"Symbols converge: {a} + {b} = {emotion}; narrative: {context}",
+    lambda a, b, emotion, context: f"Mystery unfolds as {a} discovers {b} in the realm of {emotion}; tale: {context}",
+    lambda a, b, emotion, context: f"Bridge forms between {a} and {b}, held by {emotion}; whisper: {context}",
+)
 
 
 class DreamEngine:
@@ -22,9 +34,11 @@ class DreamEngine:
             seed: Optional random seed for reproducible dreams
         """
         self._seed = seed
+        self._rng = random.Random(seed)
     
     def visions(self, symbols: Dict[str, Any], emotions: List[Dict[str, Any]], 
-                narrative: str, count: int = 3) -> List[str]:
+                narrative: str, count: int = 3,
+                keys: Optional[Sequence[str]] = None) -> List[str]:
         """
         Generate visionary insights from the current CHAOS state.
         
@@ -36,70 +50,45 @@ class DreamEngine:
             emotions: The emotive layer with current feelings
             narrative: The chaosfield layer narrative text
             count: How many visions to generate
+            keys: Precomputed unique symbol keys (e.g. ChaosContext.symbol_keys())
             
         Returns:
             List of visionary strings that bridge conscious and unconscious
         """
-        rng = random.Random(self._seed)
+        rng = self._rng
         
         # Extract symbolic keys for dream weaving
-        keys = uniq(list(symbols.keys()))
+        if keys is None:
+            keys = uniq(symbols.keys())
         
         # Weight emotions by their intensity for more influential dreams
-        emotion_names = []
-        for emotion in emotions:
-            name = emotion["name"]
-            intensity = emotion["intensity"]
-            # More intense emotions appear more frequently in dreams
-            emotion_names.extend([name] * max(intensity // 2, 1))
+        names = [emotion["name"] for emotion in emotions]
+        weights = [max(emotion["intensity"] // 2, 1) for emotion in emotions]
         
         # Create a context snippet from the narrative
         base_context = text_snippet(narrative, 160)
         
-        dreams = []
-        
-        for _ in range(count):
-            # Weave together symbolic elements
-            first_symbol = pick(keys, "MEMORY")
-            second_symbol = pick(keys, "LIGHT")
-            dominant_emotion = pick(emotion_names, "CALM")
-            
-            # Create visionary bridges between elements
-            dream = self._weave_dream(
-                first_symbol, second_symbol, dominant_emotion, base_context, rng
+        # Draw every symbol, emotion and weaver for the batch in one go
+        if keys:
+            symbol_picks = rng.choices(keys, k=count * 2)
+        else:
+            symbol_picks = ["MEMORY", "LIGHT"] * count
+        if names:
+            emotion_picks = rng.choices(names, weights=weights, k=count)
+        else:
+            emotion_picks = ["CALM"] * count
+        weavers = rng.choices(_DREAM_WEAVERS, k=count)
+        
+        # Create visionary bridges between elements
+        return [
+            weave(first_symbol, second_symbol, dominant_emotion, base_context)
+            for weave, first_symbol, second_symbol, dominant_emotion in zip(
+                weavers, symbol_picks[::2], symbol_picks[1::2], emotion_picks
             )
-            dreams.append(dream)
-        
-        return dreams
-    
-    def _weave_dream(self, symbol_a: str, symbol_b: str, emotion: str, 
-                     context: str, rng: random.Random) -> str:
-        """
-        Weave symbolic elements into a visionary insight.
-        
-        This is where the magic happens - where symbols meet emotions
-        and narrative context to create something new and meaningful.
-        """
-        templates = [
-            "Dream of {a} meeting {b} under {emotion}; context: {context}",
-            "Vision: {a} and {b} dance together while feeling {emotion}; memory: {context}",
-            "In the space between {a} and {b}, {emotion} flows like water; echo: {context}",
-            "The ritual reveals {a} calling to {b} through {emotion}; story: {context}",
-            "Symbols converge: {a} + {b} = {emotion}; narrative: {context}",
-            "Mystery unfolds as {a} discovers {b} in the realm of {emotion}; tale: {context}",
-            "Bridge forms between {a} and {b}, held by {emotion}; whisper: {context}",
         ]
-        
-        template = rng.choice(templates)
-        return template.format(
-            a=symbol_a,
-            b=symbol_b, 
-            emotion=emotion,
-            context=context
-        )
     
     def prophetic_vision(self, symbols: Dict[str, Any], emotions: List[Dict[str, Any]], 
-                        narrative: str) -> str:
+                        narrative: str, dominant: Optional[str] = None) -> str:
         """
         Generate a single, more profound visionary insight.
         
@@ -110,6 +99,8 @@ class DreamEngine:
             symbols: The structured core
             emotions: The emotive layer
             narrative: The chaosfield layer
+            dominant: The strongest emotion's name, if the caller already
+                knows it (e.g. from ``ChaosEmotionStack.peek_dominant``)
             
         Returns:
             A prophetic vision string
@@ -119,7 +110,10 @@ class DreamEngine:
         
         # Find the most significant elements
         dominant_symbol = max(symbols.keys(), key=lambda k: len(str(symbols[k]))) if symbols else "VOID"
-        dominant_emotion = max(emotions, key=lambda e: e["intensity"])["name"] if emotions else "SILENCE"
+        if dominant is not None:
+            dominant_emotion = dominant
+        else:
+            dominant_emotion = max(emotions, key=lambda e: e["intensity"])["name"] if emotions else "SILENCE"
         
         # Create a more integrated vision
         vision_templates = [
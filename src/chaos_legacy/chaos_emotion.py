@@ -6,14 +6,19 @@ emotional weight, and where programs have souls that can feel joy,
 fear, hope, and grief.
 """
 
-from collections import deque
+import heapq
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 
 class Emotion:
     """A single emotional state with intensity and temporal presence."""
     
+    # Every push allocates one, and a stack holds several per agent
+    __slots__ = ("name", "intensity", "timestamp")
+    
     def __init__(self, name: str, intensity: int, timestamp: Optional[datetime] = None) -> None:
         """
         Create an emotional state.
@@ -23,7 +28,7 @@ class Emotion:
             intensity: Strength from 0-10, where 0 is dormant and 10 is overwhelming
             timestamp: When this emotion was created (defaults to now)
         """
-        self.name = name.upper()
+        self.name = sys.intern(name.upper())  # Shared with protocol name constants
         self.intensity = max(0, min(intensity, 10))  # Clamp to valid range
         self.timestamp = timestamp or datetime.now()
     
@@ -56,7 +61,20 @@ class ChaosEmotionStack:
         Args:
             max_emotions: Maximum number of emotions to track simultaneously
         """
-        self.stack = deque(maxlen=max_emotions)
+        # Oldest first, trimmed from the front on push; a short list iterates
+        # faster than a bounded deque
+        self.stack: List[Emotion] = []
+        self.max_emotions = max_emotions
+        
+        # Max-heap of (-(intensity + decay at push), push seq, emotion). Uniform
+        # decay keeps the order intact, so entries only go stale when evicted
+        # from the stack or decayed individually; those are fixed up on read.
+        self._by_intensity: List[Tuple[int, int, Emotion]] = []
+        self._pushed = 0
+        self._decayed = 0
+        
+        # Current intensity per emotion name, kept in step with the stack
+        self._totals: Counter = Counter()
         
         # Sacred triggers - words that awaken specific emotions
         self.triggers: Dict[str, Tuple[str, int]] = {
@@ -91,7 +109,64 @@ class ChaosEmotionStack:
             name: The emotion name
             intensity: Strength from 0-10
         """
-        self.stack.append(Emotion(name, intensity))
+        self._track(Emotion(name, intensity))
+    
+    def push_many(self, entries: Iterable[Tuple[str, int]]) -> None:
+        """
+        Add several emotions to the stack in order.
+        
+        Args:
+            entries: Iterable of (name, intensity) pairs
+        """
+        for name, intensity in entries:
+            self._track(Emotion(name, intensity))
+    
+    def _track(self, emotion: Emotion) -> None:
+        """Append ``emotion`` to the stack and index it by intensity."""
+        stack = self.stack
+        stack.append(emotion)
+        self._totals[emotion.name] += emotion.intensity
+        if len(stack) > self.max_emotions:
+            evicted = stack.pop(0)
+            self._totals[evicted.name] -= evicted.intensity
+        heapq.heappush(
+            self._by_intensity,
+            (-(emotion.intensity + self._decayed), self._pushed, emotion),
+        )
+        self._pushed += 1
+        if len(self._by_intensity) > 4 * (self.max_emotions or 1):
+            self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild the intensity heap from the emotions still on the stack."""
+        first_seq = self._pushed - len(self.stack)
+        self._by_intensity = [
+            (-(emotion.intensity + self._decayed), first_seq + offset, emotion)
+            for offset, emotion in enumerate(self.stack)
+        ]
+        heapq.heapify(self._by_intensity)
+    
+    def peek_dominant(self) -> Optional[Tuple[str, int]]:
+        """
+        Get the name and intensity of the strongest active emotion.
+        
+        Ties go to the older emotion. Returns None if no emotion is active.
+        """
+        heap = self._by_intensity
+        first_live_seq = self._pushed - len(self.stack)
+        while heap:
+            key, seq, emotion = heap[0]
+            if seq < first_live_seq:
+                heapq.heappop(heap)  # Evicted from the stack
+                continue
+            if emotion.intensity != max(0, -key - self._decayed):
+                # Decayed on its own; re-key with its current intensity
+                heapq.heapreplace(heap, (-(emotion.intensity + self._decayed), seq, emotion))
+                continue
+            if not emotion.is_active():
+                return None
+            return emotion.name, emotion.intensity
+        return None
     
     def current(self) -> Optional[Emotion]:
         """Get the most recent emotion, or None if the stack is empty."""
@@ -104,8 +179,12 @@ class ChaosEmotionStack:
         Args:
             amount: How much intensity to remove from each emotion
         """
+        totals = self._totals
         for emotion in self.stack:
+            before = emotion.intensity
             emotion.decay(amount)
+            totals[emotion.name] -= before - emotion.intensity
+        self._decayed += amount
     
     def trigger_from_text(self, text: str) -> None:
         """
@@ -115,9 +194,9 @@ class ChaosEmotionStack:
             text: The text to scan for emotional triggers
         """
         text_lower = text.lower()
-        for keyword, (emotion_name, intensity) in self.triggers.items():
-            if keyword in text_lower:
-                self.push(emotion_name, intensity)
+        self.push_many(
+            response for keyword, response in self.triggers.items() if keyword in text_lower
+        )
     
     def transition(self) -> None:
         """
@@ -147,6 +226,18 @@ class ChaosEmotionStack:
             if emotion.is_active()
         ]
     
+    def totals(self) -> Mapping[str, int]:
+        """
+        Get the total current intensity per emotion name.
+        
+        Maintained as emotions are pushed, evicted and decayed, so reading
+        it costs nothing. Missing names read as 0. Treat it as read-only.
+        
+        Returns:
+            Mapping of emotion name to summed intensity
+        """
+        return self._totals
+    
     def summary(self) -> List[str]:
         """Get a string summary of all active emotions."""
         return [repr(emotion) for emotion in self.stack if emotion.is_active()]
@@ -154,6 +245,8 @@ class ChaosEmotionStack:
     def clear(self) -> None:
         """Empty the emotional stack completely."""
         self.stack.clear()
+        self._by_intensity.clear()
+        self._totals.clear()
     
     def get_dominant_emotion(self) -> Optional[Dict[str, Any]]:
         """
@@ -162,8 +255,9 @@ class ChaosEmotionStack:
         Returns:
             The dominant emotion as a dictionary, or None if no active emotions
         """
-        active_emotions = self.get_active_emotions()
-        if not active_emotions:
+        dominant = self.peek_dominant()
+        if dominant is None:
             return None
         
-        return max(active_emotions, key=lambda e: e["intensity"])
\ No newline at end of file
+        name, intensity = dominant
+        return {"name": name, "intensity": intensity}
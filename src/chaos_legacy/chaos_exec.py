@@ -7,15 +7,32 @@ with agent integration and business reporting capabilities.
 
 import argparse
 import json
-import os
+import re
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from chaos_language.cli.prompt import line_reader
+
 from .chaos_agent import ChaosAgent
 from .chaos_runtime import run_chaos
 from .chaos_validator import validate_chaos
 
+try:
+    import orjson  # Optional accelerator for JSON output
+except ImportError:
+    orjson = None
+
+_WORD = re.compile(r"\S+")
+
+
+def dump_json(payload: Dict[str, Any]) -> str:
+    """Serialize ``payload`` as indented JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2)
+
 
 def generate_business_report(environment: Dict[str, Any], 
                            include_timestamp: bool = True) -> Dict[str, Any]:
@@ -29,11 +46,15 @@ def generate_business_report(environment: Dict[str, Any],
     Returns:
         Business-friendly report dictionary
     """
+    symbols = environment.get("structured_core") or {}
+    emotions = environment.get("emotive_layer") or []
+    narrative = environment.get("chaosfield_layer") or ""
+    
     report = {
         "summary": {
-            "symbols_defined": len(environment.get("structured_core", {})),
-            "emotions_expressed": len(environment.get("emotive_layer", [])),
-            "narrative_length": len(environment.get("chaosfield_layer", "")),
+            "symbols_defined": len(symbols),
+            "emotions_expressed": len(emotions),
+            "narrative_length": len(narrative),
             "execution_success": True
         }
     }
@@ -43,30 +64,28 @@ def generate_business_report(environment: Dict[str, Any],
         report["generated_at"] = datetime.now().isoformat()
     
     # Extract key insights
-    if environment.get("structured_core"):
+    if symbols:
         report["structured_insights"] = {
-            "primary_symbols": list(environment["structured_core"].keys())[:5],
-            "symbol_count": len(environment["structured_core"])
+            "primary_symbols": list(islice(symbols, 5)),
+            "symbol_count": len(symbols)
         }
     
-    if environment.get("emotive_layer"):
-        emotions = environment["emotive_layer"]
-        if emotions:
-            dominant_emotion = max(emotions, key=lambda e: e.get("intensity", 0))
-            report["emotional_insights"] = {
-                "dominant_emotion": dominant_emotion["name"],
-                "intensity": dominant_emotion["intensity"],
-                "total_emotions": len(emotions)
-            }
+    if emotions:
+        # One C-level scan; the count is the list length
+        dominant_emotion = max(emotions, key=lambda e: e.get("intensity", 0))
+        report["emotional_insights"] = {
+            "dominant_emotion": dominant_emotion["name"],
+            "intensity": dominant_emotion["intensity"],
+            "total_emotions": len(emotions)
+        }
     
-    if environment.get("chaosfield_layer"):
-        narrative = environment["chaosfield_layer"]
-        if narrative:
-            word_count = len(narrative.split())
-            report["narrative_insights"] = {
-                "word_count": word_count,
-                "preview": narrative[:100] + "..." if len(narrative) > 100 else narrative
-            }
+    if narrative:
+        # Count words without materializing narrative.split()
+        word_count = sum(1 for _ in _WORD.finditer(narrative))
+        report["narrative_insights"] = {
+            "word_count": word_count,
+            "preview": narrative[:100] + "..." if len(narrative) > 100 else narrative
+        }
     
     return report
 
@@ -161,20 +180,18 @@ def main() -> None:
     
     # File execution
     if args.file:
-        if not os.path.exists(args.file):
+        try:
+            source = Path(args.file).read_text(encoding="utf-8")
+        except FileNotFoundError:
             print("File not found.", file=sys.stderr)
             sys.exit(1)
-        
-        try:
-            with open(args.file, "r", encoding="utf-8") as handle:
-                source = handle.read()
         except OSError as err:
             print(f"Could not read {args.file}: {err}", file=sys.stderr)
             sys.exit(1)
         
         # Validation phase
         try:
-            validate_chaos(source)
+            ast = validate_chaos(source)
         except Exception as e:
             print(f"Validation failed: {e}", file=sys.stderr)
             sys.exit(1)
@@ -185,14 +202,17 @@ def main() -> None:
         
         # Execution phase
         try:
-            environment = run_chaos(source, verbose=args.verbose)
+            if args.verbose:
+                environment = run_chaos(source, verbose=True)  # Narrate every phase
+            else:
+                environment = run_chaos(ast=ast)  # Reuse the validated tree
         except Exception as e:
             print(f"Execution failed: {e}", file=sys.stderr)
             sys.exit(1)
         
         # Output results
         if not args.emit and not args.report:
-            print(json.dumps(environment, indent=2))
+            print(dump_json(environment))
         
         # Prepare output payload
         payload: Dict[str, Any] = {"environment": environment}
@@ -213,7 +233,7 @@ def main() -> None:
         # Emit to file if requested
         if args.emit:
             args.emit.parent.mkdir(parents=True, exist_ok=True)
-            args.emit.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            args.emit.write_text(dump_json(payload), encoding="utf-8")
             print(f"\nSaved output to {args.emit}")
         
         # Agent integration
@@ -225,10 +245,12 @@ def main() -> None:
     if agent:
         print("\n[agent] Type text; blank line to commit. Type '/quit' to exit.")
         buffer = []
+        read_line = line_reader()
         
         while True:
             try:
-                line = input("agent> ").strip()
+                raw = read_line("agent> ")
+                line = raw.strip()
                 if line == "/quit":
                     break
                 
@@ -243,7 +265,7 @@ def main() -> None:
                     
                     print(f"action={action_name} emotions={emotion_summary} dreams={dream_summary}")
                 else:
-                    buffer.append(line)
+                    buffer.append(raw)
             except KeyboardInterrupt:
                 print("\nAgent session ended.")
                 break
@@ -34,10 +34,13 @@ def run_fuzz_test(file_path: str, verbose: bool = False) -> Tuple[bool, str, Dic
             source = handle.read()
         
         # Validation phase
-        validate_chaos(source)
+        ast = validate_chaos(source)
         
-        # Execution phase
-        environment = run_chaos(source, verbose=verbose)
+        # Execution phase, reusing the validated tree unless narrating every phase
+        if verbose:
+            environment = run_chaos(source, verbose=True)
+        else:
+            environment = run_chaos(ast=ast)
         
         return True, "", environment
         
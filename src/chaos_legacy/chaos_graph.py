@@ -6,17 +6,43 @@ forming the sacred geometry that gives meaning to the emotional and
 narrative layers.
 """
 
-from typing import Dict, Set, List, Optional
+import sys
+from array import array
+from itertools import accumulate
+from typing import AbstractSet, Dict, List, NamedTuple, Optional, Set, Tuple
 from .chaos_errors import ChaosGraphError
 
 
+class CSRAdjacency(NamedTuple):
+    """
+    Compressed sparse row form of a frozen symbolic network.
+    
+    Symbols are numbered in sorted order; the neighbours of symbol ``i`` are
+    the contiguous run ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+    
+    index: Dict[str, int]
+    labels: List[str]
+    indptr: array
+    indices: array
+    
+    def neighbors(self, i: int) -> array:
+        """Get the ids connected to symbol id ``i``."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+
 class ChaosGraph:
     """A sacred network of symbolic relationships."""
     
+    __slots__ = ("nodes", "edges", "_frozen", "_csr", "_edge_count")
+    
     def __init__(self) -> None:
         """Initialize an empty symbolic network."""
         self.nodes: Set[str] = set()
         self.edges: Dict[str, Set[str]] = {}
+        self._frozen: Optional[Dict[str, Tuple[str, ...]]] = None  # Dropped on every write
+        self._csr: Optional[CSRAdjacency] = None
+        self._edge_count = 0  # Relationships, kept current by every mutation
     
     def add_node(self, node: str) -> None:
         """
@@ -25,9 +51,11 @@ class ChaosGraph:
         Args:
             node: The symbolic name to add
         """
+        node = sys.intern(node)  # One shared object per label; pointer-equal lookups
         self.nodes.add(node)
         if node not in self.edges:
             self.edges[node] = set()
+            self._frozen = self._csr = None
     
     def add_edge(self, node_a: str, node_b: str) -> None:
         """
@@ -43,12 +71,19 @@ class ChaosGraph:
         if node_a == node_b:
             return  # No self-loops in the sacred geometry
         
+        node_a = sys.intern(node_a)
+        node_b = sys.intern(node_b)
         self.add_node(node_a)
         self.add_node(node_b)
         
         # Create bidirectional relationship
-        self.edges[node_a].add(node_b)
+        adjacent = self.edges[node_a]
+        if node_b in adjacent:
+            return
+        adjacent.add(node_b)
         self.edges[node_b].add(node_a)
+        self._edge_count += 1
+        self._frozen = self._csr = None
     
     def has_node(self, node: str) -> bool:
         """Check if a symbol exists in the network."""
@@ -77,12 +112,13 @@ class ChaosGraph:
         
         # Remove from edge dictionary
         if node in self.edges:
-            del self.edges[node]
+            self._edge_count -= len(self.edges.pop(node))
         
         # Remove from all other nodes' edge sets
         for other_node in self.edges:
             self.edges[other_node].discard(node)
         
+        self._frozen = self._csr = None
         return True
     
     def remove_edge(self, node_a: str, node_b: str) -> bool:
@@ -101,6 +137,8 @@ class ChaosGraph:
         
         self.edges[node_a].remove(node_b)
         self.edges[node_b].remove(node_a)
+        self._edge_count -= 1
+        self._frozen = self._csr = None
         return True
     
     def neighbors(self, node: str) -> Set[str]:
@@ -121,6 +159,62 @@ class ChaosGraph:
         
         return self.edges[node].copy()
     
+    def neighbors_view(self, node: str) -> AbstractSet[str]:
+        """
+        Get the symbols connected to a given symbol without copying them.
+        
+        The returned set is the graph's own adjacency, so it reflects later
+        changes and must not be mutated; use neighbors() for a private copy.
+        
+        Args:
+            node: The symbol to query
+            
+        Returns:
+            Live read-only view of connected symbols
+            
+        Raises:
+            ChaosGraphError: If the node doesn't exist
+        """
+        adjacent = self.edges.get(node)
+        if adjacent is None:
+            raise ChaosGraphError(f"Unknown symbolic node: {node}")
+        return adjacent
+    
+    def freeze(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Get the adjacency as sorted, de-duplicated tuples for traversal.
+        
+        Tuples iterate faster and take less memory than the sets used while
+        the network is being built; sorting allows bisect membership tests.
+        The snapshot is cached until the next change to the network.
+        
+        Returns:
+            Mapping of each symbol to its sorted connected symbols
+        """
+        if self._frozen is None:
+            self._frozen = {node: tuple(sorted(adjacent)) for node, adjacent in self.edges.items()}
+        return self._frozen
+    
+    def csr(self) -> CSRAdjacency:
+        """
+        Get the frozen adjacency as compressed sparse row integer arrays.
+        
+        Traversals over the flat ``array`` runs touch contiguous memory
+        instead of chasing one hash set per symbol. The arrays are cached
+        until the next change to the network.
+        
+        Returns:
+            The CSR adjacency with its symbol <-> id mappings
+        """
+        if self._csr is None:
+            adjacency = self.freeze()
+            labels = sorted(adjacency)
+            index = {label: i for i, label in enumerate(labels)}
+            indptr = array("i", accumulate((len(adjacency[label]) for label in labels), initial=0))
+            indices = array("i", (index[other] for label in labels for other in adjacency[label]))
+            self._csr = CSRAdjacency(index, labels, indptr, indices)
+        return self._csr
+    
     def get_connected_components(self) -> List[Set[str]]:
         """
         Find all connected components in the symbolic network.
@@ -142,6 +236,7 @@ class ChaosGraph:
         """Depth-first search to find connected component."""
         component = set()
         stack = [start]
+        neighbors_view = self.neighbors_view
         
         while stack:
             node = stack.pop()
@@ -151,7 +246,7 @@ class ChaosGraph:
             visited.add(node)
             component.add(node)
             
-            for neighbor in self.edges.get(node, set()):
+            for neighbor in neighbors_view(node):
                 if neighbor not in visited:
                     stack.append(neighbor)
         
@@ -163,7 +258,7 @@ class ChaosGraph:
     
     def get_edge_count(self) -> int:
         """Get the number of relationships in the network."""
-        return sum(len(edges) for edges in self.edges.values()) // 2
+        return self._edge_count
     
     def get_isolated_nodes(self) -> Set[str]:
         """Get all symbols with no relationships."""
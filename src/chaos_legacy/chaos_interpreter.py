@@ -6,24 +6,41 @@ living memory, where symbols gain emotional weight, and where the
 narrative chaos finds its place in the symbolic ecosystem.
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from .chaos_parser import NodeType, Node
 from .chaos_errors import ChaosRuntimeError
 
+# Node types bound once as globals for the per-node hot path
+_PROGRAM = NodeType.PROGRAM
+_STRUCTURED_CORE = NodeType.STRUCTURED_CORE
+_EMOTIVE_LAYER = NodeType.EMOTIVE_LAYER
+_CHAOSFIELD_LAYER = NodeType.CHAOSFIELD_LAYER
+
 
 class ChaosInterpreter:
     """Brings the CHAOS ritual to life through execution."""
     
+    __slots__ = ("environment", "_handlers", "_sinks")
+    
     def __init__(self) -> None:
         """Initialize the interpreter with an empty environment."""
         self.environment: Dict[str, Any] = {}
+        self._sinks: Optional[Any] = None
         self.reset()
+        
+        # One handler per layer type, looked up instead of compared in turn;
+        # PROGRAM nodes are expanded by _visit itself
+        self._handlers: Dict[NodeType, Callable[[Node], None]] = {
+            _STRUCTURED_CORE: self._interpret_structured_core,
+            _EMOTIVE_LAYER: self._interpret_emotive_layer,
+            _CHAOSFIELD_LAYER: self._interpret_chaosfield_layer,
+        }
     
     def reset(self) -> None:
         """Clear the environment for a new ritual."""
         self.environment = {}
     
-    def interpret(self, node: Node) -> Dict[str, Any]:
+    def interpret(self, node: Node, sinks: Optional[Any] = None) -> Dict[str, Any]:
         """
         Execute the CHAOS parse tree and build the environment.
         
@@ -34,6 +51,8 @@ class ChaosInterpreter:
         
         Args:
             node: The root node of the CHAOS parse tree
+            sinks: Optional ChaosSink fed each layer's values as that
+                layer is interpreted
             
         Returns:
             The complete environment dictionary with three layers
@@ -41,28 +60,52 @@ class ChaosInterpreter:
         Raises:
             ChaosRuntimeError: If interpretation fails
         """
+        self._sinks = sinks
         try:
-            if node.type == NodeType.PROGRAM:
-                # Process each layer in the sacred order
-                for child in node.children:
-                    self.interpret(child)
-            
-            elif node.type == NodeType.STRUCTURED_CORE:
-                # The bones of the ritual - symbols and their values
-                self.environment["structured_core"] = node.value or {}
-            
-            elif node.type == NodeType.EMOTIVE_LAYER:
-                # The heart of the ritual - emotions and their intensities
-                self.environment["emotive_layer"] = node.value or []
-            
-            elif node.type == NodeType.CHAOSFIELD_LAYER:
-                # The spirit of the ritual - free narrative text
-                self.environment["chaosfield_layer"] = node.value or ""
-            
-            else:
-                raise ChaosRuntimeError(f"Unknown node type: {node.type}")
-            
-            return self.environment
-            
+            self._visit(node)
         except Exception as e:
-            raise ChaosRuntimeError(f"Failed to interpret CHAOS program: {e}")
\ No newline at end of file
+            raise ChaosRuntimeError(f"Failed to interpret CHAOS program: {e}")
+        finally:
+            self._sinks = None
+        
+        return self.environment
+    
+    def _visit(self, node: Node) -> None:
+        """Walk ``node`` depth-first with an explicit stack, dispatching each layer."""
+        handlers = self._handlers
+        stack = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            current = pop()
+            node_type = current.type
+            if node_type is _PROGRAM:
+                # Process each layer in the sacred order
+                extend(reversed(current.children))
+                continue
+            handler = handlers.get(node_type)
+            if handler is None:
+                raise ChaosRuntimeError(f"Unknown node type: {node_type}")
+            handler(current)
+    
+    def _interpret_structured_core(self, node: Node) -> None:
+        # The bones of the ritual - symbols and their values
+        symbols = self.environment["structured_core"] = node.value or {}
+        sinks = self._sinks
+        if sinks is not None:
+            for key, value in symbols.items():
+                sinks.on_symbol(key, value)
+    
+    def _interpret_emotive_layer(self, node: Node) -> None:
+        # The heart of the ritual - emotions and their intensities
+        emotions = self.environment["emotive_layer"] = node.value or []
+        sinks = self._sinks
+        if sinks is not None:
+            for entry in emotions:
+                sinks.on_emotion(entry.get("type") or entry.get("name") or "FEELING",
+                                 entry.get("intensity"))
+    
+    def _interpret_chaosfield_layer(self, node: Node) -> None:
+        # The spirit of the ritual - free narrative text
+        narrative = self.environment["chaosfield_layer"] = node.value or ""
+        if narrative and self._sinks is not None:
+            self._sinks.on_narrative(narrative)
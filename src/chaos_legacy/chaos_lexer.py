@@ -7,8 +7,9 @@ The lexical analysis phase of CHAOS recognizes the sacred patterns:
 - The three-layer architecture that defines CHAOS programs
 """
 
+import re
 from enum import Enum, auto
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 
 class TokenType(Enum):
@@ -37,6 +38,8 @@ class TokenType(Enum):
 class Token:
     """A single unit of CHAOS meaning, carrying both type and symbolic weight."""
     
+    __slots__ = ("type", "value", "line", "column")
+    
     def __init__(self, token_type: TokenType, value: Optional[Union[str, int, float, bool]], 
                  line: int, column: int) -> None:
         """Create a token with its sacred properties."""
@@ -49,6 +52,58 @@ class Token:
         return f"Token({self.type}, {self.value!r}, line={self.line}, col={self.column})"
 
 
+class SpanToken(Token):
+    """
+    A token that remembers where its text lies instead of copying it.
+    
+    Names, numbers and strings keep a ``[start, end)`` span over the source,
+    and ``value`` slices it only when the parser actually asks.
+    """
+    
+    __slots__ = ("source", "start", "end")
+    
+    def __init__(self, token_type: TokenType, source: str, start: int, end: int,
+                 line: int, column: int) -> None:
+        """Create a token over ``source[start:end]``."""
+        self.type = token_type
+        self.source = source
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+    
+    @property
+    def value(self) -> str:
+        return self.source[self.start:self.end]
+
+
+# Structural characters and the tokens they become
+PUNCTUATION: Dict[str, TokenType] = {
+    '[': TokenType.LEFT_BRACKET,
+    ']': TokenType.RIGHT_BRACKET,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    ':': TokenType.COLON,
+    ',': TokenType.COMMA,
+}
+
+# Every lexeme in one alternation, so the regex engine does the scanning.
+# Alternatives are tried in order; OTHER swallows any unknown character.
+# Spaces and tabs ride along in front of the lexeme that follows them.
+TOKEN_RE = re.compile(r"""
+    [ \t\r]*
+    (?:
+      (?P<NEWLINE>\n)
+    | (?P<COMMENT>\#[^\n]*)
+    | (?P<PUNCT>[\[\]{}:,])
+    | (?P<STRING>"[^"]*"?)
+    | (?P<NUMBER>-?\d+)
+    | (?P<WORD>[^\W\d]\w*)
+    | (?P<OTHER>.)
+    )
+""", re.VERBOSE)
+
+
 class ChaosLexer:
     """Transforms CHAOS source code into a sequence of sacred tokens."""
     
@@ -73,153 +128,59 @@ class ChaosLexer:
         Returns:
             List of tokens representing the sacred patterns in the source
         """
-        self.source = source
-        self.tokens: List[Token] = []
-        self.i = 0
-        self.line = 1
-        self.col = 1
-        
-        while self.i < len(self.source):
-            self._scan_next_character()
+        tokens: List[Token] = []
+        append = tokens.append
+        keywords = self.keywords
+        longest_keyword = max(map(len, keywords), default=0)
+        line = 1
+        col = 1
+        
+        for match in TOKEN_RE.finditer(source):
+            kind = match.lastgroup
+            start, end = match.span(kind)
+            col += start - match.start()  # The spaces before this lexeme
+            
+            if kind == 'OTHER':
+                col += end - start
+            elif kind == 'NEWLINE':
+                line += 1
+                col = 1
+            elif kind == 'PUNCT':
+                text = source[start]
+                append(Token(PUNCTUATION[text], text, line, col))
+                col += 1
+            elif kind == 'WORD':
+                token_type = None
+                if end - start <= longest_keyword:
+                    word = source[start:end].upper()
+                    token_type = keywords.get(word)
+                
+                # Handle boolean and null values
+                if token_type is None:
+                    append(SpanToken(TokenType.IDENTIFIER, source, start, end, line, col))
+                elif token_type is TokenType.BOOLEAN:
+                    append(Token(token_type, word == 'TRUE', line, col))
+                else:
+                    append(Token(token_type, None, line, col))
+                col += end - start
+            elif kind == 'NUMBER':
+                append(SpanToken(TokenType.NUMBER, source, start, end, line, col))
+                col += end - start
+            elif kind == 'STRING':
+                start += 1  # Opening quote
+                if end > start and source[end - 1] == '"':
+                    end -= 1  # Closing quote, when the string was terminated
+                
+                # Multi-line strings are positioned on the line where they end
+                newlines = source.count('\n', start, end)
+                if newlines:
+                    line += newlines
+                    col = 1
+                
+                append(SpanToken(TokenType.STRING, source, start, end, line, col))
+                col += end - start + 2  # Account for quotes
+            # COMMENT: the hidden wisdom is skipped without moving the column
         
         # Mark the end of the ritual
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.col))
-        return self.tokens
-    
-    def _scan_next_character(self) -> None:
-        """Process the next character in the source stream."""
-        c = self.source[self.i]
-        
-        # Whitespace - the silence between words
-        if c in ' \t\r':
-            self._advance_simple()
-            return
-        
-        # Newline - the breath of the ritual
-        if c == '\n':
-            self._advance_newline()
-            return
-        
-        # Comments - the hidden wisdom
-        if c == '#':
-            self._skip_comment()
-            return
-        
-        # Structural tokens - the architecture of meaning
-        if c == '[':
-            self._emit(TokenType.LEFT_BRACKET, c)
-            return
-        if c == ']':
-            self._emit(TokenType.RIGHT_BRACKET, c)
-            return
-        if c == '{':
-            self._emit(TokenType.LEFT_BRACE, c)
-            return
-        if c == '}':
-            self._emit(TokenType.RIGHT_BRACE, c)
-            return
-        if c == ':':
-            self._emit(TokenType.COLON, c)
-            return
-        if c == ',':
-            self._emit(TokenType.COMMA, c)
-            return
-        
-        # Strings - the voice of chaos
-        if c == '"':
-            self._scan_string()
-            return
-        
-        # Numbers - the measurement of intensity
-        if c == '-' and self._peek_next().isdigit():
-            self._scan_number(allow_negative=True)
-            return
-        if c.isdigit():
-            self._scan_number()
-            return
-        
-        # Identifiers and keywords - the names of symbols
-        if c.isalpha() or c == '_':
-            self._scan_identifier()
-            return
-        
-        # Unknown character - move past it
-        self._advance_simple()
-    
-    def _emit(self, token_type: TokenType, value: str) -> None:
-        """Create and store a token."""
-        self.tokens.append(Token(token_type, value, self.line, self.col))
-        self._advance_simple()
-    
-    def _advance_simple(self) -> None:
-        """Move to the next character, updating column."""
-        self.i += 1
-        self.col += 1
-    
-    def _advance_newline(self) -> None:
-        """Move to the next line."""
-        self.i += 1
-        self.line += 1
-        self.col = 1
-    
-    def _skip_comment(self) -> None:
-        """Skip until the end of the current line."""
-        while self.i < len(self.source) and self.source[self.i] != '\n':
-            self.i += 1
-    
-    def _scan_string(self) -> None:
-        """Extract a quoted string value."""
-        self.i += 1  # Skip opening quote
-        start = self.i
-        
-        while self.i < len(self.source) and self.source[self.i] != '"':
-            if self.source[self.i] == '\n':
-                self.line += 1
-                self.col = 1
-            self.i += 1
-        
-        value = self.source[start:self.i]
-        if self.i < len(self.source) and self.source[self.i] == '"':
-            self.i += 1  # Skip closing quote
-        
-        self.tokens.append(Token(TokenType.STRING, value, self.line, self.col))
-        self.col += len(value) + 2  # Account for quotes
-    
-    def _peek_next(self) -> str:
-        """Look at the next character without consuming it."""
-        if self.i + 1 >= len(self.source):
-            return '\0'
-        return self.source[self.i + 1]
-
-    def _scan_number(self, allow_negative: bool = False) -> None:
-        """Extract a numeric value."""
-        start = self.i
-        if allow_negative and self.source[self.i] == '-':
-            self.i += 1
-        while self.i < len(self.source) and self.source[self.i].isdigit():
-            self.i += 1
-        
-        value = self.source[start:self.i]
-        self.tokens.append(Token(TokenType.NUMBER, value, self.line, self.col))
-        self.col += len(value)
-    
-    def _scan_identifier(self) -> None:
-        """Extract an identifier or keyword."""
-        start = self.i
-        while (self.i < len(self.source) and 
-               (self.source[self.i].isalnum() or self.source[self.i] == '_')):
-            self.i += 1
-        
-        word = self.source[start:self.i]
-        token_type = self.keywords.get(word.upper(), TokenType.IDENTIFIER)
-        
-        # Handle boolean and null values
-        if token_type == TokenType.BOOLEAN:
-            value = word.upper() == 'TRUE'
-        elif token_type == TokenType.NULL:
-            value = None
-        else:
-            value = word
-        
-        self.tokens.append(Token(token_type, value, self.line, self.col))
-        self.col += len(word)
+        append(Token(TokenType.EOF, '', line, col))
+        return tokens
@@ -7,7 +7,8 @@ temporal precision for future reflection and understanding.
 """
 
 import datetime
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
 
 class ChaosLogger:
@@ -15,9 +16,38 @@ class ChaosLogger:
     
     def __init__(self) -> None:
         """Initialize an empty chronicle."""
-        self.logs: List[str] = []
+        # Entries are recorded raw as (time_ns, message); formatting waits
+        # until someone reads the chronicle, and happens once per entry
+        self._entries: List[Tuple[int, str]] = []
+        self._lines: List[str] = []
+        self._lowered: List[str] = []  # Lowercased formatted lines, filled by search()
+        self._stamp_second = -1
+        self._stamp_prefix = ""
         self.start_time = datetime.datetime.now()
     
+    @property
+    def logs(self) -> List[str]:
+        """A copy of the formatted chronicle entries, oldest first."""
+        return list(self._formatted())
+    
+    def _formatted(self) -> List[str]:
+        """Format any new entries and return the internal line list."""
+        if len(self._lines) < len(self._entries):
+            self._lines.extend(
+                f"[{self._timestamp(ns)}] {message}"
+                for ns, message in self._entries[len(self._lines):]
+            )
+        return self._lines
+    
+    def _timestamp(self, ns: int) -> str:
+        """Render ``ns`` like datetime.isoformat(), reusing the per-second prefix."""
+        second, remainder = divmod(ns, 1_000_000_000)
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp_prefix = datetime.datetime.fromtimestamp(second).isoformat()
+        micros = remainder // 1000
+        return f"{self._stamp_prefix}.{micros:06d}" if micros else self._stamp_prefix
+    
     def log(self, message: str) -> None:
         """
         Record a general event in the sacred chronicle.
@@ -25,8 +55,7 @@ class ChaosLogger:
         Args:
             message: The event to record
         """
-        entry = f"[{datetime.datetime.now().isoformat()}] {message}"
-        self.logs.append(entry)
+        self._entries.append((time.time_ns(), message))
     
     def log_symbol(self, name: str, value: str) -> None:
         """
@@ -55,8 +84,10 @@ class ChaosLogger:
         Args:
             chaosfield: The narrative text (will be truncated for logging)
         """
-        truncated = chaosfield[:60] + "..." if len(chaosfield) > 60 else chaosfield
-        self.log(f"NARRATIVE: {truncated}")
+        if len(chaosfield) > 60:
+            self.log(f"NARRATIVE: {chaosfield:.60}...")  # Precision truncates in place
+        else:
+            self.log(f"NARRATIVE: {chaosfield}")
     
     def log_dream(self, dream: str) -> None:
         """
@@ -65,8 +96,10 @@ class ChaosLogger:
         Args:
             dream: The visionary text
         """
-        truncated = dream[:80] + "..." if len(dream) > 80 else dream
-        self.log(f"DREAM: {truncated}")
+        if len(dream) > 80:
+            self.log(f"DREAM: {dream:.80}...")
+        else:
+            self.log(f"DREAM: {dream}")
     
     def log_protocol(self, protocol_name: str, action: str, score: int) -> None:
         """
@@ -98,10 +131,10 @@ class ChaosLogger:
         """
         header = f"=== CHAOS Execution Chronicle ===\n"
         header += f"Started: {self.start_time.isoformat()}\n"
-        header += f"Entries: {len(self.logs)}\n"
+        header += f"Entries: {len(self._entries)}\n"
         header += "=" * 40 + "\n\n"
         
-        return header + "\n".join(self.logs)
+        return header + "\n".join(self._formatted())
     
     def get_recent(self, count: int = 10) -> List[str]:
         """
@@ -113,11 +146,13 @@ class ChaosLogger:
         Returns:
             List of recent log entries
         """
-        return self.logs[-count:] if len(self.logs) >= count else self.logs
+        return self._formatted()[-count:]
     
     def clear(self) -> None:
         """Clear the sacred chronicle (use with caution)."""
-        self.logs.clear()
+        self._entries.clear()
+        self._lines.clear()
+        self._lowered.clear()
         self.start_time = datetime.datetime.now()
     
     def get_duration(self) -> datetime.timedelta:
@@ -126,7 +161,7 @@ class ChaosLogger:
     
     def search(self, keyword: str) -> List[str]:
         """
-        Search the chronicle for entries containing a keyword.
+        Search the chronicle for entries (timestamp included) containing a keyword.
         
         Args:
             keyword: The term to search for
@@ -134,5 +169,10 @@ class ChaosLogger:
         Returns:
             List of matching log entries
         """
+        lines = self._formatted()
+        lowered = self._lowered
+        if len(lowered) < len(lines):
+            lowered.extend(line.lower() for line in lines[len(lowered):])
+        
         keyword_lower = keyword.lower()
-        return [entry for entry in self.logs if keyword_lower in entry.lower()]
\ No newline at end of file
+        return [lines[i] for i, line in enumerate(lowered) if keyword_lower in line]
\ No newline at end of file
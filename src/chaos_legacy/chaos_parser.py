@@ -13,6 +13,20 @@ from .chaos_lexer import TokenType, Token
 from .chaos_errors import ChaosSyntaxError
 
 
+# Token types bound once as globals for the parser's lookahead checks
+_BOOLEAN = TokenType.BOOLEAN
+_COLON = TokenType.COLON
+_EOF = TokenType.EOF
+_IDENTIFIER = TokenType.IDENTIFIER
+_LEFT_BRACE = TokenType.LEFT_BRACE
+_LEFT_BRACKET = TokenType.LEFT_BRACKET
+_NULL = TokenType.NULL
+_NUMBER = TokenType.NUMBER
+_RIGHT_BRACE = TokenType.RIGHT_BRACE
+_RIGHT_BRACKET = TokenType.RIGHT_BRACKET
+_STRING = TokenType.STRING
+
+
 class TagTriplet(NamedTuple):
     tag: str
     kind: str
@@ -62,6 +76,8 @@ class ChaosParser:
     def __init__(self, tokens: List[Token]) -> None:
         """Initialize the parser with sacred tokens."""
         self.tokens = tokens
+        # Each token's type in a parallel list; lookahead reads it by index
+        self.kinds: List[TokenType] = [token.type for token in tokens]
         self.current = 0
     
     def parse(self) -> Node:
@@ -93,7 +109,7 @@ class ChaosParser:
     
     def _is_at_end(self) -> bool:
         """Check if we've reached the end of the token stream."""
-        return self._peek().type == TokenType.EOF
+        return self.kinds[self.current] is _EOF
     
     def _peek(self) -> Token:
         """Look at the current token without consuming it."""
@@ -111,14 +127,14 @@ class ChaosParser:
     
     def _check(self, token_type: TokenType) -> bool:
         """Check if the current token matches the given type."""
-        return not self._is_at_end() and self._peek().type == token_type
+        kind = self.kinds[self.current]
+        return kind is not _EOF and kind is token_type
     
     def _match(self, *types: TokenType) -> bool:
         """Check if current token matches any of the given types."""
-        if self._is_at_end():
-            return False
-        if self._peek().type in types:
-            self._advance()
+        kind = self.kinds[self.current]
+        if kind is not _EOF and kind in types:
+            self.current += 1
             return True
         return False
     
@@ -144,25 +160,25 @@ class ChaosParser:
                     self.current = end_index
                     continue
 
-            if not self._check(TokenType.LEFT_BRACKET):
+            if not self._check(_LEFT_BRACKET):
                 self._advance()
                 continue
             
             self._advance()  # Consume [
             
-            if not self._check(TokenType.IDENTIFIER):
+            if not self._check(_IDENTIFIER):
                 # Not a simple key-value pair, move past the bracket
                 self.current = start_index + 1
                 continue
             
             key = self._advance().value
 
-            if not self._check(TokenType.RIGHT_BRACKET):
+            if not self._check(_RIGHT_BRACKET):
                 self.current = start_index + 1
                 continue
             self._advance()  # Consume ]
 
-            if not self._check(TokenType.COLON):
+            if not self._check(_COLON):
                 self.current = start_index + 1
                 continue
             self._advance()  # Consume :
@@ -172,11 +188,11 @@ class ChaosParser:
             value_token = self._advance()  # Consume value token
             
             # Extract the value based on token type
-            if value_token.type in (TokenType.STRING, TokenType.NUMBER, TokenType.BOOLEAN):
+            if value_token.type in (_STRING, _NUMBER, _BOOLEAN):
                 pairs[key] = value_token.value
-            elif value_token.type == TokenType.IDENTIFIER:
+            elif value_token.type is _IDENTIFIER:
                 pairs[key] = value_token.value
-            elif value_token.type == TokenType.NULL:
+            elif value_token.type is _NULL:
                 pairs[key] = None
             else:
                 # Not a valid value, move past the current bracket and continue
@@ -198,36 +214,37 @@ class ChaosParser:
         """
         idx = start_index
         tokens = self.tokens
+        kinds = self.kinds
 
-        if idx >= len(tokens) or tokens[idx].type != TokenType.LEFT_BRACKET:
+        if idx >= len(kinds) or kinds[idx] is not _LEFT_BRACKET:
             return None
         idx += 1
 
-        if idx >= len(tokens) or tokens[idx].type != TokenType.IDENTIFIER:
+        if idx >= len(kinds) or kinds[idx] is not _IDENTIFIER:
             return None
         tag = tokens[idx].value
         idx += 1
 
-        if idx >= len(tokens) or tokens[idx].type != TokenType.COLON:
+        if idx >= len(kinds) or kinds[idx] is not _COLON:
             return None
         idx += 1
 
-        if idx >= len(tokens) or tokens[idx].type != TokenType.IDENTIFIER:
+        if idx >= len(kinds) or kinds[idx] is not _IDENTIFIER:
             return None
         kind = tokens[idx].value
         idx += 1
 
         value_token: Optional[Token] = None
-        if idx < len(tokens) and tokens[idx].type == TokenType.COLON:
+        if idx < len(kinds) and kinds[idx] is _COLON:
             has_second_colon = True
             idx += 1
-            if idx < len(tokens) and tokens[idx].type in (TokenType.IDENTIFIER, TokenType.NUMBER):
+            if idx < len(kinds) and kinds[idx] in (_IDENTIFIER, _NUMBER):
                 value_token = tokens[idx]
             else:
                 return None
             idx += 1
 
-        if idx >= len(tokens) or tokens[idx].type != TokenType.RIGHT_BRACKET:
+        if idx >= len(kinds) or kinds[idx] is not _RIGHT_BRACKET:
             return None
         idx += 1
 
@@ -267,7 +284,7 @@ class ChaosParser:
         while not self._is_at_end():
             start_index = self.current
 
-            if not self._check(TokenType.LEFT_BRACKET):
+            if not self._check(_LEFT_BRACKET):
                 self._advance()
                 continue
             
@@ -286,7 +303,7 @@ class ChaosParser:
             if tag == "EMOTION":
                 # Parse emotion intensity
                 try:
-                    intensity = int(value) if value_type == TokenType.NUMBER else int(str(value)) if value else 5
+                    intensity = int(value) if value_type is _NUMBER else int(str(value)) if value else 5
                 except Exception:
                     intensity = 5
                 intensity = max(0, min(intensity, 10))  # Clamp to 0-10
@@ -299,23 +316,23 @@ class ChaosParser:
     
     def _parse_chaosfield_layer(self) -> Node:
         """Parse the chaosfield layer - the narrative free text."""
-        while not self._is_at_end() and not self._match(TokenType.LEFT_BRACE):
+        while not self._is_at_end() and not self._match(_LEFT_BRACE):
             self._advance()
         
         if self._is_at_end():
             return Node(NodeType.CHAOSFIELD_LAYER, value="")
         
         parts = []
-        while not self._is_at_end() and not self._check(TokenType.RIGHT_BRACE):
+        while not self._is_at_end() and not self._check(_RIGHT_BRACE):
             token = self._advance()
             
             # Keep strings as-is, convert others to text
-            if token.type == TokenType.STRING:
+            if token.type is _STRING:
                 parts.append(token.value)
             elif token.value is not None:
                 parts.append(str(token.value))
         
-        if self._check(TokenType.RIGHT_BRACE):
+        if self._check(_RIGHT_BRACE):
             self._advance()
         
         text = " ".join(parts).strip()
@@ -6,12 +6,39 @@ resonance translate into action. These are not mere functions, but sacred
 contracts that honor the mythic nature of the language.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple
-from .chaos_stdlib import weighted_pick, text_snippet
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from .chaos_stdlib import DATACLASS_SLOTS, weighted_pick, text_snippet
 
 
-@dataclass
+# Emotion names the protocols listen for. Interned, like the names held by
+# Emotion and norm_key, so totals lookups hit on string identity.
+(FEAR, GRIEF, HOPE, LOVE, CREATIVE, JOY, ALLY, TRUST, 
+ NOSTALGIA, WISDOM, CONTEMPLATION) = map(sys.intern, (
+    "FEAR", "GRIEF", "HOPE", "LOVE", "CREATIVE", "JOY", "ALLY", "TRUST",
+    "NOSTALGIA", "WISDOM", "CONTEMPLATION",
+))
+
+
+def emotion_totals(emotions: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Sum emotional intensity per emotion name in a single pass.
+    
+    Args:
+        emotions: The current emotional state
+        
+    Returns:
+        Mapping of emotion name to total intensity
+    """
+    totals: Dict[str, int] = {}
+    for emotion in emotions:
+        name = emotion["name"]
+        totals[name] = totals.get(name, 0) + emotion["intensity"]
+    return totals
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProtocolResult:
     """The outcome of a sacred protocol execution."""
     name: str
@@ -23,29 +50,34 @@ class ProtocolResult:
 class Protocol:
     """Base class for sacred behavioral protocols."""
     
+    __slots__ = ()  # Protocols are stateless; name and priority live on the class
+    
     name: str = "protocol"
     priority: int = 0
     
-    def match(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, context: Dict[str, Any], totals: Mapping[str, int]) -> int:
         """
         Calculate how well this protocol matches the current state.
         
         Args:
             context: The symbolic memory context
-            emotions: The current emotional state
+            totals: Total intensity per emotion name (see emotion_totals)
             
         Returns:
             Score indicating match strength (0 = no match)
         """
         return 0
     
-    def execute(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, context: Dict[str, Any], totals: Mapping[str, int], 
+                score: Optional[int] = None) -> ProtocolResult:
         """
         Execute the protocol and return the result.
         
         Args:
             context: The symbolic memory context
-            emotions: The current emotional state
+            totals: Total intensity per emotion name (see emotion_totals)
+            score: The match score already computed for this state; when
+                omitted, it is computed with match()
             
         Returns:
             ProtocolResult describing the outcome
@@ -56,25 +88,29 @@ class Protocol:
 class OathProtocol(Protocol):
     """Protocol for maintaining stability and safety in chaotic times."""
     
+    __slots__ = ()
+    
     name = "oath.stability"
     priority = 50
     
-    def match(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, context: Dict[str, Any], totals: Mapping[str, int]) -> int:
         """
         Match when fear or grief are present - times when stability is needed.
         
         The oath of stability responds to emotional distress by offering
         grounding and reassurance.
         """
-        fear_intensity = sum(e["intensity"] for e in emotions if e["name"] == "FEAR")
-        grief_intensity = sum(e["intensity"] for e in emotions if e["name"] == "GRIEF")
+        fear_intensity = totals.get(FEAR, 0)
+        grief_intensity = totals.get(GRIEF, 0)
         
         # Average the distress emotions
         return (fear_intensity + grief_intensity) // 2
     
-    def execute(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, context: Dict[str, Any], totals: Mapping[str, int], 
+                score: Optional[int] = None) -> ProtocolResult:
         """Provide stability and reassurance."""
-        score = self.match(context, emotions)
+        if score is None:
+            score = self.match(context, totals)
         return ProtocolResult(
             self.name,
             action="stabilize",
@@ -90,25 +126,29 @@ class OathProtocol(Protocol):
 class RitualProtocol(Protocol):
     """Protocol for transformation and change through sacred ceremony."""
     
+    __slots__ = ()
+    
     name = "ritual.transformation"
     priority = 40
     
-    def match(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, context: Dict[str, Any], totals: Mapping[str, int]) -> int:
         """
         Match when hope and love are present - fertile ground for transformation.
         
         The ritual of transformation responds to positive emotional states
         by encouraging growth and evolution.
         """
-        hope_intensity = sum(e["intensity"] for e in emotions if e["name"] == "HOPE")
-        love_intensity = sum(e["intensity"] for e in emotions if e["name"] == "LOVE")
-        creative_intensity = sum(e["intensity"] for e in emotions if e["name"] == "CREATIVE")
+        hope_intensity = totals.get(HOPE, 0)
+        love_intensity = totals.get(LOVE, 0)
+        creative_intensity = totals.get(CREATIVE, 0)
         
         return hope_intensity + love_intensity + creative_intensity
     
-    def execute(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, context: Dict[str, Any], totals: Mapping[str, int], 
+                score: Optional[int] = None) -> ProtocolResult:
         """Facilitate transformation and growth."""
-        score = self.match(context, emotions)
+        if score is None:
+            score = self.match(context, totals)
         narrative_context = text_snippet(context.get("narrative", ""), 120)
         
         return ProtocolResult(
@@ -127,10 +167,12 @@ class RitualProtocol(Protocol):
 class ContractProtocol(Protocol):
     """Protocol for building and maintaining symbolic relationships."""
     
+    __slots__ = ()
+    
     name = "contract.relationship"
     priority = 35
     
-    def match(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, context: Dict[str, Any], totals: Mapping[str, int]) -> int:
         """
         Match when symbols are present and joy encourages connection.
         
@@ -140,19 +182,21 @@ class ContractProtocol(Protocol):
         symbols = context.get("symbols", {})
         
         # Count symbolic relationships (keys with colons)
-        symbolic_relationships = [k for k in symbols.keys() if ":" in k]
+        symbolic_relationships = sum(1 for k in symbols if ":" in k)
         
         # Measure joy and collaboration emotions
-        joy_intensity = sum(e["intensity"] for e in emotions if e["name"] == "JOY")
-        ally_intensity = sum(e["intensity"] for e in emotions if e["name"] == "ALLY")
-        trust_intensity = sum(e["intensity"] for e in emotions if e["name"] == "TRUST")
+        joy_intensity = totals.get(JOY, 0)
+        ally_intensity = totals.get(ALLY, 0)
+        trust_intensity = totals.get(TRUST, 0)
         
         # Encourage relationships when joy is present
-        return min(100, joy_intensity + ally_intensity + trust_intensity + len(symbolic_relationships) * 2)
+        return min(100, joy_intensity + ally_intensity + trust_intensity + symbolic_relationships * 2)
     
-    def execute(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, context: Dict[str, Any], totals: Mapping[str, int], 
+                score: Optional[int] = None) -> ProtocolResult:
         """Build and strengthen symbolic relationships."""
-        score = self.match(context, emotions)
+        if score is None:
+            score = self.match(context, totals)
         symbols = context.get("symbols", {})
         
         return ProtocolResult(
@@ -171,10 +215,12 @@ class ContractProtocol(Protocol):
 class MemoryProtocol(Protocol):
     """Protocol for integrating experiences into lasting memory."""
     
+    __slots__ = ()
+    
     name = "memory.integration"
     priority = 30
     
-    def match(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> int:
+    def match(self, context: Dict[str, Any], totals: Mapping[str, int]) -> int:
         """
         Match when there's narrative content and reflective emotions.
         
@@ -182,18 +228,20 @@ class MemoryProtocol(Protocol):
         emotional states by integrating experiences into lasting wisdom.
         """
         narrative = context.get("narrative", "")
-        nostalgia_intensity = sum(e["intensity"] for e in emotions if e["name"] == "NOSTALGIA")
-        wisdom_intensity = sum(e["intensity"] for e in emotions if e["name"] == "WISDOM")
-        contemplation_intensity = sum(e["intensity"] for e in emotions if e["name"] == "CONTEMPLATION")
+        nostalgia_intensity = totals.get(NOSTALGIA, 0)
+        wisdom_intensity = totals.get(WISDOM, 0)
+        contemplation_intensity = totals.get(CONTEMPLATION, 0)
         
         # Narrative length encourages memory formation
         narrative_bonus = min(20, len(narrative) // 10)
         
         return nostalgia_intensity + wisdom_intensity + contemplation_intensity + narrative_bonus
     
-    def execute(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> ProtocolResult:
+    def execute(self, context: Dict[str, Any], totals: Mapping[str, int], 
+                score: Optional[int] = None) -> ProtocolResult:
         """Integrate experiences into memory."""
-        score = self.match(context, emotions)
+        if score is None:
+            score = self.match(context, totals)
         narrative = context.get("narrative", "")
         
         return ProtocolResult(
@@ -225,39 +273,51 @@ class ProtocolRegistry:
             ContractProtocol(),
             MemoryProtocol()
         ]
+        
+        # Protocols by name, in registration order, for quick removal
+        self._by_name: Dict[str, List[Protocol]] = {}
+        for protocol in self.protocols:
+            self._by_name.setdefault(protocol.name, []).append(protocol)
     
-    def evaluate(self, context: Dict[str, Any], emotions: List[Dict[str, Any]]) -> Optional[ProtocolResult]:
+    def evaluate(self, context: Dict[str, Any], emotions: Optional[List[Dict[str, Any]]] = None, 
+                 *, totals: Optional[Mapping[str, int]] = None) -> Optional[ProtocolResult]:
         """
         Evaluate all protocols and select the most appropriate action.
         
         Args:
             context: The symbolic memory context
             emotions: The current emotional state
+            totals: Precomputed intensity per emotion name; replaces emotions
             
         Returns:
             The most appropriate protocol result, or None if no protocols match
         """
         scored_results: List[Tuple[ProtocolResult, int]] = []
+        if totals is None:
+            totals = emotion_totals(emotions or [])  # One pass shared by every protocol
         
         for protocol in self.protocols:
-            match_score = protocol.match(context, emotions)
+            match_score = protocol.match(context, totals)
             
             if match_score <= 0:
                 continue  # Protocol doesn't match current state
             
-            result = protocol.execute(context, emotions)
+            result = protocol.execute(context, totals, match_score)
             result.score = max(match_score, result.score) + protocol.priority
             scored_results.append((result, result.score))
         
         if not scored_results:
             return None  # No protocols matched
+        if len(scored_results) == 1:
+            return scored_results[0][0]  # A lone match is certain; skip the draw
         
         # Use weighted selection to choose the most appropriate protocol
-        return weighted_pick([(result, score) for result, score in scored_results], None)
+        return weighted_pick(scored_results, None)
     
     def add_protocol(self, protocol: Protocol) -> None:
         """Add a new protocol to the registry."""
         self.protocols.append(protocol)
+        self._by_name.setdefault(protocol.name, []).append(protocol)
     
     def remove_protocol(self, protocol_name: str) -> bool:
         """
@@ -269,11 +329,15 @@ class ProtocolRegistry:
         Returns:
             True if removed, False if not found
         """
-        for i, protocol in enumerate(self.protocols):
-            if protocol.name == protocol_name:
-                del self.protocols[i]
-                return True
-        return False
+        named = self._by_name.get(protocol_name)
+        if not named:
+            return False
+        
+        protocol = named.pop(0)  # The earliest registered with this name
+        if not named:
+            del self._by_name[protocol_name]
+        self.protocols.remove(protocol)
+        return True
     
     def list_protocols(self) -> List[str]:
         """Get names of all registered protocols."""
@@ -6,14 +6,34 @@ This is where CHAOS programs begin their journey through the three layers
 of symbolic meaning, emotional resonance, and narrative chaos.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Protocol
 from .chaos_errors import ChaosSyntaxError, ChaosRuntimeError
 from .chaos_lexer import ChaosLexer
-from .chaos_parser import ChaosParser
+from .chaos_parser import ChaosParser, Node
 from .chaos_interpreter import ChaosInterpreter
 
+# The lexer holds no state between calls, so every ritual shares one
+_LEXER = ChaosLexer()
+# Interpreters waiting for their next ritual, reset before each reuse
+_INTERPRETERS: List[ChaosInterpreter] = []
 
-def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
+
+class ChaosSink(Protocol):
+    """Receiver that takes CHAOS layer values straight from the runtime."""
+    
+    def on_symbol(self, key: str, value: Any) -> None:
+        """Accept one structured core entry."""
+    
+    def on_emotion(self, name: str, intensity: Any) -> None:
+        """Accept one emotive layer entry."""
+    
+    def on_narrative(self, text: str) -> None:
+        """Accept the chaosfield narrative (only called when non-empty)."""
+
+
+def run_chaos(source_code: Optional[str] = None, verbose: bool = False, *,
+              ast: Optional[Node] = None,
+              sinks: Optional[ChaosSink] = None) -> Dict[str, Any]:
     """
     Execute a complete CHAOS program from source to environment.
     
@@ -25,6 +45,10 @@ def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
     Args:
         source_code: The CHAOS program text to execute
         verbose: If True, print detailed execution information
+        ast: An already parsed program (e.g. from validate_chaos); when given,
+            lexing and parsing are skipped and source_code is not needed
+        sinks: Optional receiver fed each layer's values by the interpreter
+            as it brings that layer to life
         
     Returns:
         The complete environment dictionary with three layers:
@@ -36,10 +60,39 @@ def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
         ChaosSyntaxError: If lexical analysis or parsing fails
         ChaosRuntimeError: If interpretation fails
     """
+    if ast is None:
+        if source_code is None:
+            raise ValueError("run_chaos needs source_code or a parsed ast")
+        ast = _parse_source(source_code, verbose)
+    
+    # Phase 3: Interpretation - Bringing the Ritual to Life
+    try:
+        interpreter = _INTERPRETERS.pop()
+    except IndexError:
+        interpreter = ChaosInterpreter()
+    interpreter.reset()
+    try:
+        environment = interpreter.interpret(ast, sinks)
+    except Exception as e:
+        raise ChaosRuntimeError(f"Failed to bring CHAOS to life: {e}")
+    finally:
+        _INTERPRETERS.append(interpreter)
+    
+    if verbose:
+        print("✅ Ritual Complete - Environment Created:")
+        print(f"  Symbols: {len(environment.get('structured_core', {}))}")
+        print(f"  Emotions: {len(environment.get('emotive_layer', []))}")
+        print(f"  Narrative: {len(environment.get('chaosfield_layer', ''))} characters")
+        print()
+    
+    return environment
+
+
+def _parse_source(source_code: str, verbose: bool) -> Node:
+    """Lex and parse ``source_code`` into a program tree."""
     # Phase 1: Lexical Analysis - Recognizing the Sacred Patterns
-    lexer = ChaosLexer()
     try:
-        tokens = lexer.tokenize(source_code)
+        tokens = _LEXER.tokenize(source_code)
     except Exception as e:
         raise ChaosSyntaxError(f"Failed to recognize CHAOS patterns: {e}")
     
@@ -61,18 +114,21 @@ def run_chaos(source_code: str, verbose: bool = False) -> Dict[str, Any]:
         print(f"  {ast}")
         print()
     
-    # Phase 3: Interpretation - Bringing the Ritual to Life
-    interpreter = ChaosInterpreter()
-    try:
-        environment = interpreter.interpret(ast)
-    except Exception as e:
-        raise ChaosRuntimeError(f"Failed to bring CHAOS to life: {e}")
-    
-    if verbose:
-        print("✅ Ritual Complete - Environment Created:")
-        print(f"  Symbols: {len(environment.get('structured_core', {}))}")
-        print(f"  Emotions: {len(environment.get('emotive_layer', []))}")
-        print(f"  Narrative: {len(environment.get('chaosfield_layer', ''))} characters")
-        print()
+    return ast
+
+
+def feed_sinks(environment: Dict[str, Any], sinks: ChaosSink) -> None:
+    """
+    Replay each layer of a finished ``environment`` to ``sinks`` in ritual order.
     
-    return environment
\ No newline at end of file
+    Calls the sink exactly as run_chaos(..., sinks=sinks) would have while
+    producing ``environment``.
+    """
+    for key, value in environment.get("structured_core", {}).items():
+        sinks.on_symbol(key, value)
+    for entry in environment.get("emotive_layer", []):
+        sinks.on_emotion(entry.get("type") or entry.get("name") or "FEELING",
+                         entry.get("intensity"))
+    narrative = environment.get("chaosfield_layer", "")
+    if narrative:
+        sinks.on_narrative(narrative)
\ No newline at end of file
@@ -10,7 +10,17 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from typing import Any, Dict, Iterable, List, Tuple, Optional, Sequence
 import random
 import re
+import sys
 import time
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+
+
+# Keyword arguments giving a dataclass __slots__ where supported (3.10+). The
+# agent and protocol records are allocated every step, so the saved per-instance
+# __dict__ adds up.
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 def clamp(value: int, minimum: int, maximum: int) -> int:
@@ -45,12 +55,18 @@ def pick(sequence: Iterable[Any], default: Any = None) -> Any:
     return random.choice(seq_list)
 
 
+_NON_KEY_CHARS = re.compile(r"[^A-Z0-9_]+")
+
+
+@lru_cache(maxsize=4096)
 def norm_key(text: str) -> str:
     """
     Normalize a string into a sacred symbolic key.
     
     Converts to uppercase, replaces non-alphanumeric characters with underscores,
-    ensuring the result is suitable for symbolic identification.
+    ensuring the result is suitable for symbolic identification. Keys are
+    interned, so equal keys share one string and compare by identity. Results
+    are memoized, since agents normalize the same names on every step.
     
     Args:
         text: The text to normalize
@@ -58,8 +74,8 @@ def norm_key(text: str) -> str:
     Returns:
         A normalized symbolic key
     """
-    cleaned = re.sub(r"[^A-Z0-9_]+", "_", (text or "").strip().upper())
-    return cleaned.strip("_")  # Remove leading/trailing underscores
+    cleaned = _NON_KEY_CHARS.sub("_", (text or "").strip().upper())
+    return sys.intern(cleaned.strip("_"))  # Remove leading/trailing underscores
 
 
 def uniq(sequence: Iterable[Any]) -> List[Any]:
@@ -83,6 +99,10 @@ def uniq(sequence: Iterable[Any]) -> List[Any]:
     return result
 
 
+_LEADING_SPACE = re.compile(r"\s*")
+_NON_SPACE = re.compile(r"\S")
+
+
 def text_snippet(text: str, max_length: int = 120) -> str:
     """
     Extract a meaningful snippet from sacred text.
@@ -97,12 +117,13 @@ def text_snippet(text: str, max_length: int = 120) -> str:
     if not text:
         return ""
     
-    cleaned = text.strip().replace("\n", " ")
-    
-    if len(cleaned) <= max_length:
-        return cleaned
+    # Locate the snippet in place rather than stripping a copy of the whole text
+    start = _LEADING_SPACE.match(text).end()
+    if _NON_SPACE.search(text, start + max_length) is None:
+        # Everything past the window is whitespace: the stripped text fits
+        return text[start:start + max_length].rstrip().replace("\n", " ")
     
-    return cleaned[:max_length - 1] + "…"
+    return text[start:start + max_length - 1].replace("\n", " ") + "…"
 
 
 def weighted_pick(weighted_items: Sequence[Tuple[Any, int]], default: Any = None) -> Any:
@@ -119,22 +140,17 @@ def weighted_pick(weighted_items: Sequence[Tuple[Any, int]], default: Any = None
     if not weighted_items:
         return default
     
-    # Calculate total weight, ensuring all weights are non-negative
-    total_weight = sum(max(weight, 0) for _, weight in weighted_items)
+    # Running totals of the non-negative weights; the last is the total weight
+    cumulative = list(accumulate(max(weight, 0) for _, weight in weighted_items))
+    total_weight = cumulative[-1]
     
     if total_weight <= 0:
         return default
     
-    # Choose based on weighted probability
+    # Choose based on weighted probability: the first item whose running
+    # total reaches the selection, found by binary search
     selection = random.randint(1, total_weight)
-    cumulative = 0
-    
-    for item, weight in weighted_items:
-        cumulative += max(weight, 0)
-        if selection <= cumulative:
-            return item
-    
-    return default
+    return weighted_items[bisect_left(cumulative, selection)][0]
 
 
 def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
@@ -6,14 +6,15 @@ the sacred three-layer structure before they are brought to life
 through execution.
 """
 
+import re
 from typing import Any, Dict, List
 
 from .chaos_errors import ChaosValidationError
 from .chaos_lexer import ChaosLexer
-from .chaos_parser import ChaosParser
+from .chaos_parser import ChaosParser, Node
 
 
-def validate_chaos(source: str) -> None:
+def validate_chaos(source: str) -> Node:
     """
     Validate that source code follows CHAOS sacred structure.
     
@@ -25,6 +26,9 @@ def validate_chaos(source: str) -> None:
     Args:
         source: The CHAOS source code to validate
         
+    Returns:
+        The validated parse tree, ready for run_chaos(ast=...)
+        
     Raises:
         ChaosValidationError: If the program structure is invalid
     """
@@ -59,12 +63,19 @@ def validate_chaos(source: str) -> None:
                 f"Invalid layer order. Expected {expected_types}, got {actual_types}"
             )
         
+        return ast
+        
     except Exception as e:
         if isinstance(e, ChaosValidationError):
             raise
         raise ChaosValidationError(f"CHAOS validation failed: {e}")
 
 
+# Letters, digits, underscores, colons or hyphens. The leading letter is
+# checked with isalpha(), since [^\W\d_] still admits numerics like "²"
+_SYMBOL_NAME = re.compile(r"[\w:-]+")
+
+
 def validate_symbols(symbols: Dict[str, str]) -> None:
     """
     Validate that symbols follow CHAOS naming conventions.
@@ -75,18 +86,20 @@ def validate_symbols(symbols: Dict[str, str]) -> None:
     Raises:
         ChaosValidationError: If symbols violate naming conventions
     """
-    for name, value in symbols.items():
+    fullmatch = _SYMBOL_NAME.fullmatch
+    for name in symbols:
+        if fullmatch(name) and name[0].isalpha():
+            continue
+        
         # Check for valid symbolic names
         if not name or not name[0].isalpha():
             raise ChaosValidationError(
                 f"Symbolic name '{name}' must start with a letter"
             )
         
-        # Check for valid characters
-        if not all(c.isalnum() or c in "_:-" for c in name):
-            raise ChaosValidationError(
-                f"Symbolic name '{name}' contains invalid characters"
-            )
+        raise ChaosValidationError(
+            f"Symbolic name '{name}' contains invalid characters"
+        )
 
 
 def validate_emotions(emotions: List[Dict[str, Any]]) -> None:
@@ -100,23 +113,36 @@ def validate_emotions(emotions: List[Dict[str, Any]]) -> None:
         ChaosValidationError: If emotions are improperly structured
     """
     for i, emotion in enumerate(emotions):
-        if not isinstance(emotion, dict):
-            raise ChaosValidationError(f"Emotion {i} must be a dictionary")
-        
-        if "name" not in emotion or "intensity" not in emotion:
-            raise ChaosValidationError(
-                f"Emotion {i} must have 'name' and 'intensity' keys"
-            )
+        # Fast path: one guarded read covers the structure, type and range checks
+        try:
+            intensity = emotion["intensity"]
+            if ("name" in emotion and isinstance(emotion, dict) 
+                    and isinstance(intensity, (int, float)) and 0 <= intensity <= 10):
+                continue
+        except (KeyError, TypeError, IndexError):
+            pass
         
-        if not isinstance(emotion["intensity"], (int, float)):
-            raise ChaosValidationError(
-                f"Emotion {i} intensity must be numeric"
-            )
-        
-        if not (0 <= emotion["intensity"] <= 10):
-            raise ChaosValidationError(
-                f"Emotion {i} intensity must be between 0 and 10"
-            )
+        raise _emotion_error(i, emotion)
+
+
+def _emotion_error(i: int, emotion: Any) -> ChaosValidationError:
+    """Describe why emotion ``i`` failed validation."""
+    if not isinstance(emotion, dict):
+        return ChaosValidationError(f"Emotion {i} must be a dictionary")
+    
+    if "name" not in emotion or "intensity" not in emotion:
+        return ChaosValidationError(
+            f"Emotion {i} must have 'name' and 'intensity' keys"
+        )
+    
+    if not isinstance(emotion["intensity"], (int, float)):
+        return ChaosValidationError(
+            f"Emotion {i} intensity must be numeric"
+        )
+    
+    return ChaosValidationError(
+        f"Emotion {i} intensity must be between 0 and 10"
+    )
 
 
 def validate_chaos_environment(environment: Dict[str, Any]) -> None:
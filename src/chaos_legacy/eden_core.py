@@ -6,13 +6,192 @@ provides a unified interface to the symbolic-emotional computation system.
 """
 
 import argparse
+import atexit
+import io
 import json
 import os
 import sys
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
-from .chaos_agent import ChaosAgent
+from .chaos_agent import AgentReport, ChaosAgent
+
+try:
+    import orjson  # Optional accelerator: encodes straight to bytes
+except ImportError:
+    orjson = None
+
+
+def _encode_json_line(entry: Dict[str, Any]) -> bytes:
+    """Encode ``entry`` as one compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# Buffered activations are written out once either threshold is crossed
+LOG_FLUSH_ENTRIES = 16
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+# Wall-clock anchor cadence for the monotonic timestamps in log_action
+LOG_ANCHOR_EVERY = 1024
+# POSIX platforms coalesce a batch into a single gather-write syscall
+HAS_WRITEV = hasattr(os, "writev")
+
+
+def _write_log(pending: List[bytes], log_fh: Optional[BinaryIO]) -> None:
+    """Write and forget the buffered log lines in ``pending``."""
+    if not pending:
+        return
+    batch = list(pending)
+    pending.clear()
+    if log_fh is None:
+        return
+    try:
+        if HAS_WRITEV:
+            os.writev(log_fh.fileno(), batch)
+        else:
+            log_fh.write(b"".join(batch))
+    except Exception:
+        pass  # Silent failure for logging
+
+
+def _close_log(pending: List[bytes], log_fh: Optional[BinaryIO]) -> None:
+    """Write out ``pending`` and close ``log_fh``; run once per EdenCore."""
+    _write_log(pending, log_fh)
+    if log_fh is not None:
+        log_fh.close()
+
+
+def read_action_log(path: str) -> List[Dict[str, Any]]:
+    """
+    Read an EdenCore activation log back as timestamped entries.
+    
+    Lines written by ``EdenCore.log_action`` carry monotonic ``t`` values
+    relative to the latest anchor record; they are converted back to the
+    original ``timestamp`` field (local ISO time). Older lines that already
+    carry ``timestamp`` pass through unchanged, so mixed files read as one
+    history. Anchor records, blank and malformed lines are skipped.
+    
+    Args:
+        path: The log file to read
+    
+    Returns:
+        List of ``{"timestamp", "daemon", "action"}`` dictionaries in file order
+    """
+    entries: List[Dict[str, Any]] = []
+    anchor: Optional[Tuple[int, int]] = None  # (wall ns, mono ns)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            if "anchor" in record:
+                anchor = (record["anchor"], record["t"])
+                continue
+            if "t" in record:
+                t = record.pop("t")
+                wall_ns = anchor[0] + t - anchor[1] if anchor is not None else None
+                record = {
+                    "timestamp": (
+                        datetime.fromtimestamp(wall_ns / 1e9).isoformat()
+                        if wall_ns is not None else None
+                    ),
+                    **record,
+                }
+            entries.append(record)
+    return entries
+
+
+# Legacy Windows consoles ignore ANSI escapes; everything else can clear in-process
+ANSI_CLEAR = "\x1b[2J\x1b[H"
+SUPPORTS_ANSI = os.name != "nt" or bool(os.environ.get("WT_SESSION") or os.environ.get("TERM"))
+
+
+def _show_dreams(report: AgentReport) -> None:
+    if report.dreams:
+        print("\n".join(islice(report.dreams, 5)))
+
+
+def _show_emotions(report: AgentReport) -> None:
+    print(report.emotions)
+
+
+def _show_symbols(report: AgentReport) -> None:
+    print(dict(report.symbols))
+
+
+def _show_action(report: AgentReport) -> None:
+    print(report.action)
+
+
+# Argument-free agent commands: each steps the agent once, then renders the report
+AGENT_COMMANDS: Dict[str, Callable[[AgentReport], None]] = {
+    "/dreams": _show_dreams,
+    "/emotions": _show_emotions,
+    "/symbols": _show_symbols,
+    "/action": _show_action,
+}
+AGENT_COMMAND_NAMES = ("/open ", *AGENT_COMMANDS, "/exit")
+
+# Line-editing history shared by every Concord session
+HISTORY_FILE = os.path.expanduser("~/.eden_history")
+HISTORY_LENGTH = 1000
+_readline_ready = False
+
+
+def _complete_command(text: str, state: int) -> Optional[str]:
+    """readline completer for the agent's slash commands."""
+    matches = [name for name in AGENT_COMMAND_NAMES if name.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _enable_line_editing() -> None:
+    """Turn on readline editing, history and command completion, once per process."""
+    global _readline_ready
+    if _readline_ready:
+        return
+    _readline_ready = True
+    
+    try:
+        import readline
+    except ImportError:
+        return  # No readline (e.g. Windows): input() still works, just unedited
+    
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First session, or unreadable history
+    readline.set_history_length(HISTORY_LENGTH)
+    atexit.register(_save_history, readline)
+    
+    readline.set_completer(_complete_command)
+    readline.set_completer_delims(" ")
+    readline.parse_and_bind("tab: complete")
+
+
+def _save_history(readline: Any) -> None:
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # Silent failure, like the activation log
+
+
+class StubDaemon:
+    """Placeholder for daemons not installed in this CHAOS distribution."""
+    
+    def __init__(self, daemon_name: str) -> None:
+        self.name = daemon_name
+    
+    def main(self) -> None:
+        print(f"🌸 The {self.name} daemon is not installed in this CHAOS distribution.")
+        print("   This is a placeholder for future ecosystem expansion.")
+        input("\nPress Enter to return to EdenCore...")
 
 
 class EdenCore:
@@ -31,63 +210,113 @@ class EdenCore:
             log_file: File to log daemon activities
         """
         self.log_file = log_file
+        self._log_buf: List[bytes] = []
+        self._log_last_flush = time.monotonic()
+        self._log_mono_base = time.monotonic_ns()
+        self._log_count = 0
+        try:
+            # Unbuffered: batching happens in _log_buf and lands in one writev
+            self._log_fh: Optional[BinaryIO] = open(self.log_file, "ab", buffering=0)
+        except OSError:
+            self._log_fh = None  # Silent failure for logging
+        # Holds the buffer and handle but not self, so an EdenCore that is
+        # dropped without close() still flushes on collection or at exit
+        self._log_closer = weakref.finalize(self, _close_log, self._log_buf, self._log_fh)
         
-        # Available daemon processes in the CHAOS pantheon
-        self.daemons: Dict[str, Tuple[str, Any]] = {
-            "1": ("CHAOS Agent (Concord)", "CHAOS_AGENT"),
-            "2": ("Eyes of Echo", self._create_stub_daemon("Eyes of Echo")),
-            "3": ("Threadstep", self._create_stub_daemon("Threadstep")),
-            "4": ("Markbearer", self._create_stub_daemon("Markbearer")),
-            "5": ("Scriptum", self._create_stub_daemon("Scriptum")),
-            "6": ("Rook", self._create_stub_daemon("Rook")),
-            "7": ("Glimmer", self._create_stub_daemon("Glimmer")),
-            "8": ("Muse Jr.", self._create_stub_daemon("Muse Jr.")),
-            "9": ("Toto", self._create_stub_daemon("Toto")),
-            "10": ("PulsePause", self._create_stub_daemon("PulsePause")),
-        }
-    
-    def _create_stub_daemon(self, name: str) -> Any:
-        """Create a stub daemon for unavailable components."""
-        class StubDaemon:
-            def __init__(self, daemon_name: str):
-                self.name = daemon_name
-            
-            def main(self) -> None:
-                print(f"🌸 The {self.name} daemon is not installed in this CHAOS distribution.")
-                print("   This is a placeholder for future ecosystem expansion.")
-                input("\nPress Enter to return to EdenCore...")
+        # Available daemon processes in the CHAOS pantheon. Entries hold the
+        # daemon class; instances are built on first activation and cached.
+        self.daemons: List[Tuple[str, Any]] = [
+            ("CHAOS Agent (Concord)", "CHAOS_AGENT"),
+            ("Eyes of Echo", StubDaemon),
+            ("Threadstep", StubDaemon),
+            ("Markbearer", StubDaemon),
+            ("Scriptum", StubDaemon),
+            ("Rook", StubDaemon),
+            ("Glimmer", StubDaemon),
+            ("Muse Jr.", StubDaemon),
+            ("Toto", StubDaemon),
+            ("PulsePause", StubDaemon),
+        ]
+        self._daemon_cache: List[Any] = [None] * len(self.daemons)
         
-        return StubDaemon(name)
+        # The pantheon is fixed after construction, so render the menu once.
+        # Menu numbers are 1-based; the entry after the last daemon exits.
+        exit_number = len(self.daemons) + 1
+        self._menu_text = (
+            "\n🌌 EdenCore: Your CHAOS Pantheon 🌌\n\n"
+            + "".join(f"{number}. {name}\n" for number, (name, _) in enumerate(self.daemons, 1))
+            + f"{exit_number}. Exit EdenCore\n"
+        )
+        self._menu_prompt = f"\nChoose a daemon (1-{exit_number}): "
+    
+    def _get_daemon(self, index: int) -> Any:
+        """Return the daemon instance at ``index``, constructing it on first use."""
+        daemon = self._daemon_cache[index]
+        if daemon is None:
+            name, factory = self.daemons[index]
+            daemon = self._daemon_cache[index] = factory(name)
+        return daemon
     
     def log_action(self, daemon_name: str) -> None:
-        """Log a daemon activation."""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "daemon": daemon_name,
-            "action": "activated"
-        }
+        """
+        Log a daemon activation.
         
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                json.dump(entry, f)
-                f.write("\n")
-        except Exception:
-            pass  # Silent failure for logging
+        Entries carry ``t``, nanoseconds on the monotonic clock since this
+        EdenCore started. Every ``LOG_ANCHOR_EVERY`` entries (starting with
+        the first) an anchor record ``{"anchor": <wall ns>, "t": <mono ns>}``
+        is written first; an entry's wall time is
+        ``anchor["anchor"] + entry["t"] - anchor["t"]`` using the latest anchor.
+        """
+        t = time.monotonic_ns() - self._log_mono_base
+        if self._log_count % LOG_ANCHOR_EVERY == 0:
+            self._log_buf.append(
+                f'{{"anchor":{time.time_ns()},"t":{t}}}\n'.encode("utf-8")
+            )
+        self._log_count += 1
+        
+        entry = {"t": t, "daemon": daemon_name, "action": "activated"}
+        self._log_buf.append(_encode_json_line(entry))
+        if (
+            len(self._log_buf) >= LOG_FLUSH_ENTRIES
+            or time.monotonic() - self._log_last_flush > LOG_FLUSH_INTERVAL
+        ):
+            self._flush_log()
+    
+    def _flush_log(self) -> None:
+        """Write any buffered log entries through the persistent handle."""
+        self._log_last_flush = time.monotonic()
+        _write_log(self._log_buf, self._log_fh)
+    
+    def close(self) -> None:
+        """Flush buffered log entries and close the log file. Safe to call twice."""
+        self._log_closer()
+        self._log_fh = None  # Later activations are dropped, as on open failure
+    
+    def __enter__(self) -> "EdenCore":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        if SUPPORTS_ANSI:
+            sys.stdout.write(ANSI_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system("cls")
     
     def _run_chaos_agent(self) -> None:
         """Run the interactive CHAOS Agent interface."""
         agent = ChaosAgent("Concord")
+        _enable_line_editing()
         self.clear_screen()
         
         print("🌌 CHAOS Agent (Concord)")
         print("Type text; blank line to commit.")
         print("Commands: /open <path>, /dreams, /emotions, /symbols, /action, /exit")
         
-        buffer = []
+        buffer = io.StringIO()  # Pending text, newline-joined as it arrives
         last_report = None
         
         while True:
@@ -112,30 +341,16 @@ class EdenCore:
                         print(f"Error: {e}")
                     continue
                 
-                if line == "/dreams":
-                    last_report = agent.step()
-                    if last_report.dreams:
-                        print("\n".join(last_report.dreams[:5]))
-                    continue
-                
-                if line == "/emotions":
+                show = AGENT_COMMANDS.get(line)
+                if show is not None:
                     last_report = agent.step()
-                    print(last_report.emotions)
-                    continue
-                
-                if line == "/symbols":
-                    last_report = agent.step()
-                    print(last_report.symbols)
-                    continue
-                
-                if line == "/action":
-                    last_report = agent.step()
-                    print(last_report.action)
+                    show(last_report)
                     continue
                 
                 if not line:
-                    text = "\n".join(buffer).strip()
-                    buffer.clear()
+                    text = buffer.getvalue().strip()
+                    buffer.seek(0)
+                    buffer.truncate()
                     
                     if not text and not last_report:
                         continue
@@ -146,10 +361,12 @@ class EdenCore:
                     dream_count = len(last_report.dreams) if last_report.dreams else 0
                     action_name = last_report.action.kind if last_report.action else "idle"
                     
-                    print(f"✓ action: {action_name} | emotions: {emotion_count} | dreams: {dream_count[:2]}")
+                    print(f"✓ action: {action_name} | emotions: {emotion_count} | dreams: {dream_count}")
                     continue
                 
-                buffer.append(line)
+                if buffer.tell():
+                    buffer.write("\n")
+                buffer.write(line)
                 
             except (EOFError, KeyboardInterrupt):
                 print("\nExiting CHAOS Agent.")
@@ -160,30 +377,29 @@ class EdenCore:
         while True:
             self.clear_screen()
             
-            print("\n🌌 EdenCore: Your CHAOS Pantheon 🌌\n")
-            
-            # Display available daemons
-            for key, (name, _) in self.daemons.items():
-                print(f"{key}. {name}")
+            sys.stdout.write(self._menu_text)
             
-            print(f"{len(self.daemons) + 1}. Exit EdenCore")
-            
-            choice = input(f"\nChoose a daemon (1-{len(self.daemons) + 1}): ").strip()
+            choice = input(self._menu_prompt).strip()
+            try:
+                index = int(choice) - 1
+            except ValueError:
+                index = -1
             
-            if choice == str(len(self.daemons) + 1):
+            if index == len(self.daemons):
+                self._flush_log()
                 print("\n🙏 EdenCore rests. You are enough.")
                 break
             
-            if choice in self.daemons:
-                daemon_name, daemon = self.daemons[choice]
+            if 0 <= index < len(self.daemons):
+                daemon_name, factory = self.daemons[index]
                 self.log_action(daemon_name)
                 self.clear_screen()
                 
-                if daemon == "CHAOS_AGENT":
+                if factory == "CHAOS_AGENT":
                     self._run_chaos_agent()
                 else:
                     try:
-                        daemon.main()
+                        self._get_daemon(index).main()
                     except Exception as e:
                         print(f"💥 Daemon '{daemon_name}' encountered an error: {e}")
                         input("\nPress Enter to continue...")
@@ -209,7 +425,8 @@ def main() -> None:
         return
 
     try:
-        EdenCore().main()
+        with EdenCore() as core:
+            core.main()
     except KeyboardInterrupt:
         print("\n\n🙏 EdenCore interrupted. The CHAOS ecosystem rests.")
         sys.exit(0)
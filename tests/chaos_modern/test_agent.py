@@ -0,0 +1,73 @@
+"""Tests for the CHAOS agent's perception of programs."""
+
+import pytest
+from chaos_legacy import chaos_agent
+from chaos_legacy.chaos_agent import SN_CACHE_SIZE, ChaosAgent
+from chaos_legacy.chaos_runtime import feed_sinks
+
+
+@pytest.fixture
+def executions(monkeypatch):
+    """Replace run_chaos with a counting fake; returns the sources it ran."""
+    ran = []
+    
+    def fake_run_chaos(source, verbose=False, *, sinks=None):
+        ran.append(source)
+        environment = {
+            "structured_core": {"SOURCE": source, "KIND": "test"},
+            "emotive_layer": [{"name": "JOY", "intensity": 6}],
+            "chaosfield_layer": f"narrative of {source}",
+        }
+        if sinks is not None:
+            feed_sinks(environment, sinks)
+        return environment
+    
+    monkeypatch.setattr(chaos_agent, "run_chaos", fake_run_chaos)
+    return ran
+
+
+class TestPerceptionCache:
+    """Test that repeated programs are replayed instead of re-executed."""
+    
+    def test_repeat_source_replays(self, executions):
+        """Test that a second perception gives the same memory without a run."""
+        first, second = ChaosAgent("First"), ChaosAgent("Second")
+        
+        first.perceive_sn("program")
+        second.perceive_sn("program")
+        second.perceive_sn("program")
+        
+        assert executions == ["program", "program"]
+        assert dict(second.ctx.symbols_view()) == dict(first.ctx.symbols_view())
+        assert second.ctx.view()["narrative"] == first.ctx.view()["narrative"]
+        assert second.emotions.summary() == first.emotions.summary() * 2
+    
+    def test_oldest_source_evicted(self, executions):
+        """Test that the least recently perceived source is forgotten first."""
+        agent = ChaosAgent("Keeper")
+        sources = [f"program {n}" for n in range(SN_CACHE_SIZE + 1)]
+        for source in sources:
+            agent.perceive_sn(source)
+        
+        assert len(agent._sn_cache) == SN_CACHE_SIZE
+        
+        agent.perceive_sn(sources[1])
+        assert executions.count(sources[1]) == 1
+        
+        agent.perceive_sn(sources[0])
+        assert executions.count(sources[0]) == 2
+    
+    def test_hit_refreshes_recency(self, executions):
+        """Test that a replayed source moves to the back of the eviction line."""
+        agent = ChaosAgent("Keeper")
+        sources = [f"program {n}" for n in range(SN_CACHE_SIZE)]
+        for source in sources:
+            agent.perceive_sn(source)
+        
+        agent.perceive_sn(sources[0])
+        agent.perceive_sn("newcomer")
+        
+        agent.perceive_sn(sources[0])
+        assert executions.count(sources[0]) == 1
+        agent.perceive_sn(sources[1])
+        assert executions.count(sources[1]) == 2
@@ -0,0 +1,56 @@
+"""Tests for the interactive ChaosAgent CLI driven through piped stdin."""
+
+import io
+
+import pytest
+from chaos_legacy import chaos_agent_cli
+from chaos_legacy.chaos_agent import ChaosAgent
+
+
+@pytest.fixture
+def session(monkeypatch, capsys):
+    """Run the CLI over ``stdin_text``; returns (stdout, text passed to each step)."""
+    steps = []
+    original_step = ChaosAgent.step
+    
+    def recording_step(self, *, text=None, sn=None):
+        steps.append(text)
+        return original_step(self, text=text, sn=sn)
+    
+    monkeypatch.setattr(ChaosAgent, "step", recording_step)
+    
+    def run(stdin_text):
+        monkeypatch.setattr("sys.argv", ["chaos-agent", "--name", "Remy", "--seed", "1"])
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin_text))
+        chaos_agent_cli.main()
+        return capsys.readouterr().out, steps
+    
+    return run
+
+
+class TestAgentCliSession:
+    """Test a full communion with the agent over piped input."""
+    
+    def test_blank_line_commits_buffer(self, session):
+        """Test that buffered lines reach the agent as one text on a blank line."""
+        out, steps = session("I feel joy\n  and hope\n\n")
+        
+        assert steps == ["I feel joy\n  and hope"]
+        assert "✓ action:" in out
+        assert out.count("agent> ") == 4
+    
+    def test_eof_ends_session(self, session):
+        """Test that end of input says goodbye instead of raising."""
+        out, steps = session("unfinished thought")
+        
+        assert steps == []
+        assert out.count("agent> ") == 2
+        assert out.rstrip().endswith("🙏 Agent Remy returns to the eternal CHAOS...")
+    
+    def test_quit_ends_session(self, session):
+        """Test that :quit stops reading before any later input."""
+        out, steps = session("hello\n\n:quit\nnever read\n\n")
+        
+        assert steps == ["hello"]
+        assert out.count("agent> ") == 3
+        assert out.rstrip().endswith("🙏 Agent Remy returns to the collective unconscious...")
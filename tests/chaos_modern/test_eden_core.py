@@ -0,0 +1,166 @@
+"""Tests for the EdenCore activation log."""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from datetime import datetime
+from pathlib import Path
+
+from chaos_legacy import eden_core
+from chaos_legacy.eden_core import LOG_FLUSH_ENTRIES, EdenCore, read_action_log
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _lines(path):
+    """Read the JSON lines written to ``path``."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestEdenCoreLifecycle:
+    """Test that EdenCore releases its log file."""
+    
+    def test_close_flushes_and_closes(self, tmp_path):
+        """Test that close() writes pending entries and closes the handle."""
+        log_file = tmp_path / "eden.json"
+        core = EdenCore(log_file=str(log_file))
+        handle = core._log_fh
+        core.log_action("Rook")
+        
+        core.close()
+        
+        assert handle.closed
+        assert [entry["daemon"] for entry in _lines(log_file) if "daemon" in entry] == ["Rook"]
+    
+    def test_close_twice(self, tmp_path):
+        """Test that a second close() and later activations are harmless."""
+        log_file = tmp_path / "eden.json"
+        core = EdenCore(log_file=str(log_file))
+        core.close()
+        core.close()
+        core.log_action("Toto")
+        core._flush_log()
+        
+        assert log_file.read_text(encoding="utf-8") == ""
+    
+    def test_context_manager(self, tmp_path):
+        """Test that leaving the with block closes the log."""
+        log_file = tmp_path / "eden.json"
+        with EdenCore(log_file=str(log_file)) as core:
+            handle = core._log_fh
+            core.log_action("Glimmer")
+        
+        assert handle.closed
+        assert any(entry.get("daemon") == "Glimmer" for entry in _lines(log_file))
+    
+    def test_collected_core_flushes(self, tmp_path):
+        """Test that dropping an unclosed EdenCore still writes its entries."""
+        log_file = tmp_path / "eden.json"
+        core = EdenCore(log_file=str(log_file))
+        handle = core._log_fh
+        core.log_action("Scriptum")
+        
+        del core
+        gc.collect()
+        
+        assert handle.closed
+        assert any(entry.get("daemon") == "Scriptum" for entry in _lines(log_file))
+
+
+class TestLogFlushing:
+    """Test when buffered activations reach the log file."""
+    
+    def test_flush_at_entry_threshold(self, tmp_path, monkeypatch):
+        """Test that the buffer is written once it holds LOG_FLUSH_ENTRIES lines."""
+        monkeypatch.setattr(eden_core, "LOG_FLUSH_INTERVAL", 3600)
+        log_file = tmp_path / "eden.json"
+        with EdenCore(log_file=str(log_file)) as core:
+            # The first activation is preceded by an anchor line
+            for _ in range(LOG_FLUSH_ENTRIES - 2):
+                core.log_action("Rook")
+            assert log_file.read_text(encoding="utf-8") == ""
+            
+            core.log_action("Rook")
+            assert len(_lines(log_file)) == LOG_FLUSH_ENTRIES
+            assert core._log_buf == []
+    
+    def test_flush_at_time_threshold(self, tmp_path, monkeypatch):
+        """Test that a stale buffer is written on the next activation."""
+        clock = [100.0]
+        monkeypatch.setattr(eden_core.time, "monotonic", lambda: clock[0])
+        log_file = tmp_path / "eden.json"
+        with EdenCore(log_file=str(log_file)) as core:
+            core.log_action("Rook")
+            assert log_file.read_text(encoding="utf-8") == ""
+            
+            clock[0] += eden_core.LOG_FLUSH_INTERVAL * 2
+            core.log_action("Toto")
+            assert [entry["daemon"] for entry in read_action_log(str(log_file))] == ["Rook", "Toto"]
+    
+    def test_flush_at_exit(self, tmp_path):
+        """Test that an unclosed EdenCore writes its buffer at interpreter exit."""
+        log_file = tmp_path / "eden.json"
+        script = textwrap.dedent(f"""
+            from chaos_legacy.eden_core import EdenCore
+            core = EdenCore(log_file={str(log_file)!r})
+            core.log_action("Markbearer")
+        """)
+        env = dict(os.environ, PYTHONPATH=str(SRC))
+        subprocess.run([sys.executable, "-c", script], env=env, check=True, timeout=60)
+        
+        assert [entry["daemon"] for entry in read_action_log(str(log_file))] == ["Markbearer"]
+
+
+class TestReadActionLog:
+    """Test reading activation logs back with wall-clock timestamps."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that logged activations read back in order with timestamps."""
+        log_file = tmp_path / "eden.json"
+        before = datetime.now()
+        with EdenCore(log_file=str(log_file)) as core:
+            for name in ("Rook", "Glimmer", "Toto"):
+                core.log_action(name)
+        after = datetime.now()
+        
+        entries = read_action_log(str(log_file))
+        
+        assert [entry["daemon"] for entry in entries] == ["Rook", "Glimmer", "Toto"]
+        for entry in entries:
+            assert entry["action"] == "activated"
+            assert before <= datetime.fromisoformat(entry["timestamp"]) <= after
+    
+    def test_anchors_apply(self, tmp_path):
+        """Test that each entry is timed from the latest anchor."""
+        log_file = tmp_path / "eden.json"
+        log_file.write_text(
+            '{"anchor":1000000000000000000,"t":0}\n'
+            '{"t":2000000000,"daemon":"Rook","action":"activated"}\n'
+            '{"anchor":1700000000000000000,"t":5000000000}\n'
+            '{"t":6000000000,"daemon":"Toto","action":"activated"}\n',
+            encoding="utf-8",
+        )
+        
+        entries = read_action_log(str(log_file))
+        
+        assert [entry["timestamp"] for entry in entries] == [
+            datetime.fromtimestamp(1000000002).isoformat(),
+            datetime.fromtimestamp(1700000001).isoformat(),
+        ]
+    
+    def test_mixed_old_and_new_lines(self, tmp_path):
+        """Test that pre-anchor lines keep their own timestamps."""
+        log_file = tmp_path / "eden.json"
+        old = {"timestamp": "2024-05-01T12:00:00", "daemon": "Scriptum", "action": "activated"}
+        log_file.write_text(json.dumps(old) + "\n\nnot json\n", encoding="utf-8")
+        with EdenCore(log_file=str(log_file)) as core:
+            core.log_action("Rook")
+        
+        entries = read_action_log(str(log_file))
+        
+        assert entries[0] == old
+        assert entries[1]["daemon"] == "Rook"
+        assert list(entries[1]) == ["timestamp", "daemon", "action"]
@@ -0,0 +1,99 @@
+"""Tests for the CHAOS emotion stack and its dominant-emotion index."""
+
+from chaos_legacy.chaos_agent import ChaosAgent
+from chaos_legacy.chaos_emotion import ChaosEmotionStack
+
+
+class TestPeekDominant:
+    """Test that the intensity heap tracks the stack it indexes."""
+    
+    def test_empty_stack(self):
+        """Test that an empty stack has no dominant emotion."""
+        stack = ChaosEmotionStack()
+        
+        assert stack.peek_dominant() is None
+        assert stack.get_dominant_emotion() is None
+    
+    def test_ties_go_to_older_emotion(self):
+        """Test that equal intensities resolve to the first pushed."""
+        stack = ChaosEmotionStack()
+        stack.push("JOY", 6)
+        stack.push("HOPE", 6)
+        stack.push("FEAR", 3)
+        
+        assert stack.peek_dominant() == ("JOY", 6)
+    
+    def test_decay_all(self):
+        """Test that uniform decay keeps the order and drops dead emotions."""
+        stack = ChaosEmotionStack()
+        stack.push("JOY", 2)
+        stack.push("FEAR", 5)
+        
+        stack.decay_all(2)
+        assert stack.peek_dominant() == ("FEAR", 3)
+        
+        stack.decay_all(3)
+        assert stack.peek_dominant() is None
+    
+    def test_single_emotion_decay(self):
+        """Test that an emotion decayed on its own loses its place."""
+        stack = ChaosEmotionStack()
+        stack.push("JOY", 8)
+        stack.push("HOPE", 5)
+        
+        stack.stack[0].decay(4)
+        assert stack.peek_dominant() == ("HOPE", 5)
+    
+    def test_eviction_past_max_emotions(self):
+        """Test that emotions pushed off the stack stop dominating."""
+        stack = ChaosEmotionStack(max_emotions=3)
+        stack.push("RAGE", 10)
+        for name in ("JOY", "HOPE", "FEAR"):
+            stack.push(name, 4)
+        
+        assert [emotion.name for emotion in stack.stack] == ["JOY", "HOPE", "FEAR"]
+        assert stack.peek_dominant() == ("JOY", 4)
+        assert stack.totals()["RAGE"] == 0
+    
+    def test_clear(self):
+        """Test that clearing forgets every emotion, and pushing resumes."""
+        stack = ChaosEmotionStack()
+        stack.push("JOY", 9)
+        stack.decay_all(1)
+        stack.clear()
+        
+        assert stack.peek_dominant() is None
+        
+        stack.push("CALM", 2)
+        assert stack.peek_dominant() == ("CALM", 2)
+    
+    def test_matches_linear_scan(self):
+        """Test the heap against a scan of the active emotions."""
+        stack = ChaosEmotionStack(max_emotions=4)
+        for step, intensity in enumerate([3, 7, 7, 2, 9, 1, 5, 6]):
+            stack.push(f"E{step}", intensity)
+            if step % 3 == 2:
+                stack.decay_all(2)
+            active = stack.get_active_emotions()
+            expected = max(active, key=lambda e: e["intensity"]) if active else None
+            assert stack.get_dominant_emotion() == expected
+
+
+class TestProphecy:
+    """Test that the agent's prophecy reads the dominant emotion."""
+    
+    def test_prophecy_names_dominant_emotion(self):
+        """Test that the prophecy carries the strongest emotion."""
+        agent = ChaosAgent("Oracle", seed=1)
+        agent.ctx.set_symbols({"NAME": "Oracle"})
+        agent.emotions.push("HOPE", 4)
+        agent.emotions.push("AWE", 9)
+        
+        assert "AWE" in agent.prophesy()
+    
+    def test_prophecy_in_silence(self):
+        """Test that an agent with no active emotion prophesies silence."""
+        agent = ChaosAgent("Oracle", seed=1)
+        agent.ctx.set_symbols({"NAME": "Oracle"})
+        
+        assert "SILENCE" in agent.prophesy()
@@ -0,0 +1,124 @@
+"""Tests for the CHAOS symbolic graph and its cached snapshots."""
+
+import random
+
+from chaos_legacy.chaos_graph import ChaosGraph
+
+
+def _recount(graph):
+    """Count relationships from the adjacency sets themselves."""
+    return sum(len(adjacent) for adjacent in graph.edges.values()) // 2
+
+
+def _csr_pairs(graph):
+    """Expand the CSR arrays back into labelled adjacency."""
+    csr = graph.csr()
+    return {
+        label: tuple(csr.labels[other] for other in csr.neighbors(i))
+        for i, label in enumerate(csr.labels)
+    }
+
+
+class TestGraphSnapshots:
+    """Test that freeze() and csr() follow every change to the network."""
+    
+    def test_freeze_sorted(self):
+        """Test that frozen adjacency is sorted and cached."""
+        graph = ChaosGraph()
+        graph.add_edge("LOVE", "HOPE")
+        graph.add_edge("LOVE", "CALM")
+        
+        frozen = graph.freeze()
+        
+        assert frozen == {"LOVE": ("CALM", "HOPE"), "HOPE": ("LOVE",), "CALM": ("LOVE",)}
+        assert graph.freeze() is frozen
+    
+    def test_add_after_freeze(self):
+        """Test that new nodes and edges show up in later snapshots."""
+        graph = ChaosGraph()
+        graph.add_edge("A", "B")
+        graph.freeze()
+        graph.csr()
+        
+        graph.add_node("LONE")
+        assert graph.freeze()["LONE"] == ()
+        assert graph.csr().labels == ["A", "B", "LONE"]
+        
+        graph.add_edge("B", "C")
+        assert graph.freeze()["B"] == ("A", "C")
+        assert _csr_pairs(graph) == graph.freeze()
+    
+    def test_remove_after_csr(self):
+        """Test that removed nodes and edges leave later snapshots."""
+        graph = ChaosGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "C")
+        graph.add_edge("C", "A")
+        graph.csr()
+        
+        assert graph.remove_edge("A", "B")
+        assert graph.freeze()["A"] == ("C",)
+        assert _csr_pairs(graph) == graph.freeze()
+        
+        assert graph.remove_node("C")
+        assert graph.freeze() == {"A": (), "B": ()}
+        assert graph.csr().labels == ["A", "B"]
+        assert list(graph.csr().indices) == []
+    
+    def test_noop_writes_keep_cache(self):
+        """Test that writes that change nothing keep the cached snapshot."""
+        graph = ChaosGraph()
+        graph.add_edge("A", "B")
+        frozen = graph.freeze()
+        
+        graph.add_node("A")
+        graph.add_edge("B", "A")
+        graph.add_edge("A", "A")
+        assert not graph.remove_edge("A", "MISSING")
+        assert not graph.remove_node("MISSING")
+        
+        assert graph.freeze() is frozen
+
+
+class TestEdgeCount:
+    """Test the maintained relationship count."""
+    
+    def test_self_loops_not_counted(self):
+        """Test that self-loops neither count nor create adjacency."""
+        graph = ChaosGraph()
+        graph.add_edge("SELF", "SELF")
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "B")
+        
+        assert graph.get_edge_count() == 1
+        assert not graph.has_edge("B", "B")
+    
+    def test_duplicates_and_removals(self):
+        """Test the count through duplicate adds and node removal."""
+        graph = ChaosGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "A")
+        graph.add_edge("A", "C")
+        assert graph.get_edge_count() == 2
+        
+        graph.remove_node("A")
+        assert graph.get_edge_count() == 0
+        assert repr(graph) == "ChaosGraph(symbols=2, relationships=0)"
+    
+    def test_matches_recount(self):
+        """Test the count against the adjacency after random mutations."""
+        rng = random.Random(7)
+        graph = ChaosGraph()
+        labels = [f"S{n}" for n in range(8)]
+        for _ in range(400):
+            roll = rng.random()
+            a, b = rng.choice(labels), rng.choice(labels)
+            if roll < 0.6:
+                graph.add_edge(a, b)
+            elif roll < 0.9:
+                graph.remove_edge(a, b)
+            else:
+                graph.remove_node(a)
+            assert graph.get_edge_count() == _recount(graph)
+            if roll < 0.05:
+                assert _csr_pairs(graph) == graph.freeze()
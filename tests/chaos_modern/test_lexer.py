@@ -113,3 +113,15 @@ class TestChaosLexer:
         assert TokenType.STRING in token_types
         assert TokenType.LEFT_BRACE in token_types
         assert TokenType.RIGHT_BRACE in token_types
+    
+    def test_value_tokens_slice_the_source(self):
+        """Test that names, numbers and strings are spans over the source."""
+        source = '[EMOTION:JOY:7] "open'
+        lexer = ChaosLexer()
+        tokens = lexer.tokenize(source)
+        
+        joy, number, text = tokens[3], tokens[5], tokens[7]
+        assert source[joy.start:joy.end] == joy.value == "JOY"
+        assert number.value == "7"
+        assert text.type == TokenType.STRING
+        assert text.value == "open"
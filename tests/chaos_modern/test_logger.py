@@ -0,0 +1,96 @@
+"""Tests for the CHAOS chronicle logger."""
+
+import datetime
+
+import pytest
+from chaos_legacy import chaos_logger
+from chaos_legacy.chaos_logger import ChaosLogger
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the logger's clock by hand; returns the mutable nanosecond value."""
+    now = [1_700_000_000_000_000_000]
+    monkeypatch.setattr(chaos_logger.time, "time_ns", lambda: now[0])
+    return now
+
+
+def _body(logger):
+    """The entry lines of ``logger.export()``, without the header."""
+    return logger.export().split("\n\n", 1)[1].split("\n")
+
+
+class TestChronicleReads:
+    """Test that every way of reading the chronicle agrees."""
+    
+    def test_timestamps_match_isoformat(self, clock):
+        """Test entries are stamped like isoformat(), truncated to microseconds."""
+        logger = ChaosLogger()
+        for offset in (0, 250_000, 1_000_000_000, 1_000_000_999):
+            clock[0] = 1_700_000_000_000_000_000 + offset
+            logger.log("tick")
+        
+        expected = [
+            f"[{datetime.datetime.fromtimestamp(ns // 10**9).replace(microsecond=ns % 10**9 // 1000).isoformat()}] tick"
+            for ns in (1_700_000_000_000_000_000, 1_700_000_000_000_250_000,
+                       1_700_000_001_000_000_000, 1_700_000_001_000_000_999)
+        ]
+        assert logger.logs == expected
+    
+    def test_interleaved_reads_agree(self, clock):
+        """Test logs, export, search and get_recent between writes."""
+        logger = ChaosLogger()
+        messages = []
+        for n in range(12):
+            clock[0] += 400_000_001
+            message = f"{'Dream' if n % 3 == 0 else 'step'} {n}"
+            logger.log(message)
+            messages.append(message)
+            
+            logs = logger.logs
+            assert [line.split("] ", 1)[1] for line in logs] == messages
+            assert _body(logger) == logs
+            assert logger.get_recent(4) == logs[-4:]
+            assert logger.search("DREAM") == [line for line in logs if "dream" in line.lower()]
+            assert f"Entries: {n + 1}" in logger.export()
+    
+    def test_search_matches_timestamp(self, clock):
+        """Test that search covers the timestamp, like a scan of the lines."""
+        logger = ChaosLogger()
+        logger.log("hello")
+        day = datetime.datetime.fromtimestamp(clock[0] // 10**9).strftime("%Y-%m-%d")
+        clock[0] += 86_400 * 10**9
+        logger.log("HELLO again")
+        
+        assert logger.search(day) == logger.logs[:1]
+        assert logger.search(day[:4]) == [line for line in logger.logs if day[:4] in line]
+        for keyword in ("t", "hello", "] h", "NOPE"):
+            assert logger.search(keyword) == [
+                line for line in logger.logs if keyword.lower() in line.lower()
+            ]
+    
+    def test_logs_is_a_copy(self):
+        """Test that changing a returned list leaves the chronicle intact."""
+        logger = ChaosLogger()
+        logger.log("first")
+        
+        logger.logs.append("forged")
+        recent = logger.get_recent(5)
+        recent.clear()
+        logger.search("first").append("forged")
+        
+        assert len(logger.logs) == 1
+        assert logger.get_recent(5) == logger.logs
+        assert "forged" not in logger.export()
+    
+    def test_clear_then_log(self):
+        """Test that clearing resets every read path."""
+        logger = ChaosLogger()
+        logger.log("old")
+        logger.search("old")
+        logger.clear()
+        logger.log("new")
+        
+        assert [line.split("] ", 1)[1] for line in logger.logs] == ["new"]
+        assert logger.search("old") == []
+        assert logger.get_recent() == logger.logs
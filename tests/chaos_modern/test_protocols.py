@@ -0,0 +1,37 @@
+"""Tests for the CHAOS protocol interface."""
+
+import inspect
+
+import pytest
+from chaos_language import chaos_protocols as modern
+from chaos_legacy import chaos_protocols as legacy
+
+
+class TestExecuteSignature:
+    """Test that both packages share one Protocol.execute signature."""
+    
+    @pytest.mark.parametrize("module", [legacy, modern])
+    def test_omitted_score_is_matched(self, module):
+        """Test that execute without a score reports what match() scores."""
+        context = {"symbols": {"A:B": 1, "C:D": 2}, "narrative": "We remember the garden."}
+        totals = {"FEAR": 10, "GRIEF": 10, "HOPE": 4, "LOVE": 3, "JOY": 6}
+        for protocol in module.ProtocolRegistry().protocols:
+            expected = protocol.match(context, totals)
+            assert expected > 0
+            assert protocol.execute(context, totals).score == expected
+    
+    @pytest.mark.parametrize("module", [legacy, modern])
+    def test_passed_score_is_kept(self, module):
+        """Test that a precomputed score is used as given."""
+        protocol = module.OathProtocol()
+        
+        assert protocol.execute({}, {"FEAR": 10, "GRIEF": 10}, 3).score == 3
+    
+    def test_signatures_match(self):
+        """Test that legacy and modern execute take the same parameters."""
+        legacy_params = inspect.signature(legacy.Protocol.execute).parameters
+        modern_params = inspect.signature(modern.Protocol.execute).parameters
+        
+        assert [p.default for p in legacy_params.values()] == [
+            p.default for p in modern_params.values()
+        ]
@@ -1,7 +1,9 @@
 """Tests for the CHAOS runtime and execution engine."""
 
 import pytest
-from chaos_legacy.chaos_runtime import run_chaos
+from chaos_legacy.chaos_interpreter import ChaosInterpreter
+from chaos_legacy.chaos_parser import Node, NodeType
+from chaos_legacy.chaos_runtime import feed_sinks, run_chaos
 from chaos_legacy.chaos_errors import ChaosSyntaxError, ChaosRuntimeError
 
 
@@ -153,3 +155,98 @@ class TestChaosRuntime:
         assert "🌌" in result["structured_core"]["MESSAGE"]
         assert "中文" in result["chaosfield_layer"]
         assert "العربية" in result["chaosfield_layer"]
+
+
+class RecordingSink:
+    """A ChaosSink that remembers every call it receives."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def on_symbol(self, key, value):
+        self.calls.append(("symbol", key, value))
+    
+    def on_emotion(self, name, intensity):
+        self.calls.append(("emotion", name, intensity))
+    
+    def on_narrative(self, text):
+        self.calls.append(("narrative", text))
+
+
+def _program(symbols, emotions, narrative):
+    """Build a parsed three-layer program by hand."""
+    return Node(NodeType.PROGRAM, children=[
+        Node(NodeType.STRUCTURED_CORE, value=symbols),
+        Node(NodeType.EMOTIVE_LAYER, value=emotions),
+        Node(NodeType.CHAOSFIELD_LAYER, value=narrative),
+    ])
+
+
+class TestChaosSink:
+    """Test the ChaosSink contract of run_chaos and feed_sinks."""
+    
+    def test_layers_stream_in_ritual_order(self):
+        """Test that every layer value reaches the sink, in order."""
+        sink = RecordingSink()
+        ast = _program(
+            {"EVENT": "memory", "CONTEXT": "garden"},
+            [{"name": "JOY", "intensity": 7}, {"name": "HOPE", "intensity": 5}],
+            "The garden was alive.",
+        )
+        
+        run_chaos(ast=ast, sinks=sink)
+        
+        assert sink.calls == [
+            ("symbol", "EVENT", "memory"),
+            ("symbol", "CONTEXT", "garden"),
+            ("emotion", "JOY", 7),
+            ("emotion", "HOPE", 5),
+            ("narrative", "The garden was alive."),
+        ]
+    
+    def test_empty_narrative_is_not_sent(self):
+        """Test that on_narrative is skipped for an empty chaosfield."""
+        sink = RecordingSink()
+        
+        run_chaos(ast=_program({"NAME": "Concord"}, [], ""), sinks=sink)
+        
+        assert sink.calls == [("symbol", "NAME", "Concord")]
+    
+    def test_emotion_names_fall_back(self):
+        """Test that unnamed emotion entries still reach the sink."""
+        sink = RecordingSink()
+        
+        run_chaos(ast=_program({}, [{"type": "AWE", "intensity": 4}, {}], ""), sinks=sink)
+        
+        assert sink.calls == [("emotion", "AWE", 4), ("emotion", "FEELING", None)]
+    
+    def test_sinks_fed_during_interpretation(self):
+        """Test that sinks hear a layer before later layers are interpreted."""
+        interpreter = ChaosInterpreter()
+        seen = []
+        
+        class PeekingSink(RecordingSink):
+            def on_symbol(self, key, value):
+                seen.append(dict(interpreter.environment))
+        
+        interpreter.interpret(_program({"NAME": "Concord"}, [], "later"), PeekingSink())
+        
+        assert seen == [{"structured_core": {"NAME": "Concord"}}]
+    
+    def test_feed_sinks_replays_run(self):
+        """Test that replaying an environment matches the live calls."""
+        live, replay = RecordingSink(), RecordingSink()
+        ast = _program({"A": 1}, [{"name": "CALM", "intensity": 3}], "quiet")
+        
+        environment = run_chaos(ast=ast, sinks=live)
+        feed_sinks(environment, replay)
+        
+        assert replay.calls == live.calls
+    
+    def test_pooled_interpreter_forgets_sink(self):
+        """Test that a later run without sinks does not reach an old sink."""
+        sink = RecordingSink()
+        run_chaos(ast=_program({"A": 1}, [], ""), sinks=sink)
+        run_chaos(ast=_program({"B": 2}, [], "more"))
+        
+        assert sink.calls == [("symbol", "A", 1)]
@@ -0,0 +1,30 @@
+"""Tests for CHAOS environment validation."""
+
+import pytest
+from chaos_legacy.chaos_errors import ChaosValidationError
+from chaos_legacy.chaos_validator import validate_symbols
+
+
+class TestValidateSymbols:
+    """Test the naming conventions for symbolic names."""
+    
+    @pytest.mark.parametrize("name", ["NAME", "event_1", "SYMBOL:GROWTH", "self-care", "Ñandú", "名前"])
+    def test_valid_names(self, name):
+        """Test that letter-led names of word characters pass."""
+        validate_symbols({name: "value"})
+    
+    @pytest.mark.parametrize("name", ["", "1ST", "_hidden", "-dash", "²x", "½", "৴TAKA"])
+    def test_must_start_with_letter(self, name):
+        """Test that names led by anything but a letter are rejected."""
+        with pytest.raises(ChaosValidationError, match="must start with a letter"):
+            validate_symbols({name: "value"})
+    
+    @pytest.mark.parametrize("name", ["HAS SPACE", "DOT.TED", "BANG!"])
+    def test_invalid_characters(self, name):
+        """Test that names with other characters are rejected."""
+        with pytest.raises(ChaosValidationError, match="contains invalid characters"):
+            validate_symbols({name: "value"})
+    
+    def test_numeric_after_first_letter(self):
+        """Test that non-ASCII numerics are allowed after the first letter."""
+        validate_symbols({"x²": 1, "HALF½": 2})
@@ -0,0 +1,68 @@
+import io
+
+import pytest
+
+from chaos_language.cli import chaos_agent_cli, chaos_cli, prompt
+
+BUFFER = """
+[EVENT]: memory
+[EMOTION:JOY:7]
+{ Warm day. }
+"""
+
+
+def test_repl_buffer_rerun_is_not_affected_by_mutating_environment(capsys):
+    first = chaos_cli.run_chaos(BUFFER)
+    first["structured_core"].clear()
+    first["emotive_layer"].clear()
+
+    second = chaos_cli.run_chaos(BUFFER)
+
+    assert second["structured_core"] == {"EVENT": "memory"}
+    assert second["emotive_layer"] == [{"name": "JOY", "intensity": 7}]
+
+
+def test_parse_args_flags_and_path():
+    args = chaos_cli._parse_args(["--json", "ritual.sn", "--tokens"])
+    assert (args.path, args.tokens, args.ast, args.json) == ("ritual.sn", True, False, True)
+
+
+def test_parse_args_accepts_abbreviations_and_separator():
+    args = chaos_cli._parse_args(["--tok", "--", "ritual.sn"])
+    assert args.tokens is True
+    assert args.path == "ritual.sn"
+
+
+@pytest.mark.parametrize("argv", [["a.sn", "b.sn"], ["--bogus"]])
+def test_parse_args_rejects_extra_path_and_unknown_flag(argv, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        chaos_cli._parse_args(argv)
+    assert excinfo.value.code == 2
+    assert "unrecognized arguments" in capsys.readouterr().err
+
+
+def test_parse_args_help_lists_every_flag(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        chaos_cli._parse_args(["--help"])
+    assert excinfo.value.code == 0
+    out = capsys.readouterr().out
+    assert all(flag in out for flag in chaos_cli.FLAGS)
+
+
+@pytest.mark.parametrize(
+    ("argv", "name"),
+    [([], "Concord"), (["--name", "Ada"], "Ada"), (["--name=Ada"], "Ada"), (["--na", "Ada"], "Ada")],
+)
+def test_agent_cli_parse_name(argv, name):
+    assert chaos_agent_cli._parse_name(argv) == name
+
+
+def test_line_reader_piped_stdin_writes_prompt_until_eof(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("first\nlast"))
+    read_line = prompt.line_reader()
+
+    assert read_line("a> ") == "first"
+    assert read_line("b> ") == "last"
+    with pytest.raises(EOFError):
+        read_line("c> ")
+    assert capsys.readouterr().out == "a> b> c> "
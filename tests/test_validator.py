@@ -1,6 +1,6 @@
 import pytest
 
-from chaos_language import ChaosValidationError, validate_chaos
+from chaos_language import ChaosValidationError, run_ast, validate_chaos
 
 
 def test_validate_chaos_accepts_valid_script():
@@ -50,3 +50,16 @@ def test_validate_chaos_requires_narrative_text():
         validate_chaos(source)
 
     assert "narrative" in str(excinfo.value).lower()
+
+
+def test_validate_chaos_returns_ast_for_run_ast():
+    source = """
+    [EVENT]: memory
+    [EMOTION:JOY:7]
+    { The garden was alive with color. }
+    """
+
+    env = run_ast(validate_chaos(source))
+
+    assert env["structured_core"] == {"EVENT": "memory"}
+    assert env["chaosfield_layer"]
@@ -1,5 +1,5 @@
 """Legacy entrypoint shim for the CHAOS agent CLI."""
-from tools.cli_shims.chaos_agent_cli import main
+from chaos_language.cli.chaos_agent_cli import main
 
 
 if __name__ == "__main__":